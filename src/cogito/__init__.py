@@ -11,10 +11,10 @@ Five-layer clean architecture:
 - Layer 5: Integration (MCP server, external integrations)
 """
 
-__version__ = "0.1.0"
+import importlib
+from typing import Any
 
-# Export Layer 5 Integration API for convenience
-from cogito.integration import create_server, mcp
+__version__ = "0.1.0"
 
 __all__ = [
     "create_server",
@@ -24,3 +24,44 @@ __all__ = [
     "processing",
     "storage",
 ]
+
+# Layer 5 Integration API and the layer subpackages are exported lazily
+# (PEP 562) so that importing cogito, e.g. for __version__ in the CLI,
+# does not pull in fastmcp, Jinja2 and the storage layer.
+_INTEGRATION_EXPORTS = frozenset({"create_server", "mcp"})
+_SUBPACKAGES = frozenset({"integration", "orchestration", "processing", "storage"})
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily exported attributes on first access.
+
+    Imports the Integration API (create_server, mcp) or a layer subpackage
+    and caches it in the module globals, so later lookups skip this hook.
+
+    Args:
+        name: Attribute name being looked up
+
+    Returns:
+        The exported function, server instance or subpackage module
+
+    Raises:
+        AttributeError: If name is not a lazily exported attribute
+    """
+    if name in _INTEGRATION_EXPORTS:
+        integration = importlib.import_module("cogito.integration")
+        value = getattr(integration, name)
+    elif name in _SUBPACKAGES:
+        value = importlib.import_module(f"cogito.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazy exports not yet imported.
+
+    Returns:
+        Sorted names of the module globals and everything in __all__
+    """
+    return sorted(set(globals()) | set(__all__))
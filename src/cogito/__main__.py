@@ -1,16 +1,35 @@
 """Entry point for running cogito MCP server."""
 
+import argparse
 from pathlib import Path
 
-from cogito.integration.mcp_server import create_server, mcp
+from cogito.contracts.layer_protocols import TRANSPORTS
+from cogito.integration.mcp_server import create_server, run_server
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     """Start the cogito MCP server.
 
-    Initializes the server with default paths and runs via FastMCP's
-    built-in stdio transport.
+    Initializes the server with default paths and runs it via FastMCP,
+    using stdio unless another transport is requested.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
     """
+    parser = argparse.ArgumentParser(
+        prog="python -m cogito",
+        description="Start the cogito MCP server.",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default="stdio",
+        help="MCP transport; http keeps one long-lived server for many clients",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address for http/sse")
+    parser.add_argument("--port", type=int, default=8000, help="Port for http/sse")
+    args = parser.parse_args(argv)
+
     # Default paths - look for examples directory
     examples_dir = Path(__file__).parent.parent.parent / "examples"
 
@@ -20,8 +39,7 @@ def main() -> None:
         memory_path=None,  # Memory can be added later
     )
 
-    # Run server using FastMCP's built-in run method
-    mcp.run()
+    run_server(args.transport, host=args.host, port=args.port)
 
 
 if __name__ == "__main__":
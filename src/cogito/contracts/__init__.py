@@ -5,6 +5,7 @@ the five-layer architecture and enable compile-time type checking.
 """
 
 from cogito.contracts.layer_protocols import (
+    TRANSPORTS,
     IntegrationProtocol,
     KnowledgeGraphProtocol,
     OrchestrationProtocol,
@@ -12,6 +13,7 @@ from cogito.contracts.layer_protocols import (
     SchemaValidationProtocol,
     StorageProtocol,
     ToolRegistryProtocol,
+    Transport,
     UIProtocol,
     ValidationProtocol,
 )
@@ -26,4 +28,6 @@ __all__ = [
     "StorageProtocol",
     "KnowledgeGraphProtocol",
     "IntegrationProtocol",
+    "Transport",
+    "TRANSPORTS",
 ]
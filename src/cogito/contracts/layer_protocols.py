@@ -14,7 +14,7 @@ Dependencies flow downward only: UI → Orchestration → Processing → Storage
 """
 
 from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Literal, Protocol, get_args, runtime_checkable
 
 
 # Layer 2: Orchestration Protocols
@@ -204,6 +204,14 @@ class StorageProtocol(Protocol):
         """
         ...
 
+    def append_entries(self, entries: list[dict[str, Any]]) -> None:
+        """Append several entries to process memory in one write.
+
+        Args:
+            entries: Process memory entries to append
+        """
+        ...
+
     def get_entry(self, entry_id: str) -> dict[str, Any] | None:
         """Get a specific process memory entry by ID.
 
@@ -281,6 +289,13 @@ class KnowledgeGraphProtocol(Protocol):
 
 
 # Layer 5: Integration Protocol
+
+# MCP transports the server can run on; shared by the CLI and the server so
+# the accepted choices cannot drift from what run_server() supports
+Transport = Literal["stdio", "http", "sse"]
+TRANSPORTS: tuple[Transport, ...] = get_args(Transport)
+
+
 @runtime_checkable
 class IntegrationProtocol(Protocol):
     """Protocol for MCP server and external integrations.
@@ -9,17 +9,35 @@ Implements three MCP primitives:
 3. Prompts - Provide contextual guidance
 """
 
+import atexit
+import functools
 import json
+import os
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Any
 
 from fastmcp import FastMCP
+from jinja2 import FileSystemBytecodeCache
 
+from cogito.contracts.layer_protocols import TRANSPORTS, Transport
 from cogito.orchestration.executor import ToolExecutor
 from cogito.orchestration.registry import ToolRegistry
+from cogito.processing.renderer import TemplateRenderer
 from cogito.storage.knowledge_graph import KnowledgeGraph
 from cogito.storage.process_memory import ProcessMemoryStore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - exercised only without watchdog
+    Observer = None
+
 # Initialize FastMCP server
 mcp = FastMCP("cogito-thinking-tools")
 
@@ -27,9 +45,23 @@ mcp = FastMCP("cogito-thinking-tools")
 _registry: ToolRegistry | None = None
 _executor: ToolExecutor | None = None
 _memory_store: ProcessMemoryStore | None = None
-_knowledge_graph: KnowledgeGraph | None = None
+_knowledge_graph: KnowledgeGraph | None = None  # built lazily from _memory_store
+_knowledge_graph_lock = threading.Lock()
 _tools_directory: Path | None = None
 
+# Process-wide template renderer, kept across create_server() calls so the
+# sandboxed Jinja2 environment and its caches survive re-initialization
+_renderer: TemplateRenderer | None = None
+
+# Discovery cache: (category dirs, their mtimes incl. root, rendered JSON)
+_discover_cache: tuple[tuple[Path, ...], tuple[int, ...], str] | None = None
+
+# Filesystem watcher for the tools directory. While it runs, filesystem events
+# invalidate the discovery cache and cache hits skip the mtime checks.
+_tools_observer: Any = None
+_discover_lock = threading.Lock()
+_discover_generation = 0
+
 
 # ============================================================================
 # Token Tracking System
@@ -41,11 +73,31 @@ class SimpleTokenTracker:
 
     Tracks estimated token usage for tool executions and provides
     summary statistics for optimization analysis.
+
+    Operations are stored column-wise (one bounded deque per field) rather
+    than as one dict per operation. Only the most recent ``max_operations``
+    are kept for the breakdown, so memory stays bounded over long sessions,
+    while running counters keep session-wide totals without re-summing.
     """
 
-    def __init__(self) -> None:
-        """Initialize token tracker."""
-        self.operations: list[dict[str, Any]] = []
+    def __init__(self, max_operations: int = 10_000) -> None:
+        """Initialize token tracker.
+
+        Args:
+            max_operations: Number of most recent operations kept in the breakdown
+        """
+        self._max_operations = max_operations
+        self.reset()
+
+    @property
+    def operations(self) -> list[dict[str, Any]]:
+        """Most recent tracked operations as a list of per-operation dicts."""
+        return [
+            {"op": op, "tool": tool, "in": in_est, "out": out_est, "total": in_est + out_est}
+            for op, tool, in_est, out_est in zip(
+                self._ops, self._tools, self._inputs, self._outputs, strict=True
+            )
+        ]
 
     def track(
         self,
@@ -62,15 +114,12 @@ class SimpleTokenTracker:
             output_est: Estimated output tokens
             tool_name: Optional tool name for tool-specific tracking
         """
-        self.operations.append(
-            {
-                "op": operation,
-                "tool": tool_name,
-                "in": input_est,
-                "out": output_est,
-                "total": input_est + output_est,
-            }
-        )
+        self._ops.append(operation)
+        self._tools.append(tool_name)
+        self._inputs.append(input_est)
+        self._outputs.append(output_est)
+        self._total_ops += 1
+        self._total_tokens += input_est + output_est
 
     def summary(self) -> dict[str, Any]:
         """Get token usage summary statistics.
@@ -79,19 +128,65 @@ class SimpleTokenTracker:
             Dictionary with total operations, total tokens, and breakdown
         """
         return {
-            "total_ops": len(self.operations),
-            "total_tokens": sum(op["total"] for op in self.operations),
+            "total_ops": self._total_ops,
+            "total_tokens": self._total_tokens,
             "breakdown": self.operations,
         }
 
     def reset(self) -> None:
         """Reset token tracking statistics."""
-        self.operations = []
+        self._ops: deque[str] = deque(maxlen=self._max_operations)
+        self._tools: deque[str | None] = deque(maxlen=self._max_operations)
+        self._inputs: deque[int] = deque(maxlen=self._max_operations)
+        self._outputs: deque[int] = deque(maxlen=self._max_operations)
+        self._total_ops = 0
+        self._total_tokens = 0
 
 
 _token_tracker = SimpleTokenTracker()
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize an MCP response payload as indented JSON.
+
+    Uses orjson when it is installed and falls back to the standard
+    library otherwise; both produce two-space indented output.
+
+    The result is decoded to str on purpose: FastMCP has no hook for a
+    custom wire serializer, and tools or resources returning bytes are sent
+    as base64 binary content rather than text. The outgoing JSON-RPC
+    envelope is encoded by the MCP SDK transport itself.
+
+    Args:
+        obj: JSON-compatible object to serialize
+
+    Returns:
+        Indented JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _estimate_tokens(parameters: dict[str, Any]) -> int:
+    """Estimate input tokens for a parameter dict (rough: chars / 4).
+
+    Sums key and value lengths directly instead of formatting the whole
+    dict with ``str()``, which allocates a throwaway repr on every call.
+    String values (the common case) are measured without conversion.
+
+    Args:
+        parameters: Tool parameters as received from the client
+
+    Returns:
+        Estimated token count
+    """
+    chars = 0
+    for key, value in parameters.items():
+        chars += len(key) + (len(value) if isinstance(value, str) else len(str(value)))
+    return chars // 4
+
+
 def _get_registry() -> ToolRegistry:
     """Get ToolRegistry instance (raises if not initialized)."""
     if _registry is None:
@@ -106,6 +201,19 @@ def _get_executor() -> ToolExecutor:
     return _executor
 
 
+def _get_renderer() -> TemplateRenderer:
+    """Get the process-wide TemplateRenderer, creating it on first use."""
+    global _renderer
+    if _renderer is None:
+        # Persist compiled template code across server processes. Clients
+        # usually spawn a fresh stdio server per session, so this skips
+        # re-compiling every tool template on each spawn. The default cache
+        # directory is private to the current user (0700) and ownership is
+        # verified before use.
+        _renderer = TemplateRenderer(bytecode_cache=FileSystemBytecodeCache())
+    return _renderer
+
+
 def _get_memory_store() -> ProcessMemoryStore:
     """Get ProcessMemoryStore instance (raises if not initialized)."""
     if _memory_store is None:
@@ -114,10 +222,24 @@ def _get_memory_store() -> ProcessMemoryStore:
 
 
 def _get_knowledge_graph() -> KnowledgeGraph:
-    """Get KnowledgeGraph instance (raises if not initialized)."""
-    if _knowledge_graph is None:
-        raise RuntimeError("Knowledge graph not available. Initialize with memory_path.")
-    return _knowledge_graph
+    """Get KnowledgeGraph instance, building it on first use.
+
+    Raises RuntimeError if process memory was not initialized.
+    """
+    global _knowledge_graph
+
+    graph = _knowledge_graph
+    if graph is not None:
+        return graph
+
+    with _knowledge_graph_lock:
+        if _knowledge_graph is None:
+            if _memory_store is None:
+                raise RuntimeError("Knowledge graph not available. Initialize with memory_path.")
+            graph = KnowledgeGraph(_memory_store)
+            graph.build_graph()
+            _knowledge_graph = graph
+        return _knowledge_graph
 
 
 # ============================================================================
@@ -139,8 +261,7 @@ def execute_thinking_tool(tool_name: str, parameters: dict[str, Any]) -> str:
     registry = _get_registry()
     executor = _get_executor()
 
-    # Estimate input tokens (rough: chars / 4)
-    input_est = len(str(parameters)) // 4
+    input_est = _estimate_tokens(parameters)
 
     try:
         result = executor.execute_by_name(tool_name, registry, parameters)
@@ -167,34 +288,7 @@ def list_thinking_tools(category: str | None = None) -> list[dict[str, Any]]:
     Returns:
         List of tool metadata dictionaries
     """
-    registry = _get_registry()
-
-    try:
-        tool_names = registry.list_tools()
-        tools = []
-
-        for tool_name in tool_names:
-            tool_spec = registry.get_tool(tool_name)
-            if tool_spec is not None:
-                metadata = tool_spec.get("metadata", {})
-
-                # Filter by category if specified
-                if category and metadata.get("category") != category:
-                    continue
-
-                tools.append(
-                    {
-                        "name": metadata.get("name", "unknown"),
-                        "display_name": metadata.get("display_name", ""),
-                        "description": metadata.get("description", ""),
-                        "category": metadata.get("category", ""),
-                        "tags": metadata.get("tags", []),
-                    }
-                )
-
-        return tools
-    except Exception as e:
-        return [{"error": f"Failed to list tools: {e}"}]
+    return _get_registry().list_tool_metadata(category)
 
 
 @mcp.tool()
@@ -222,17 +316,17 @@ def query_process_memory(
         if entry_id:
             entry = memory_store.get_entry(entry_id)
             if entry:
-                return json.dumps(entry, indent=2)
+                return _dumps(entry)
             return json.dumps({"error": f"Entry {entry_id} not found"})
 
         # Search by keyword
         if keyword:
             results = memory_store.search_entries(keyword)
-            return json.dumps(results, indent=2)
+            return _dumps(results)
 
         # List by category/tags
         entries = memory_store.list_entries(category=category, tags=tags or [])
-        return json.dumps(entries, indent=2)
+        return _dumps(entries)
 
     except Exception as e:
         return json.dumps({"error": f"Error querying memory: {e}"})
@@ -260,16 +354,16 @@ def query_knowledge_graph(
         # Get related entries
         if entry_id:
             related = knowledge_graph.get_related(entry_id, depth=depth)
-            return json.dumps(related, indent=2)
+            return _dumps(related)
 
         # Find by concept
         if concept:
             results = knowledge_graph.find_by_concept(concept)
-            return json.dumps(results, indent=2)
+            return _dumps(results)
 
         # Get graph stats
         stats = knowledge_graph.get_graph_stats()
-        return json.dumps(stats, indent=2)
+        return _dumps(stats)
 
     except Exception as e:
         return json.dumps({"error": f"Error querying graph: {e}"})
@@ -306,28 +400,156 @@ def discover_tool_categories() -> str:
     Returns:
         JSON mapping of category names to tool lists
     """
+    global _discover_cache
+
     if _tools_directory is None:
         return json.dumps({"error": "Tools directory not initialized"})
 
     try:
+        # Fast path: nothing was added or removed since the last scan. Adding
+        # or removing a file bumps the mtime of its parent directory, so
+        # comparing the root and category directory mtimes is sufficient.
+        cache = _discover_cache
+        if cache is not None and _tools_observer is not None:
+            return cache[2]
+        if cache is not None:
+            cached_dirs, cached_mtimes, cached_json = cache
+            try:
+                current_mtimes = _directory_mtimes(_tools_directory, cached_dirs)
+            except FileNotFoundError:
+                current_mtimes = ()
+            if current_mtimes == cached_mtimes:
+                return cached_json
+
+        generation = _discover_generation
+        root_mtime = _tools_directory.stat().st_mtime_ns
+        category_dirs: list[Path] = []
+        dir_mtimes: list[int] = [root_mtime]
         categories: dict[str, list[str]] = {}
 
         # Scan tool directory for category subdirectories
-        for category_dir in _tools_directory.iterdir():
-            if category_dir.is_dir() and not category_dir.name.startswith("."):
-                # Get all YAML files in this category
-                tools = sorted(
-                    [f.stem for f in category_dir.glob("*.yml")]
-                    + [f.stem for f in category_dir.glob("*.yaml")]
-                )
+        with os.scandir(_tools_directory) as root_entries:
+            for category_entry in root_entries:
+                if category_entry.name.startswith(".") or not category_entry.is_dir():
+                    continue
+                category_dirs.append(Path(category_entry.path))
+                dir_mtimes.append(category_entry.stat().st_mtime_ns)
+
+                # Get all YAML files in this category in a single pass
+                tools = sorted(_scan_tool_stems(category_entry.path))
                 if tools:
-                    categories[category_dir.name] = tools
+                    categories[category_entry.name] = tools
 
-        return json.dumps(categories, indent=2)
+        result = _dumps(categories)
+        with _discover_lock:
+            # Don't store a scan that raced with a filesystem event
+            if generation == _discover_generation:
+                _discover_cache = (tuple(category_dirs), tuple(dir_mtimes), result)
+        return result
     except Exception as e:
         return json.dumps({"error": f"Error discovering categories: {e}"})
 
 
+def _scan_tool_stems(category_dir: str) -> list[str]:
+    """List tool names (file stems) of .yml/.yaml files in a category directory.
+
+    Args:
+        category_dir: Category directory path
+
+    Returns:
+        Unsorted list of tool names
+    """
+    stems: list[str] = []
+    with os.scandir(category_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".yml"):
+                stem = name[:-4]
+            elif name.endswith(".yaml"):
+                stem = name[:-5]
+            else:
+                continue
+            if entry.is_file():
+                stems.append(stem)
+    return stems
+
+
+def _directory_mtimes(root: Path, category_dirs: tuple[Path, ...]) -> tuple[int, ...]:
+    """Collect modification times for the tools root and its category directories.
+
+    Args:
+        root: Tools directory
+        category_dirs: Category subdirectories found by the last scan
+
+    Returns:
+        Tuple of st_mtime_ns values, root first
+    """
+    return (root.stat().st_mtime_ns, *(d.stat().st_mtime_ns for d in category_dirs))
+
+
+class _DiscoverCacheInvalidator:
+    """Watchdog event handler that drops the discovery cache on changes."""
+
+    _IGNORED_EVENTS = frozenset({"opened", "closed", "closed_no_write"})
+
+    def dispatch(self, event: Any) -> None:
+        """Invalidate the discovery cache for any modifying filesystem event.
+
+        Args:
+            event: Watchdog filesystem event
+        """
+        if event.event_type not in self._IGNORED_EVENTS:
+            _invalidate_discover_cache()
+
+
+def _invalidate_discover_cache() -> None:
+    """Drop the cached discovery result so the next request re-scans."""
+    global _discover_cache, _discover_generation
+
+    with _discover_lock:
+        _discover_generation += 1
+        _discover_cache = None
+
+
+def _start_tools_watcher(tools_directory: Path) -> None:
+    """Watch the tools directory and invalidate discovery on changes.
+
+    Replaces any watcher from a previous create_server() call. Without
+    watchdog, or if the observer cannot start, discovery falls back to
+    comparing directory mtimes on each request.
+
+    Args:
+        tools_directory: Directory containing tool category folders
+    """
+    global _tools_observer
+
+    _stop_tools_watcher()
+    if Observer is None or not tools_directory.is_dir():
+        return
+
+    observer = Observer()
+    observer.daemon = True
+    try:
+        observer.schedule(_DiscoverCacheInvalidator(), str(tools_directory), recursive=True)
+        observer.start()
+    except Exception:
+        return
+    _tools_observer = observer
+
+
+def _stop_tools_watcher() -> None:
+    """Stop the tools directory watcher if one is running."""
+    global _tools_observer
+
+    observer, _tools_observer = _tools_observer, None
+    if observer is not None:
+        observer.stop()
+        observer.join(timeout=1.0)
+
+
+atexit.register(_stop_tools_watcher)
+
+
 @mcp.resource("thinking-tools://tool-spec/{category}/{tool_name}")
 def get_tool_yaml_spec(category: str, tool_name: str) -> str:
     """Get tool YAML specification on-demand.
@@ -348,20 +570,41 @@ def get_tool_yaml_spec(category: str, tool_name: str) -> str:
         return "Error: Tools directory not initialized"
 
     try:
-        # Try .yml first, then .yaml
-        tool_path = _tools_directory / category / f"{tool_name}.yml"
-        if not tool_path.exists():
-            tool_path = _tools_directory / category / f"{tool_name}.yaml"
-
-        if not tool_path.exists():
-            return f"Error: Tool '{category}/{tool_name}' not found"
-
-        with tool_path.open() as f:
-            return f.read()
+        # Try .yml first, then .yaml; one stat per candidate also yields the
+        # cache key, so a warm hit costs a single syscall
+        for extension in (".yml", ".yaml"):
+            tool_path = _tools_directory / category / f"{tool_name}{extension}"
+            try:
+                stat = tool_path.stat()
+            except FileNotFoundError:
+                continue
+            return _read_tool_spec_text(str(tool_path), stat.st_mtime_ns, stat.st_size)
+
+        return f"Error: Tool '{category}/{tool_name}' not found"
     except Exception as e:
         return f"Error reading tool spec: {e}"
 
 
+@functools.lru_cache(maxsize=256)
+def _read_tool_spec_text(tool_path: str, mtime_ns: int, size: int) -> str:
+    """Read tool spec text, memoized on file identity.
+
+    The modification time and size are part of the cache key so an edited
+    file is re-read on the next request, while unchanged files are served
+    from memory.
+
+    Args:
+        tool_path: Path to the tool YAML file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        File contents as string
+    """
+    with open(tool_path) as f:
+        return f.read()
+
+
 @mcp.resource("thinking-tools://category/{category_name}")
 def get_tools_by_category(category_name: str) -> str:
     """Get all thinking tools in a specific category.
@@ -371,19 +614,16 @@ def get_tools_by_category(category_name: str) -> str:
     registry = _get_registry()
 
     try:
-        tool_names = registry.list_tools()
-        tools_in_category = []
-
-        for tool_name in tool_names:
-            tool_spec = registry.get_tool(tool_name)
-            if tool_spec is not None:
-                metadata = tool_spec.get("metadata", {})
-                if metadata.get("category") == category_name:
-                    tools_in_category.append(
-                        f"# {metadata.get('display_name', tool_name)}\n"
-                        f"{metadata.get('description', '')}\n"
-                        f"Tags: {', '.join(metadata.get('tags', []))}\n"
-                    )
+        tools_in_category: list[str] = []
+
+        for tool_name in registry.get_tools_by_category(category_name):
+            metadata = registry.get_tool_metadata(tool_name)
+            if metadata is not None:
+                tools_in_category.append(
+                    f"# {metadata.get('display_name', tool_name)}\n"
+                    f"{metadata.get('description', '')}\n"
+                    f"Tags: {', '.join(metadata.get('tags', []))}\n"
+                )
 
         if not tools_in_category:
             return f"No tools found in category '{category_name}'"
@@ -406,7 +646,7 @@ def get_tool_details(tool_name: str) -> str:
         if tool_spec is None:
             return json.dumps({"error": f"Tool '{tool_name}' not found"})
 
-        return json.dumps(tool_spec, indent=2)
+        return _dumps(tool_spec)
     except Exception as e:
         return json.dumps({"error": f"Error retrieving tool: {e}"})
 
@@ -422,7 +662,7 @@ def get_process_memory_entry(entry_id: str) -> str:
     try:
         entry = memory_store.get_entry(entry_id)
         if entry:
-            return json.dumps(entry, indent=2)
+            return _dumps(entry)
         return json.dumps({"error": f"Entry {entry_id} not found"})
     except Exception as e:
         return json.dumps({"error": f"Error retrieving entry: {e}"})
@@ -450,14 +690,14 @@ def get_process_memory_context(concept: str) -> str:
         if not entries:
             return f"# Process Memory: {concept}\n\nNo entries found."
 
-        context = f"# Process Memory: {concept}\n\n"
+        parts = [f"# Process Memory: {concept}\n\n"]
         for entry in entries:
-            context += f"## {entry['id']}: {entry['title']}\n"
-            context += f"{entry['summary']}\n\n"
+            parts.append(f"## {entry['id']}: {entry['title']}\n")
+            parts.append(f"{entry['summary']}\n\n")
             if "rationale" in entry and entry["rationale"]:
-                context += f"**Rationale:** {entry['rationale']}\n\n"
+                parts.append(f"**Rationale:** {entry['rationale']}\n\n")
 
-        return context
+        return "".join(parts)
     except Exception as e:
         return f"Error: {e}"
 
@@ -474,29 +714,49 @@ def get_tool_usage_guide(tool_name: str) -> str:
     registry = _get_registry()
 
     try:
-        tool_spec = registry.get_tool(tool_name)
-        if tool_spec is None:
-            return f"Tool '{tool_name}' not found"
+        return _render_tool_usage_guide(tool_name, registry.version)
+    except Exception as e:
+        return f"Error: {e}"
 
-        metadata = tool_spec.get("metadata", {})
-        parameters = tool_spec.get("parameters", {})
 
-        guide = f"# {metadata.get('display_name', tool_name)}\n\n"
-        guide += f"{metadata.get('description', '')}\n\n"
-        guide += f"**Category:** {metadata.get('category', 'unknown')}\n"
-        guide += f"**Tags:** {', '.join(metadata.get('tags', []))}\n\n"
-        guide += "## Parameters\n\n"
+@functools.lru_cache(maxsize=128)
+def _render_tool_usage_guide(tool_name: str, registry_version: int) -> str:
+    """Render the usage guide for a tool, memoized per registry version.
 
-        for param_name, param_schema in parameters.get("properties", {}).items():
-            required = param_name in parameters.get("required", [])
-            guide += f"- **{param_name}**"
-            if required:
-                guide += " (required)"
-            guide += f": {param_schema.get('description', 'No description')}\n"
+    The registry version changes whenever a tool is loaded or reloaded, so
+    a cached guide is never served for a changed spec. create_server()
+    clears the cache because a new registry restarts its version count.
 
-        return guide
-    except Exception as e:
-        return f"Error: {e}"
+    Args:
+        tool_name: Name of the thinking tool
+        registry_version: Current ToolRegistry.version (cache key only)
+
+    Returns:
+        Markdown usage guide
+    """
+    tool_spec = _get_registry().get_tool(tool_name)
+    if tool_spec is None:
+        return f"Tool '{tool_name}' not found"
+
+    metadata = tool_spec.get("metadata", {})
+    parameters = tool_spec.get("parameters", {})
+
+    parts = [
+        f"# {metadata.get('display_name', tool_name)}\n\n",
+        f"{metadata.get('description', '')}\n\n",
+        f"**Category:** {metadata.get('category', 'unknown')}\n",
+        f"**Tags:** {', '.join(metadata.get('tags', []))}\n\n",
+        "## Parameters\n\n",
+    ]
+
+    required = set(parameters.get("required", []))
+    for param_name, param_schema in parameters.get("properties", {}).items():
+        parts.append(f"- **{param_name}**")
+        if param_name in required:
+            parts.append(" (required)")
+        parts.append(f": {param_schema.get('description', 'No description')}\n")
+
+    return "".join(parts)
 
 
 # ============================================================================
@@ -521,15 +781,47 @@ def create_server(
 
     # Store tools directory for progressive disclosure
     _tools_directory = tools_directory
+    _invalidate_discover_cache()
+    _start_tools_watcher(tools_directory)
 
     # Initialize orchestration layer
-    _registry = ToolRegistry([tools_directory])
+    renderer = _get_renderer()
+    _registry = ToolRegistry([tools_directory], template_renderer=renderer)
+    _render_tool_usage_guide.cache_clear()
     _registry.discover_tools()
-    _executor = ToolExecutor()
+    _executor = ToolExecutor(template_renderer=renderer)
 
     # Initialize storage layer (if memory path provided)
     if memory_path and memory_path.exists():
         _memory_store = ProcessMemoryStore(memory_path)
-        _knowledge_graph = KnowledgeGraph(_memory_store)
+        # Graph is built on the first knowledge graph query
+        _knowledge_graph = None
 
     return mcp
+
+
+def run_server(
+    transport: Transport = "stdio", host: str = "127.0.0.1", port: int = 8000
+) -> None:
+    """Run the initialized MCP server on the given transport.
+
+    stdio (the default) suits local clients that launch the server as a
+    subprocess. http (Streamable HTTP) and sse keep one long-lived server
+    process that many requests and clients share, avoiding a process spawn
+    and tool discovery per connection.
+
+    Args:
+        transport: One of 'stdio', 'http' or 'sse'
+        host: Interface to bind for http/sse transports
+        port: Port to bind for http/sse transports
+
+    Raises:
+        ValueError: If transport is not supported
+    """
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unsupported transport '{transport}', expected one of {TRANSPORTS}")
+
+    if transport == "stdio":
+        mcp.run()
+    else:
+        mcp.run(transport=transport, host=host, port=port)
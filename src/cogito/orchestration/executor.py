@@ -5,8 +5,27 @@ Orchestrates the execution pipeline: parameter validation → template rendering
 
 from typing import Any
 
-from cogito.processing.renderer import TemplateRenderer, TemplateRenderError
-from cogito.processing.validator import ParameterValidationError, ParameterValidator
+from cogito.processing.renderer import (
+    TemplateRenderer,
+    TemplateRenderError,
+    get_default_renderer,
+    get_tool_name,
+)
+from cogito.processing.validator import (
+    ParameterValidationError,
+    ParameterValidator,
+    get_default_parameter_validator,
+)
+
+# Error message wording for each execution phase
+_PHASE_FAILED = {
+    "validation": "Parameter validation failed",
+    "rendering": "Template rendering failed",
+}
+_PHASE_UNEXPECTED = {
+    "validation": "Unexpected error during parameter validation",
+    "rendering": "Unexpected error during template rendering",
+}
 
 
 class ToolExecutionError(Exception):
@@ -17,6 +36,7 @@ class ToolExecutionError(Exception):
         message: str,
         tool_name: str | None = None,
         phase: str | None = None,
+        error: BaseException | None = None,
     ) -> None:
         """Initialize tool execution error with context.
 
@@ -24,10 +44,14 @@ class ToolExecutionError(Exception):
             message: Human-readable error message
             tool_name: Name of the tool that failed
             phase: Execution phase where error occurred (validation/rendering)
+            error: Optional wrapped error. When given, it is appended to the
+                message as "message: error", so args[0] and str() both carry
+                the underlying cause.
         """
         self.tool_name = tool_name
         self.phase = phase
-        super().__init__(message)
+        self.error = error
+        super().__init__(message if error is None else f"{message}: {error}")
 
 
 class ToolExecutor:
@@ -48,11 +72,13 @@ class ToolExecutor:
         """Initialize tool executor with validators and renderers.
 
         Args:
-            parameter_validator: Parameter validator instance. If None, creates new.
-            template_renderer: Template renderer instance. If None, creates new.
+            parameter_validator: Parameter validator instance. If None, uses the
+                shared process-wide validator.
+            template_renderer: Template renderer instance. If None, uses the
+                shared process-wide renderer.
         """
-        self._param_validator = parameter_validator or ParameterValidator()
-        self._renderer = template_renderer or TemplateRenderer()
+        self._param_validator = parameter_validator or get_default_parameter_validator()
+        self._renderer = template_renderer or get_default_renderer()
 
     def execute(
         self,
@@ -76,39 +102,70 @@ class ToolExecutor:
         Raises:
             ToolExecutionError: If execution fails in any phase
         """
-        tool_name = tool_spec.get("metadata", {}).get("name", "unknown")
+        tool_name = get_tool_name(tool_spec)
 
-        # Phase 1: Parameter validation and defaults
+        # One handler for both phases; `phase` records how far execution got
+        phase = "validation"
         try:
+            # Phase 1: Parameter validation and defaults
             validated_params = self._param_validator.validate_parameters(tool_spec, parameters)
-        except ParameterValidationError as e:
+
+            # Phase 2: Template rendering
+            phase = "rendering"
+            return self._renderer.render(tool_spec, validated_params)
+        except (ParameterValidationError, TemplateRenderError) as e:
             raise ToolExecutionError(
-                f"Parameter validation failed: {e}",
-                tool_name=tool_name,
-                phase="validation",
+                _PHASE_FAILED[phase], tool_name=tool_name, phase=phase, error=e
             ) from e
         except Exception as e:
             raise ToolExecutionError(
-                f"Unexpected error during parameter validation: {e}",
-                tool_name=tool_name,
-                phase="validation",
+                _PHASE_UNEXPECTED[phase], tool_name=tool_name, phase=phase, error=e
             ) from e
 
-        # Phase 2: Template rendering
+    def execute_batch(
+        self,
+        tool_spec: dict[str, Any],
+        params_list: list[dict[str, Any] | None],
+    ) -> list[str]:
+        """Execute one thinking tool against many parameter sets.
+
+        Every parameter set is validated first, then the template is
+        compiled once and rendered for each set, so fan-out workloads pay
+        the lookup and compilation cost per batch rather than per call.
+
+        Args:
+            tool_spec: Tool specification dictionary
+            params_list: User-provided parameters for each execution
+
+        Returns:
+            Rendered outputs, in the same order as params_list
+
+        Raises:
+            ToolExecutionError: If any parameter set fails validation or rendering
+        """
+        tool_name = get_tool_name(tool_spec)
+        validate = self._param_validator.validate_parameters
+
+        phase = "validation"
+        # Sets validated so far; its length is the index of a failing set
+        validated_list: list[dict[str, Any]] = []
         try:
-            rendered = self._renderer.render(tool_spec, validated_params)
-            return rendered
-        except TemplateRenderError as e:
+            # Phase 1: Parameter validation and defaults, for every set up front
+            for parameters in params_list:
+                validated_list.append(validate(tool_spec, parameters))
+
+            # Phase 2: Template rendering against a single compiled template
+            phase = "rendering"
+            return self._renderer.render_many(tool_spec, validated_list)
+        except (ParameterValidationError, TemplateRenderError) as e:
+            context = f" for batch item {len(validated_list)}" if phase == "validation" else ""
             raise ToolExecutionError(
-                f"Template rendering failed: {e}",
-                tool_name=tool_name,
-                phase="rendering",
+                _PHASE_FAILED[phase] + context, tool_name=tool_name, phase=phase, error=e
             ) from e
         except Exception as e:
+            context = f" for batch item {len(validated_list)}" if phase == "validation" else ""
             raise ToolExecutionError(
-                f"Unexpected error during template rendering: {e}",
-                tool_name=tool_name,
-                phase="rendering",
+                _PHASE_UNEXPECTED[phase] + context, tool_name=tool_name, phase=phase, error=e
             ) from e
 
     def execute_by_name(
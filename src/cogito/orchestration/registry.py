@@ -3,12 +3,122 @@
 Implements PM-004 (Hot-Reload Capability) for developer experience.
 """
 
+import os
+import sys
+import time
+from collections.abc import ItemsView
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from cogito.processing.validator import SchemaValidator
+from cogito.processing.renderer import TemplateRenderer
+from cogito.processing.validator import SchemaValidator, get_default_schema_validator
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+
+def safe_load_yaml(stream: Any) -> Any:
+    """Parse YAML with the fastest available safe loader.
+
+    Uses LibYAML's CSafeLoader when available, falling back to the
+    pure-Python SafeLoader. Both only construct plain Python objects.
+
+    Args:
+        stream: YAML text, bytes, or open file object
+
+    Returns:
+        Parsed YAML document
+    """
+    return yaml.load(stream, Loader=_SafeLoader)  # noqa: S506 - safe loader
+
+
+def _scan_tool_files(scan_dir: str | os.PathLike[str]) -> tuple[list[str], list[str]]:
+    """Recursively collect tool YAML files in a single directory walk.
+
+    Uses os.scandir so file type checks come from the cached directory
+    entries. Like Path.rglob, symlinked directories are not descended into.
+    Paths are returned as plain strings; discovery never needs Path methods.
+
+    Args:
+        scan_dir: Directory to scan
+
+    Returns:
+        Tuple of (.yml file paths, .yaml file paths)
+    """
+    yml_files: list[str] = []
+    yaml_files: list[str] = []
+    pending = [os.fspath(scan_dir)]
+
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".yml") and entry.is_file():
+                        yml_files.append(entry.path)
+                    elif entry.name.endswith(".yaml") and entry.is_file():
+                        yaml_files.append(entry.path)
+        except OSError:
+            # Unreadable directory; skip it like rglob does
+            continue
+
+    return yml_files, yaml_files
+
+
+# String values up to this length are interned; longer ones (template
+# sources, descriptions) are rarely shared between tools
+_INTERN_MAX_LENGTH = 64
+
+
+def _intern_strings(value: Any) -> Any:
+    """Return a copy of a loaded YAML value with shared strings interned.
+
+    Tool specs repeat the same keys, category names, types and parameter
+    names; interning makes every spec in the registry share one instance.
+
+    Args:
+        value: Parsed YAML value
+
+    Returns:
+        Equivalent value with string keys and short string values interned
+    """
+    if isinstance(value, dict):
+        return {
+            (sys.intern(k) if type(k) is str else k): _intern_strings(v) for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern_strings(item) for item in value]
+    if type(value) is str and len(value) <= _INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+# Files modified this recently are not trusted to be unchanged on an equal
+# (mtime, size), since filesystem timestamps have coarse granularity
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
+def _file_signature(fileno: int) -> tuple[int, int] | None:
+    """Get the (mtime_ns, size) signature of an open file.
+
+    Args:
+        fileno: File descriptor of the open tool file
+
+    Returns:
+        Signature tuple, or None if the file was modified too recently for
+        an unchanged signature to prove unchanged content
+    """
+    stat = os.fstat(fileno)
+    if time.time_ns() - stat.st_mtime_ns < _RACY_MTIME_WINDOW_NS:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
 
 
 class ToolDiscoveryError(Exception):
@@ -48,25 +158,54 @@ class ToolRegistry:
         self,
         tool_dirs: list[Path] | None = None,
         enable_validation: bool = True,
+        template_renderer: TemplateRenderer | None = None,
     ) -> None:
         """Initialize tool registry.
 
         Args:
             tool_dirs: Directories to scan for tools. If None, uses default.
             enable_validation: Whether to validate tools during discovery.
+            template_renderer: Optional renderer whose template cache is warmed
+                when tools are loaded, so the first execution skips compiling.
+                Tools whose templates fail to compile are rejected. Validation
+                checks template syntax with this renderer too, so each
+                template is compiled once.
         """
         self._tool_dirs = tool_dirs or []
         self._enable_validation = enable_validation
-        self._validator = SchemaValidator() if enable_validation else None
+        self._validator: SchemaValidator | None = None
+        if enable_validation:
+            self._validator = (
+                get_default_schema_validator()
+                if template_renderer is None
+                else SchemaValidator(template_renderer=template_renderer)
+            )
+        self._renderer = template_renderer
 
         # Cache: tool_name -> tool_spec
         self._tools: dict[str, dict[str, Any]] = {}
 
-        # Metadata: tool_name -> file_path
-        self._tool_paths: dict[str, Path] = {}
+        # Metadata: tool_name -> file path (wrapped in Path by get_tool_path)
+        self._tool_paths: dict[str, str] = {}
+
+        # Metadata: tool_name -> spec["metadata"], extracted once at load time
+        self._metadata: dict[str, dict[str, Any]] = {}
+
+        # Metadata: tool_name -> (mtime_ns, size) of the file when loaded,
+        # used to skip hot-reloads of unchanged files
+        self._file_signatures: dict[str, tuple[int, int]] = {}
 
-        # Category index: category -> list[tool_name]
-        self._categories: dict[str, list[str]] = {}
+        # Bumped whenever cached specs change; keys derived caches
+        self._version = 0
+
+        # Metadata projection cache: (version, all tools, per-category lists)
+        self._metadata_cache: (
+            tuple[int, list[dict[str, Any]], dict[str, list[dict[str, Any]]]] | None
+        ) = None
+
+        # Category index cache: (version, category -> tool names). Built on
+        # first query rather than maintained on every load
+        self._categories_cache: tuple[int, dict[str, list[str]]] | None = None
 
     def discover_tools(self, scan_dirs: list[Path] | None = None) -> int:
         """Discover and load all tools from configured directories.
@@ -88,32 +227,43 @@ class ToolRegistry:
         if not dirs_to_scan:
             raise ToolDiscoveryError("No directories configured for tool discovery")
 
-        tools_discovered = 0
-
+        tool_files: list[str] = []
         for scan_dir in dirs_to_scan:
             if not scan_dir.exists():
                 continue
 
-            # Recursively find all .yml and .yaml files
-            for tool_file in scan_dir.rglob("*.yml"):
-                try:
-                    self.load_tool(tool_file)
-                    tools_discovered += 1
-                except ToolLoadError:
-                    # Skip invalid tools during discovery
-                    continue
-
-            for tool_file in scan_dir.rglob("*.yaml"):
-                try:
-                    self.load_tool(tool_file)
-                    tools_discovered += 1
-                except ToolLoadError:
-                    # Skip invalid tools during discovery
-                    continue
+            # Recursively find all .yml and .yaml files (.yml loaded first)
+            yml_files, yaml_files = _scan_tool_files(scan_dir)
+            tool_files.extend(yml_files)
+            tool_files.extend(yaml_files)
+
+        # Read and parse files concurrently. Validation touches caches shared
+        # with the rest of the process, so specs are validated and merged into
+        # the registry below on this thread, in scan order
+        if len(tool_files) > 1:
+            workers = min(32, (os.cpu_count() or 1) * 4, len(tool_files))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                specs = list(executor.map(self._parse_tool_file_or_none, tool_files))
+        else:
+            specs = [self._parse_tool_file_or_none(path) for path in tool_files]
+
+        tools_discovered = 0
+        for tool_file, loaded in zip(tool_files, specs, strict=True):
+            if loaded is None:
+                # Skip invalid tools during discovery
+                continue
+            tool_spec, signature = loaded
+            try:
+                self._validate_tool_spec(tool_spec, tool_file)
+                self._precompile_template(tool_spec, tool_file)
+            except ToolLoadError:
+                continue
+            self._store_tool(tool_spec, tool_file, signature)
+            tools_discovered += 1
 
         return tools_discovered
 
-    def load_tool(self, tool_path: Path) -> dict[str, Any]:
+    def load_tool(self, tool_path: str | os.PathLike[str]) -> dict[str, Any]:
         """Load a single tool from a YAML file.
 
         Validates the tool spec and adds it to the registry cache.
@@ -127,22 +277,100 @@ class ToolRegistry:
         Raises:
             ToolLoadError: If tool loading or validation fails
         """
+        tool_path = os.fspath(tool_path)
+        tool_spec, signature = self._read_tool_spec(tool_path)
+
+        # Compile template up front (cached by the shared renderer)
+        self._precompile_template(tool_spec, tool_path)
+
+        self._store_tool(tool_spec, tool_path, signature)
+        return tool_spec
+
+    def _parse_tool_file_or_none(
+        self, tool_path: str
+    ) -> tuple[dict[str, Any], tuple[int, int] | None] | None:
+        """Read and parse a tool file, returning None if it cannot be loaded.
+
+        Args:
+            tool_path: Path to tool YAML file
+
+        Returns:
+            Result of _parse_tool_file, or None on ToolLoadError
+        """
         try:
-            with open(tool_path, encoding="utf-8") as f:
-                tool_spec = yaml.safe_load(f)
+            return self._parse_tool_file(tool_path)
+        except ToolLoadError:
+            return None
+
+    def _read_tool_spec(
+        self, tool_path: str
+    ) -> tuple[dict[str, Any], tuple[int, int] | None]:
+        """Read, parse and validate a tool spec without touching registry state.
+
+        Args:
+            tool_path: Path to tool YAML file
+
+        Returns:
+            Tuple of (validated tool specification, file signature)
+
+        Raises:
+            ToolLoadError: If tool loading or validation fails
+        """
+        tool_spec, signature = self._parse_tool_file(tool_path)
+        self._validate_tool_spec(tool_spec, tool_path)
+        return tool_spec, signature
+
+    def _parse_tool_file(
+        self, tool_path: str
+    ) -> tuple[dict[str, Any], tuple[int, int] | None]:
+        """Read and parse a tool file without validating it.
+
+        Touches no shared state, so it is safe to call from worker threads
+        during discovery.
+
+        Args:
+            tool_path: Path to tool YAML file
+
+        Returns:
+            Tuple of (parsed tool specification, file signature)
+
+        Raises:
+            ToolLoadError: If the file cannot be read or is not a YAML mapping
+        """
+        try:
+            # Unbuffered, so the whole file comes back from one sized read
+            # and LibYAML parses a single in-memory buffer
+            with open(tool_path, "rb", buffering=0) as f:
+                signature = _file_signature(f.fileno())
+                tool_spec = _intern_strings(safe_load_yaml(f.read()))
                 if not isinstance(tool_spec, dict):
                     raise ToolLoadError(
                         "Tool spec must be a dictionary",
-                        tool_path=str(tool_path),
+                        tool_path=tool_path,
                     )
         except ToolLoadError:
             raise
         except Exception as e:
             raise ToolLoadError(
                 f"Failed to load tool from {tool_path}: {e}",
-                tool_path=str(tool_path),
+                tool_path=tool_path,
             ) from e
 
+        return tool_spec, signature
+
+    def _validate_tool_spec(self, tool_spec: dict[str, Any], tool_path: str) -> None:
+        """Validate a parsed tool spec and check it has a name.
+
+        The shared schema validator caches results, so this must not run in
+        discovery worker threads.
+
+        Args:
+            tool_spec: Parsed tool specification
+            tool_path: Path the spec was loaded from (for error context)
+
+        Raises:
+            ToolLoadError: If validation fails or metadata.name is missing
+        """
         # Validate tool spec if validation enabled
         if self._validator:
             try:
@@ -150,35 +378,75 @@ class ToolRegistry:
                 if not validation_result["valid"]:
                     raise ToolLoadError(
                         f"Tool validation failed: {validation_result['errors']}",
-                        tool_path=str(tool_path),
+                        tool_path=tool_path,
                     )
             except Exception as e:
                 raise ToolLoadError(
                     f"Tool validation error: {e}",
-                    tool_path=str(tool_path),
+                    tool_path=tool_path,
                 ) from e
 
         # Extract tool name from metadata
         if "metadata" not in tool_spec or "name" not in tool_spec["metadata"]:
             raise ToolLoadError(
                 "Tool missing metadata.name field",
-                tool_path=str(tool_path),
+                tool_path=tool_path,
             )
 
+    def _store_tool(
+        self,
+        tool_spec: dict[str, Any],
+        tool_path: str,
+        signature: tuple[int, int] | None,
+    ) -> None:
+        """Add a loaded tool spec to the cache and indices.
+
+        Args:
+            tool_spec: Validated tool specification
+            tool_path: Path the spec was loaded from
+            signature: File signature at load time, if trustworthy
+        """
         tool_name = tool_spec["metadata"]["name"]
 
         # Add to cache
         self._tools[tool_name] = tool_spec
         self._tool_paths[tool_name] = tool_path
+        self._metadata[tool_name] = tool_spec["metadata"]
+        self._set_file_signature(tool_name, signature)
+        self._version += 1
 
-        # Update category index
-        category = tool_spec.get("metadata", {}).get("category", "uncategorized")
-        if category not in self._categories:
-            self._categories[category] = []
-        if tool_name not in self._categories[category]:
-            self._categories[category].append(tool_name)
+    def _set_file_signature(self, tool_name: str, signature: tuple[int, int] | None) -> None:
+        """Record (or forget) the file signature a tool was loaded with.
 
-        return tool_spec
+        Args:
+            tool_name: Name of the tool
+            signature: Signature from _file_signature, or None if untrusted
+        """
+        if signature is None:
+            self._file_signatures.pop(tool_name, None)
+        else:
+            self._file_signatures[tool_name] = signature
+
+    def _precompile_template(self, tool_spec: dict[str, Any], tool_path: str) -> None:
+        """Compile a tool's template with the shared renderer, if configured.
+
+        Args:
+            tool_spec: Loaded tool specification
+            tool_path: Path the spec was loaded from (for error context)
+
+        Raises:
+            ToolLoadError: If the template fails to compile
+        """
+        if self._renderer is None or "source" not in tool_spec.get("template", {}):
+            return
+
+        try:
+            self._renderer.precompile(tool_spec)
+        except Exception as e:
+            raise ToolLoadError(
+                f"Template compilation failed: {e}",
+                tool_path=tool_path,
+            ) from e
 
     def get_tool(self, tool_name: str) -> dict[str, Any] | None:
         """Get a tool by name from the registry.
@@ -199,13 +467,99 @@ class ToolRegistry:
         """
         return list(self._tools.keys())
 
+    def iter_tools(self) -> ItemsView[str, dict[str, Any]]:
+        """Iterate over (name, spec) pairs for all tools in the registry.
+
+        Returns a live view of the cache without copying; specs must not
+        be modified by the caller.
+
+        Returns:
+            View of tool name and specification pairs
+        """
+        return self._tools.items()
+
+    def get_tool_metadata(self, tool_name: str) -> dict[str, Any] | None:
+        """Get the metadata section of a tool's specification.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            Tool metadata dict, or None if not found
+        """
+        return self._metadata.get(tool_name)
+
+    def iter_metadata(self) -> ItemsView[str, dict[str, Any]]:
+        """Iterate over (name, metadata) pairs for all tools in the registry.
+
+        Returns a live view without copying; metadata must not be modified
+        by the caller.
+
+        Returns:
+            View of tool name and metadata pairs
+        """
+        return self._metadata.items()
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter that changes whenever cached tool specs change."""
+        return self._version
+
+    def list_tool_metadata(self, category: str | None = None) -> list[dict[str, Any]]:
+        """List summary metadata for all tools, optionally filtered by category.
+
+        The projection is computed once per registry version and reused
+        until a tool is loaded, reloaded or the cache is cleared. The
+        returned dicts are shared and must not be modified.
+
+        Args:
+            category: Optional category to filter by (exact match)
+
+        Returns:
+            List of dicts with name, display_name, description, category, tags
+        """
+        if self._metadata_cache is None or self._metadata_cache[0] != self._version:
+            all_metadata: list[dict[str, Any]] = []
+            by_category: dict[str, list[dict[str, Any]]] = {}
+            for metadata in self._metadata.values():
+                summary = {
+                    "name": metadata.get("name", "unknown"),
+                    "display_name": metadata.get("display_name", ""),
+                    "description": metadata.get("description", ""),
+                    "category": metadata.get("category", ""),
+                    "tags": metadata.get("tags", []),
+                }
+                all_metadata.append(summary)
+                by_category.setdefault(summary["category"], []).append(summary)
+            self._metadata_cache = (self._version, all_metadata, by_category)
+
+        _, all_metadata, by_category = self._metadata_cache
+        if category:
+            return list(by_category.get(category, []))
+        return list(all_metadata)
+
+    def _get_categories(self) -> dict[str, list[str]]:
+        """Get the category index, rebuilding it if tools changed since.
+
+        Returns:
+            Mapping of category name to tool names, in load order. Shared;
+            must not be modified.
+        """
+        if self._categories_cache is None or self._categories_cache[0] != self._version:
+            categories: dict[str, list[str]] = {}
+            for tool_name, metadata in self._metadata.items():
+                category = metadata.get("category", "uncategorized")
+                categories.setdefault(category, []).append(tool_name)
+            self._categories_cache = (self._version, categories)
+        return self._categories_cache[1]
+
     def list_categories(self) -> list[str]:
         """List all categories in the registry.
 
         Returns:
             List of category names
         """
-        return list(self._categories.keys())
+        return list(self._get_categories())
 
     def get_tools_by_category(self, category: str) -> list[str]:
         """Get all tool names in a specific category.
@@ -216,13 +570,15 @@ class ToolRegistry:
         Returns:
             List of tool names in the category
         """
-        return self._categories.get(category, [])
+        return list(self._get_categories().get(category, ()))
 
     def reload_tool(self, tool_name: str) -> dict[str, Any]:
         """Reload a specific tool from disk (hot-reload).
 
         Implements PM-004 hot-reload with validation and atomic swap.
-        If validation fails, the old tool spec remains in cache.
+        If validation fails, the old tool spec remains in cache. If the
+        file's mtime and size are unchanged since it was loaded, the cached
+        spec is returned without re-parsing or re-validating.
 
         Args:
             tool_name: Name of tool to reload
@@ -238,12 +594,20 @@ class ToolRegistry:
 
         tool_path = self._tool_paths[tool_name]
 
+        # Unchanged on disk: nothing to reload
+        cached_signature = self._file_signatures.get(tool_name)
+        if cached_signature is not None:
+            try:
+                stat = os.stat(tool_path)
+            except OSError:
+                pass  # Let the open below report the error
+            else:
+                if (stat.st_mtime_ns, stat.st_size) == cached_signature:
+                    return self._tools[tool_name]
+
         # Load and validate new spec (without updating cache yet)
         try:
-            with open(tool_path, encoding="utf-8") as f:
-                new_spec = yaml.safe_load(f)
-                if not isinstance(new_spec, dict):
-                    raise ToolLoadError("Tool spec must be a dictionary")
+            new_spec, signature = self._parse_tool_file(tool_path)
 
             # Validate if enabled
             if self._validator:
@@ -251,8 +615,14 @@ class ToolRegistry:
                 if not validation_result["valid"]:
                     raise ToolLoadError(f"Reload validation failed: {validation_result['errors']}")
 
+            # Compile before swapping so a broken template keeps the old spec
+            self._precompile_template(new_spec, tool_path)
+
             # Atomic swap: only update cache if validation passed
             self._tools[tool_name] = new_spec
+            self._metadata[tool_name] = new_spec.get("metadata", {})
+            self._set_file_signature(tool_name, signature)
+            self._version += 1
 
             return new_spec
 
@@ -261,14 +631,16 @@ class ToolRegistry:
         except Exception as e:
             raise ToolLoadError(
                 f"Failed to reload tool '{tool_name}': {e}",
-                tool_path=str(tool_path),
+                tool_path=tool_path,
             ) from e
 
     def clear_cache(self) -> None:
         """Clear all cached tools from the registry."""
         self._tools.clear()
         self._tool_paths.clear()
-        self._categories.clear()
+        self._metadata.clear()
+        self._file_signatures.clear()
+        self._version += 1
 
     def get_tool_count(self) -> int:
         """Get total number of tools in registry.
@@ -287,4 +659,5 @@ class ToolRegistry:
         Returns:
             Path to tool file, or None if not found
         """
-        return self._tool_paths.get(tool_name)
+        tool_path = self._tool_paths.get(tool_name)
+        return Path(tool_path) if tool_path is not None else None
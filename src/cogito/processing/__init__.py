@@ -4,12 +4,18 @@ This module implements Layer 3 (Processing) of the five-layer architecture.
 Provides secure template rendering and validation functionality.
 """
 
-from cogito.processing.renderer import TemplateRenderer, TemplateRenderError
+from cogito.processing.renderer import (
+    TemplateRenderer,
+    TemplateRenderError,
+    get_default_renderer,
+)
 from cogito.processing.validator import (
     ParameterValidationError,
     ParameterValidator,
     SchemaValidator,
     ToolSpecValidationError,
+    get_default_parameter_validator,
+    get_default_schema_validator,
 )
 
 __all__ = [
@@ -19,4 +25,7 @@ __all__ = [
     "ParameterValidationError",
     "SchemaValidator",
     "ToolSpecValidationError",
+    "get_default_renderer",
+    "get_default_parameter_validator",
+    "get_default_schema_validator",
 ]
@@ -0,0 +1,54 @@
+"""JSON helpers backed by orjson when it is installed.
+
+orjson parses and serializes several times faster than the standard library
+json module and produces bytes directly. It is an optional dependency (the
+``speedups`` extra); the standard library is used when it is not installed.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text, as bytes (UTF-8) or str
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        ValueError: If data is not valid JSON (orjson.JSONDecodeError and
+            json.JSONDecodeError are both ValueError subclasses)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_canonical(obj: Any) -> bytes:
+    """Serialize an object as compact JSON with sorted keys.
+
+    The output is stable for equal objects, so it can be hashed as a content
+    key. It differs between the two backends, so it must not be persisted.
+
+    Args:
+        obj: JSON-compatible object to serialize
+
+    Returns:
+        Compact UTF-8 JSON bytes
+
+    Raises:
+        TypeError: If obj holds values JSON cannot represent
+        ValueError: If obj holds values JSON cannot represent (stdlib, e.g.
+            circular references)
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
@@ -1,19 +1,83 @@
 """Template rendering engine for thinking tools with sandboxed Jinja2 execution.
 
 This module implements Layer 3 (Processing) functionality for secure template
-rendering. Uses Jinja2's SandboxedEnvironment to prevent arbitrary code execution
-while preserving needed functionality (conditionals, loops, filters).
+rendering. Uses Jinja2's ImmutableSandboxedEnvironment to prevent arbitrary code
+execution while preserving needed functionality (conditionals, loops, filters).
 
 Architecture: Layer 3 - Processing
 Dependencies: None (lowest layer in processing stack)
 Security: Defense-in-depth with sandboxing and input validation
 """
 
+import threading
+from collections import OrderedDict
 from typing import Any
 
-from jinja2 import StrictUndefined
+from jinja2 import BytecodeCache, StrictUndefined, Template
 from jinja2.exceptions import TemplateError, TemplateSyntaxError, UndefinedError
-from jinja2.sandbox import SandboxedEnvironment
+from jinja2.sandbox import ImmutableSandboxedEnvironment
+
+
+def get_tool_name(tool_spec: dict[str, Any]) -> str:
+    """Get a tool's metadata.name, or 'unknown' if it has none.
+
+    Args:
+        tool_spec: Tool specification dictionary
+
+    Returns:
+        Tool name for error context
+    """
+    metadata = tool_spec.get("metadata")
+    return metadata.get("name", "unknown") if metadata else "unknown"
+
+
+# Parameter value types whose equality implies identical rendered output
+_MEMOIZABLE_TYPES = frozenset({str, int, bool, type(None)})
+
+# Jinja2 builtins with non-deterministic output (random filter, lipsum global)
+_NONDETERMINISTIC_NAMES = ("random", "lipsum")
+
+
+def _render_cache_key(
+    template_source: str, parameters: dict[str, Any] | None
+) -> tuple[str, frozenset[tuple[str, type, Any]]] | None:
+    """Build the memoization key for a render, if its output can be reused.
+
+    Args:
+        template_source: Jinja2 template string
+        parameters: Parameter values for the render
+
+    Returns:
+        Hashable key, or None if the render must not be memoized because a
+        parameter is not a plain scalar or the template may be random
+    """
+    for name in _NONDETERMINISTIC_NAMES:
+        if name in template_source:
+            return None
+    if not parameters:
+        return (template_source, frozenset())
+    items = []
+    for name, value in parameters.items():
+        value_type = type(value)
+        if value_type not in _MEMOIZABLE_TYPES:
+            return None
+        # The type is part of the key so that True and 1 render separately
+        items.append((name, value_type, value))
+    return (template_source, frozenset(items))
+
+
+def _missing_template_error(tool_spec: dict[str, Any]) -> ValueError:
+    """Describe which part of the template section a tool spec is missing.
+
+    Args:
+        tool_spec: Tool specification without a usable template.source
+
+    Returns:
+        ValueError naming the missing key
+    """
+    if "template" not in tool_spec:
+        return ValueError("tool_spec missing 'template' key")
+    return ValueError("tool_spec['template'] missing 'source' key")
 
 
 class TemplateRenderError(Exception):
@@ -30,11 +94,34 @@ class TemplateRenderError(Exception):
         super().__init__(message)
 
 
+def _render_error(error: TemplateError, tool_name: str) -> TemplateRenderError:
+    """Translate a Jinja2 error raised while rendering into a TemplateRenderError.
+
+    Args:
+        error: Jinja2 error raised during compilation or rendering
+        tool_name: Name of the tool whose template failed
+
+    Returns:
+        TemplateRenderError describing the failure
+    """
+    if isinstance(error, UndefinedError):
+        return TemplateRenderError(
+            f"Undefined variable in template: {error}", template_name=tool_name
+        )
+    if isinstance(error, TemplateSyntaxError):
+        return TemplateRenderError(
+            f"Template syntax error at line {error.lineno}: {error.message}",
+            template_name=tool_name,
+        )
+    return TemplateRenderError(f"Template rendering failed: {error}", template_name=tool_name)
+
+
 class TemplateRenderer:
     """Secure template renderer using sandboxed Jinja2 environment.
 
     Implements PM-002 (Sandboxed Jinja2 Template Engine) design decision:
-    - Uses SandboxedEnvironment to prevent arbitrary code execution
+    - Uses ImmutableSandboxedEnvironment to prevent arbitrary code execution
+      and in-place modification of parameter lists/dicts
     - Strict undefined variable handling (fail fast on missing data)
     - Whitelisted filters only (no dangerous operations)
     - No filesystem access, no imports, no subprocess execution
@@ -51,9 +138,21 @@ class TemplateRenderer:
         Hello World!
     """
 
-    def __init__(self) -> None:
-        """Initialize sandboxed Jinja2 environment with security constraints."""
-        self._env = SandboxedEnvironment(
+    # Number of compiled templates kept in memory (least recently used evicted)
+    TEMPLATE_CACHE_SIZE = 512
+
+    # Number of rendered outputs kept in memory (least recently used evicted)
+    RENDER_CACHE_SIZE = 256
+
+    def __init__(self, bytecode_cache: BytecodeCache | None = None) -> None:
+        """Initialize sandboxed Jinja2 environment with security constraints.
+
+        Args:
+            bytecode_cache: Optional Jinja2 bytecode cache. When set, compiled
+                template code is stored per tool name and reused across
+                processes as long as the template source is unchanged.
+        """
+        self._env = ImmutableSandboxedEnvironment(
             # Fail on undefined variables (strict mode)
             undefined=StrictUndefined,
             # Disable autoescaping (we're generating prompts, not HTML)
@@ -62,8 +161,22 @@ class TemplateRenderer:
             keep_trailing_newline=True,
             trim_blocks=False,
             lstrip_blocks=False,
+            bytecode_cache=bytecode_cache,
         )
 
+        # Compiled templates keyed by template source
+        self._template_cache: OrderedDict[str, Template] = OrderedDict()
+
+        # Guards the in-memory caches; the renderer is shared between
+        # threads (see get_default_renderer). Compiling and rendering happen
+        # outside it
+        self._cache_lock = threading.Lock()
+
+        # Rendered outputs keyed by (template source, scalar parameters).
+        # Sandboxed templates have no side effects, so output only depends
+        # on these; keying on source means reloaded tools never hit stale text
+        self._render_cache: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+
         # Register safe custom filters (if needed)
         self._register_safe_filters()
 
@@ -76,7 +189,7 @@ class TemplateRenderer:
         - Import modules
         - Perform network operations
         """
-        # Built-in Jinja2 filters are already available in SandboxedEnvironment
+        # Built-in Jinja2 filters are already available in the sandboxed environment
         # Add custom filters for thinking tools
         self._env.filters["format_list"] = self._filter_format_list
         self._env.filters["indent"] = self._filter_indent
@@ -157,52 +270,168 @@ class TemplateRenderer:
             >>> params = {'title': 'Think Aloud', 'depth': 'standard'}
             >>> result = renderer.render(tool_spec, params)
         """
-        # Validate tool spec structure
-        if "template" not in tool_spec:
-            raise ValueError("tool_spec missing 'template' key")
-
-        if "source" not in tool_spec["template"]:
-            raise ValueError("tool_spec['template'] missing 'source' key")
+        # Extract template source, validating tool spec structure on failure
+        try:
+            template_source = tool_spec["template"]["source"]
+        except KeyError:
+            raise _missing_template_error(tool_spec) from None
 
-        # Extract template source and metadata
-        template_source = tool_spec["template"]["source"]
-        tool_name = tool_spec.get("metadata", {}).get("name", "unknown")
+        # Identical renders of a deterministic template reuse the output
+        cache_key = _render_cache_key(template_source, parameters)
+        if cache_key is not None:
+            with self._cache_lock:
+                rendered = self._render_cache.get(cache_key)
+                if rendered is not None:
+                    self._render_cache.move_to_end(cache_key)
+                    return rendered
 
-        # Use empty dict if no parameters provided
-        params = parameters or {}
+        tool_name = get_tool_name(tool_spec)
 
         try:
             # Compile template in sandboxed environment
-            template = self._env.from_string(template_source)
+            template = self._compile(template_source, tool_name)
 
-            # Render with parameters
-            rendered = template.render(**params)
+            # Render with parameters, passed as one mapping rather than
+            # unpacked into keyword arguments and re-packed by Jinja2
+            rendered = template.render(parameters if parameters is not None else {})
+        except TemplateError as e:
+            raise _render_error(e, tool_name) from e
 
-            return rendered
+        if cache_key is not None:
+            with self._cache_lock:
+                self._render_cache[cache_key] = rendered
+                if len(self._render_cache) > self.RENDER_CACHE_SIZE:
+                    self._render_cache.popitem(last=False)
+        return rendered
 
-        except UndefinedError as e:
-            raise TemplateRenderError(
-                f"Undefined variable in template: {e}", template_name=tool_name
-            ) from e
+    def render_many(
+        self, tool_spec: dict[str, Any], parameter_sets: list[dict[str, Any]]
+    ) -> list[str]:
+        """Render one tool's template once per parameter set.
 
-        except TemplateSyntaxError as e:
-            raise TemplateRenderError(
-                f"Template syntax error at line {e.lineno}: {e.message}",
-                template_name=tool_name,
-            ) from e
+        The template is looked up and compiled a single time for the whole
+        batch, so fan-out renders only pay for the render itself.
+
+        Args:
+            tool_spec: Tool specification with 'template.source'
+            parameter_sets: Parameter values for each render
+
+        Returns:
+            Rendered outputs, in the same order as parameter_sets
+
+        Raises:
+            TemplateRenderError: If any render fails
+            ValueError: If tool_spec is missing required keys
+        """
+        try:
+            template_source = tool_spec["template"]["source"]
+        except KeyError:
+            raise _missing_template_error(tool_spec) from None
 
+        tool_name = get_tool_name(tool_spec)
+
+        try:
+            render = self._compile(template_source, tool_name).render
+            return [render(parameters) for parameters in parameter_sets]
         except TemplateError as e:
-            raise TemplateRenderError(
-                f"Template rendering failed: {e}", template_name=tool_name
-            ) from e
+            raise _render_error(e, tool_name) from e
+
+    def precompile(self, tool_spec: dict[str, Any]) -> None:
+        """Compile a tool's template ahead of time so renders skip parsing.
+
+        Args:
+            tool_spec: Tool specification with 'template.source'
+
+        Raises:
+            TemplateRenderError: If the template has syntax errors
+            ValueError: If tool_spec is missing required keys
+        """
+        if "source" not in tool_spec.get("template", {}):
+            raise ValueError("tool_spec missing 'template.source'")
+
+        tool_name = get_tool_name(tool_spec)
+        try:
+            self._compile(tool_spec["template"]["source"], tool_name)
+        except TemplateSyntaxError as e:
+            raise _render_error(e, tool_name) from e
+
+    def _compile(self, template_source: str, template_name: str) -> Template:
+        """Get the compiled template for a source, compiling it on first use.
+
+        Tool templates are immutable once loaded, so compiled templates are
+        kept in an in-memory LRU keyed by source and reused across renders.
+
+        Args:
+            template_source: Jinja2 template string
+            template_name: Tool name, used as the bytecode cache key
+
+        Returns:
+            Compiled template
+        """
+        with self._cache_lock:
+            template = self._template_cache.get(template_source)
+            if template is not None:
+                self._template_cache.move_to_end(template_source)
+                return template
+
+        template = self._compile_uncached(template_source, template_name)
+        self._cache_template(template_source, template)
+        return template
+
+    def _cache_template(self, template_source: str, template: Template) -> None:
+        """Add a compiled template to the in-memory LRU.
 
-    def validate_template_syntax(self, template_source: str) -> bool:
+        Args:
+            template_source: Jinja2 template string
+            template: Compiled template for the source
+        """
+        with self._cache_lock:
+            self._template_cache[template_source] = template
+            if len(self._template_cache) > self.TEMPLATE_CACHE_SIZE:
+                self._template_cache.popitem(last=False)
+
+    def _compile_uncached(self, template_source: str, template_name: str) -> Template:
+        """Compile template source, consulting the bytecode cache if configured.
+
+        ``Environment.from_string`` bypasses the bytecode cache, which only
+        hooks into loader-based templates, so the cache lookup is done here
+        the same way Jinja2's loaders do it.
+
+        Args:
+            template_source: Jinja2 template string
+            template_name: Cache key for the compiled code (the tool name)
+
+        Returns:
+            Compiled template
+        """
+        bytecode_cache = self._env.bytecode_cache
+        if bytecode_cache is None:
+            return self._env.from_string(template_source)
+
+        bucket = bytecode_cache.get_bucket(self._env, template_name, None, template_source)
+        code = bucket.code
+        if code is None:
+            code = self._env.compile(template_source)
+            bucket.code = code
+            bytecode_cache.set_bucket(bucket)
+
+        return self._env.template_class.from_code(
+            self._env, code, self._env.make_globals(None), None
+        )
+
+    def validate_template_syntax(
+        self, template_source: str, template_name: str | None = None
+    ) -> bool:
         """Validate template syntax without rendering.
 
         Useful for schema validation layer (PM-005 Multi-Layer Validation).
+        A successfully compiled template is kept in the template cache, so
+        rendering it later does not compile it a second time.
 
         Args:
             template_source: Jinja2 template string to validate
+            template_name: Tool name. When given, the template is compiled
+                the same way render() does, through the bytecode cache
 
         Returns:
             True if syntax is valid
@@ -210,8 +439,35 @@ class TemplateRenderer:
         Raises:
             TemplateSyntaxError: If template has syntax errors
         """
-        try:
-            self._env.from_string(template_source)
+        if template_name is not None:
+            self._compile(template_source, template_name)
+            return True
+        if template_source in self._template_cache:
             return True
-        except TemplateSyntaxError:
-            raise
+        self._cache_template(template_source, self._env.from_string(template_source))
+        return True
+
+
+# Process-wide renderer, created on first use
+_default_renderer: TemplateRenderer | None = None
+
+# Guards creation of the process-wide renderer, so threads racing on the
+# first call share one instance
+_default_renderer_lock = threading.Lock()
+
+
+def get_default_renderer() -> TemplateRenderer:
+    """Get the shared TemplateRenderer, creating it on first use.
+
+    Components that are not handed a renderer use this one, so compiled
+    templates are cached once per process instead of once per instance.
+
+    Returns:
+        Shared TemplateRenderer instance
+    """
+    global _default_renderer
+    if _default_renderer is None:
+        with _default_renderer_lock:
+            if _default_renderer is None:
+                _default_renderer = TemplateRenderer()
+    return _default_renderer
@@ -4,12 +4,89 @@ This module implements PM-005 (Multi-Layer Validation Pipeline) with three
 sequential validation layers: schema, semantic, and security validation.
 """
 
-from typing import Any
+import hashlib
+import threading
+from collections import OrderedDict
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
-import jsonschema
 from jinja2.exceptions import TemplateSyntaxError
 
-from cogito.processing.renderer import TemplateRenderer
+from cogito.processing import _json
+from cogito.processing.renderer import TemplateRenderer, get_default_renderer, get_tool_name
+
+# jsonschema (with referencing and attrs) is imported on first validation,
+# not with this module, so CLI commands that never validate start faster
+if TYPE_CHECKING:
+    import jsonschema
+
+
+def _spec_digest(tool_spec: dict[str, Any]) -> bytes | None:
+    """Digest a tool spec's content for the validation result cache.
+
+    Args:
+        tool_spec: Tool specification
+
+    Returns:
+        16-byte digest of the canonical JSON form, or None if the spec holds
+        values JSON cannot represent (those specs are not cached)
+    """
+    try:
+        canonical = _json.dumps_canonical(tool_spec)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+
+def _validator_class(schema: Any) -> "type[jsonschema.protocols.Validator]":
+    """Get the validator class for a schema: its declared $schema, else Draft 7.
+
+    Pinning Draft 7 (the draft of the framework's own schemas) instead of
+    jsonschema's newest-draft default keeps the semantic check and the actual
+    validation on the same draft. Draft 7 also checks and validates faster.
+
+    Args:
+        schema: JSON Schema
+
+    Returns:
+        Validator class for the schema's draft
+    """
+    import jsonschema
+
+    validator_class: type[jsonschema.protocols.Validator] = jsonschema.validators.validator_for(
+        schema, default=jsonschema.Draft7Validator
+    )
+    return validator_class
+
+
+def _template_source(tool_spec: dict[str, Any]) -> str | None:
+    """Get a tool spec's template.source, or None if it has none.
+
+    Args:
+        tool_spec: Tool specification
+
+    Returns:
+        Template source string, or None
+    """
+    if "template" in tool_spec and "source" in tool_spec["template"]:
+        source: str = tool_spec["template"]["source"]
+        return source
+    return None
+
+
+# Marks a tool spec without a "parameters" key (None is a value to check)
+_NO_PARAMETERS = object()
+
+# Dangerous template patterns and the warning reported for each
+_DANGEROUS_PATTERNS = (
+    ("import ", "Import statements detected in template"),
+    ("subprocess", "Subprocess execution detected in template"),
+    ("exec(", "exec() usage detected in template"),
+    ("eval(", "eval() usage detected in template"),
+    ("open(", "File operations detected in template"),
+    ("__import__", "Dynamic import detected in template"),
+    ("compile(", "Code compilation detected in template"),
+)
 
 
 class ParameterValidationError(Exception):
@@ -61,21 +138,51 @@ class ParameterValidator:
     the tool's parameter schema definition.
     """
 
+    # Number of compiled parameter schemas kept (least recently used evicted)
+    VALIDATOR_CACHE_SIZE = 256
+
+    def __init__(self) -> None:
+        """Initialize parameter validator with an empty compiled-schema cache."""
+        # id(schema) -> (schema, compiled validator). The schema is kept so
+        # a hit can be confirmed by identity, since ids are reused after GC
+        self._validators: OrderedDict[
+            int, tuple[dict[str, Any], jsonschema.protocols.Validator]
+        ] = OrderedDict()
+
+        # id(schema) -> (schema, top-level property defaults), same keying
+        self._defaults: OrderedDict[int, tuple[dict[str, Any], dict[str, Any]]] = OrderedDict()
+
+        # Guards both caches; the validator is shared between threads (see
+        # get_default_parameter_validator). Building entries happens outside it
+        self._cache_lock = threading.Lock()
+
     def validate_parameters(
-        self, tool_spec: dict[str, Any], parameters: dict[str, Any] | None = None
+        self,
+        tool_spec: dict[str, Any],
+        parameters: dict[str, Any] | bytes | str | None = None,
     ) -> dict[str, Any]:
         """Validate parameters against tool schema and apply defaults.
 
         Args:
             tool_spec: Tool specification containing parameters schema
-            parameters: User-provided parameters to validate
+            parameters: User-provided parameters to validate, either as a dict
+                or as a JSON object document (parsed with orjson if installed)
 
         Returns:
-            Validated parameters with defaults applied
+            Validated parameters with defaults applied. When the schema
+            declares no defaults this is the given dict itself, not a copy.
 
         Raises:
             ParameterValidationError: If validation fails
         """
+        if isinstance(parameters, (bytes, str)):
+            try:
+                parameters = _json.loads(parameters)
+            except ValueError as e:
+                raise ParameterValidationError(f"Parameters are not valid JSON: {e}") from e
+            if not isinstance(parameters, dict):
+                raise ParameterValidationError("Parameters must be a JSON object")
+
         params = parameters or {}
 
         # Get parameter schema from tool spec
@@ -86,11 +193,16 @@ class ParameterValidator:
         param_schema = tool_spec["parameters"]
 
         # Apply defaults first
-        params_with_defaults = self.apply_defaults(param_schema, params)
+        params_with_defaults = self.apply_defaults(param_schema, params, copy=False)
+
+        import jsonschema
 
-        # Validate against schema
+        # Validate against schema, with the same error selection as jsonschema.validate()
         try:
-            jsonschema.validate(instance=params_with_defaults, schema=param_schema)
+            validator = self._get_validator(param_schema)
+            error = jsonschema.exceptions.best_match(validator.iter_errors(params_with_defaults))
+            if error is not None:
+                raise error
         except jsonschema.ValidationError as e:
             # Extract helpful error message
             error_path = ".".join(str(p) for p in e.absolute_path)
@@ -109,34 +221,89 @@ class ParameterValidator:
 
         return params_with_defaults
 
-    def apply_defaults(self, schema: dict[str, Any], parameters: dict[str, Any]) -> dict[str, Any]:
+    def _get_validator(self, param_schema: dict[str, Any]) -> "jsonschema.protocols.Validator":
+        """Get the compiled validator for a parameter schema, building it once.
+
+        Tool specs are loaded once and reused, so validators are cached by
+        schema identity; the schema is only checked on the first use.
+
+        Args:
+            param_schema: Parameter JSON Schema from a tool spec
+
+        Returns:
+            Validator for the schema
+
+        Raises:
+            jsonschema.SchemaError: If the schema itself is invalid
+        """
+        key = id(param_schema)
+        with self._cache_lock:
+            cached = self._validators.get(key)
+            if cached is not None and cached[0] is param_schema:
+                self._validators.move_to_end(key)
+                return cached[1]
+
+        validator_class = _validator_class(param_schema)
+        validator_class.check_schema(param_schema)
+        validator = validator_class(param_schema)
+        with self._cache_lock:
+            self._validators[key] = (param_schema, validator)
+            if len(self._validators) > self.VALIDATOR_CACHE_SIZE:
+                self._validators.popitem(last=False)
+        return validator
+
+    def apply_defaults(
+        self, schema: dict[str, Any], parameters: dict[str, Any], copy: bool = True
+    ) -> dict[str, Any]:
         """Apply default values from schema to parameters.
 
-        Recursively walks schema finding default values and applies them
-        to parameters where keys are missing.
+        Applies the defaults of the schema's top-level properties where keys
+        are missing. Defaults are extracted once per schema and merged in a
+        single step.
 
         Args:
             schema: JSON Schema with default values
             parameters: User-provided parameters (may be incomplete)
+            copy: If False and the schema declares no defaults, return
+                parameters itself instead of a copy
 
         Returns:
-            New dict with defaults merged in (does not modify input)
+            Dict with defaults merged in (the input is never modified)
         """
-        # Start with copy of user parameters
-        result = parameters.copy()
+        defaults = self._get_defaults(schema)
+        if not defaults:
+            return parameters.copy() if copy else parameters
+        return {**defaults, **parameters}
 
-        # Only handle object schemas with properties
-        if schema.get("type") != "object":
-            return result
+    def _get_defaults(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Get the default values declared by a schema, extracting them once.
 
-        properties = schema.get("properties", {})
+        Args:
+            schema: JSON Schema with default values
 
-        for prop_name, prop_schema in properties.items():
-            if prop_name not in result and "default" in prop_schema:
-                # Apply default value
-                result[prop_name] = prop_schema["default"]
+        Returns:
+            Mapping of property name to default value (empty unless the
+            schema is an object schema). Shared; must not be modified.
+        """
+        key = id(schema)
+        with self._cache_lock:
+            cached = self._defaults.get(key)
+            if cached is not None and cached[0] is schema:
+                self._defaults.move_to_end(key)
+                return cached[1]
 
-        return result
+        # Only handle object schemas with properties
+        defaults: dict[str, Any] = {}
+        if schema.get("type") == "object":
+            for prop_name, prop_schema in schema.get("properties", {}).items():
+                if "default" in prop_schema:
+                    defaults[prop_name] = prop_schema["default"]
+
+        with self._cache_lock:
+            self._defaults[key] = (schema, defaults)
+            if len(self._defaults) > self.VALIDATOR_CACHE_SIZE:
+                self._defaults.popitem(last=False)
+        return defaults
 
 
 class SchemaValidator:
@@ -149,21 +316,45 @@ class SchemaValidator:
     3. Security validation - Scans for dangerous template patterns
     """
 
-    def __init__(self, tool_schema: dict[str, Any] | None = None) -> None:
+    # Number of validation results kept (least recently used evicted)
+    RESULT_CACHE_SIZE = 256
+
+    # Schema errors reported per spec; the walk stops once this many are found
+    MAX_SCHEMA_ERRORS = 20
+
+    def __init__(
+        self,
+        tool_schema: dict[str, Any] | None = None,
+        template_renderer: TemplateRenderer | None = None,
+    ) -> None:
         """Initialize schema validator.
 
         Args:
             tool_schema: JSON Schema for thinking tools. If None, will load
                         from schemas/thinking-tool-v1.0.schema.json when needed.
+            template_renderer: Renderer used for the template syntax check.
+                Templates it compiles stay in its cache for rendering. If
+                None, uses the shared process-wide renderer.
         """
         self._tool_schema = tool_schema
-        self._renderer = TemplateRenderer()
+        self._renderer = template_renderer or get_default_renderer()
+
+        # Compiled validator for the tool schema, built on first use
+        self._tool_schema_validator: jsonschema.protocols.Validator | None = None
+
+        # Results of validate_tool_spec keyed by a digest of the spec content
+        self._result_cache: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+
+        # Guards the result cache; the validator is shared between threads
+        # (see get_default_schema_validator). Validation happens outside it
+        self._cache_lock = threading.Lock()
 
     def validate_tool_spec(self, tool_spec: dict[str, Any]) -> dict[str, Any]:
         """Validate tool specification through all three layers.
 
         Runs schema → semantic → security validation in sequence.
-        Stops at first critical failure.
+        Stops at first critical failure. Results are remembered by spec
+        content, so validating an identical spec again skips all layers.
 
         Args:
             tool_spec: Tool specification to validate
@@ -180,6 +371,32 @@ class SchemaValidator:
         Raises:
             ToolSpecValidationError: On critical validation failure
         """
+        key = _spec_digest(tool_spec)
+        if key is None:
+            return self._validate_tool_spec_uncached(tool_spec)
+
+        with self._cache_lock:
+            result = self._result_cache.get(key)
+            if result is not None:
+                self._result_cache.move_to_end(key)
+
+        if result is None:
+            result = self._validate_tool_spec_uncached(tool_spec)
+            with self._cache_lock:
+                self._result_cache[key] = result
+                if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+
+        # Copy so callers cannot alter the cached result
+        return {
+            "valid": result["valid"],
+            "errors": list(result["errors"]),
+            "warnings": list(result["warnings"]),
+            "layers_passed": list(result["layers_passed"]),
+        }
+
+    def _validate_tool_spec_uncached(self, tool_spec: dict[str, Any]) -> dict[str, Any]:
+        """Run all three validation layers (see validate_tool_spec)."""
         errors: list[str] = []
         warnings: list[str] = []
         layers_passed: list[str] = []
@@ -204,9 +421,16 @@ class SchemaValidator:
                 errors=[str(e)],
             ) from e
 
-        # Layer 2: Semantic validation
+        # Layer 2: Semantic validation. The template source and parameter
+        # schema are looked up once here and shared with layer 3
+        template_source: str | None = None
         try:
-            semantic_errors = self.validate_semantics(tool_spec)
+            template_source = _template_source(tool_spec)
+            semantic_errors = self._check_semantics(
+                template_source,
+                tool_spec.get("parameters", _NO_PARAMETERS),
+                get_tool_name(tool_spec),
+            )
             if semantic_errors:
                 errors.extend(semantic_errors)
                 raise ToolSpecValidationError(
@@ -226,7 +450,7 @@ class SchemaValidator:
 
         # Layer 3: Security validation
         try:
-            security_warnings = self.validate_security(tool_spec)
+            security_warnings = self._check_security(template_source)
             if security_warnings:
                 warnings.extend(security_warnings)
             layers_passed.append("security")
@@ -258,17 +482,56 @@ class SchemaValidator:
             # In production, would load from file
             return []
 
+        import jsonschema
+
         errors: list[str] = []
 
         try:
-            jsonschema.validate(instance=tool_spec, schema=self._tool_schema)
-        except jsonschema.ValidationError as e:
-            errors.append(f"Schema validation failed: {e.message}")
+            validator = self._get_tool_schema_validator(self._tool_schema)
         except jsonschema.SchemaError as e:
             errors.append(f"Invalid tool schema: {e.message}")
+            return errors
+
+        found = list(islice(validator.iter_errors(tool_spec), self.MAX_SCHEMA_ERRORS))
+        if not found:
+            return errors
+
+        # The error jsonschema.validate() would raise comes first
+        best = jsonschema.exceptions.best_match(found)
+        top = best
+        while top.parent is not None:
+            top = top.parent
+        errors.append(f"Schema validation failed: {best.message}")
+        errors.extend(
+            f"Schema validation failed: {error.message}" for error in found if error is not top
+        )
 
         return errors
 
+    def _get_tool_schema_validator(
+        self, tool_schema: dict[str, Any]
+    ) -> "jsonschema.protocols.Validator":
+        """Get the tool schema validator, checking and compiling it once.
+
+        jsonschema.validate() re-checks the schema and builds a new validator
+        on every call; a registry validates every tool with the same schema,
+        so the validator is built once and reused.
+
+        Args:
+            tool_schema: The configured tool schema
+
+        Returns:
+            Validator for the configured tool schema
+
+        Raises:
+            jsonschema.SchemaError: If the tool schema itself is invalid
+        """
+        if self._tool_schema_validator is None:
+            validator_class = _validator_class(tool_schema)
+            validator_class.check_schema(tool_schema)
+            self._tool_schema_validator = validator_class(tool_schema)
+        return self._tool_schema_validator
+
     def validate_semantics(self, tool_spec: dict[str, Any]) -> list[str]:
         """Layer 2: Validate semantic correctness.
 
@@ -279,26 +542,44 @@ class SchemaValidator:
         Args:
             tool_spec: Tool specification to validate
 
+        Returns:
+            List of semantic errors (empty if valid)
+        """
+        return self._check_semantics(
+            _template_source(tool_spec),
+            tool_spec.get("parameters", _NO_PARAMETERS),
+            get_tool_name(tool_spec),
+        )
+
+    def _check_semantics(
+        self, template_source: str | None, param_schema: Any, tool_name: str
+    ) -> list[str]:
+        """Check template syntax and parameter schema validity.
+
+        Args:
+            template_source: Template source, or None if the spec has none
+            param_schema: Parameter schema, or _NO_PARAMETERS if absent
+            tool_name: Tool name, the renderer's bytecode cache key
+
         Returns:
             List of semantic errors (empty if valid)
         """
         errors: list[str] = []
 
         # Check template syntax
-        if "template" in tool_spec and "source" in tool_spec["template"]:
-            template_source = tool_spec["template"]["source"]
+        if template_source is not None:
             try:
-                self._renderer.validate_template_syntax(template_source)
+                self._renderer.validate_template_syntax(template_source, tool_name)
             except TemplateSyntaxError as e:
                 errors.append(f"Template syntax error at line {e.lineno}: {e.message}")
 
         # Check parameter schema validity
-        if "parameters" in tool_spec:
-            param_schema = tool_spec["parameters"]
+        if param_schema is not _NO_PARAMETERS:
+            import jsonschema
+
             try:
-                # Validate that parameter schema is valid JSON Schema structure
-                # Use Draft7Validator to check schema validity without instance validation
-                jsonschema.Draft7Validator.check_schema(param_schema)
+                # Check against the same draft the schema is validated with
+                _validator_class(param_schema).check_schema(param_schema)
             except jsonschema.SchemaError as e:
                 errors.append(f"Invalid parameter schema: {e.message}")
 
@@ -319,26 +600,64 @@ class SchemaValidator:
         Returns:
             List of security warnings (empty if no issues)
         """
-        warnings: list[str] = []
+        return self._check_security(_template_source(tool_spec))
 
-        if "template" not in tool_spec or "source" not in tool_spec["template"]:
-            return warnings
+    def _check_security(self, template_source: str | None) -> list[str]:
+        """Scan template source for dangerous patterns.
 
-        template_source = tool_spec["template"]["source"]
+        Args:
+            template_source: Template source, or None if the spec has none
 
-        # Dangerous patterns to detect
-        dangerous_patterns = [
-            ("import ", "Import statements detected in template"),
-            ("subprocess", "Subprocess execution detected in template"),
-            ("exec(", "exec() usage detected in template"),
-            ("eval(", "eval() usage detected in template"),
-            ("open(", "File operations detected in template"),
-            ("__import__", "Dynamic import detected in template"),
-            ("compile(", "Code compilation detected in template"),
+        Returns:
+            List of security warnings (empty if no issues)
+        """
+        if template_source is None:
+            return []
+
+        # str.__contains__ scans in C per pattern, which measures several times
+        # faster than a single regex alternation over the same text
+        return [
+            warning_msg
+            for pattern, warning_msg in _DANGEROUS_PATTERNS
+            if pattern in template_source
         ]
 
-        for pattern, warning_msg in dangerous_patterns:
-            if pattern in template_source:
-                warnings.append(warning_msg)
 
-        return warnings
+# Process-wide validators, created on first use
+_default_parameter_validator: ParameterValidator | None = None
+_default_schema_validator: SchemaValidator | None = None
+
+# Guards creation of the process-wide validators, so threads racing on the
+# first call share one instance
+_default_validator_lock = threading.Lock()
+
+
+def get_default_parameter_validator() -> ParameterValidator:
+    """Get the shared ParameterValidator, creating it on first use.
+
+    Returns:
+        Shared ParameterValidator instance
+    """
+    global _default_parameter_validator
+    if _default_parameter_validator is None:
+        with _default_validator_lock:
+            if _default_parameter_validator is None:
+                _default_parameter_validator = ParameterValidator()
+    return _default_parameter_validator
+
+
+def get_default_schema_validator() -> SchemaValidator:
+    """Get the shared SchemaValidator, creating it on first use.
+
+    Sharing one instance means the tool schema is loaded and compiled once
+    per process rather than once per registry.
+
+    Returns:
+        Shared SchemaValidator instance
+    """
+    global _default_schema_validator
+    if _default_schema_validator is None:
+        with _default_validator_lock:
+            if _default_schema_validator is None:
+                _default_schema_validator = SchemaValidator()
+    return _default_schema_validator
@@ -0,0 +1,39 @@
+"""Shared Jinja2 environments for bootstrap templates.
+
+ProjectBootstrapper and ConfigGenerator render from the same template
+directory with identical settings, so they share one Environment and its
+template cache. Compiled template code is also persisted across processes.
+
+Jinja2 is imported on first use, so importing the provisioning modules
+stays cheap for commands that never render.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+
+@lru_cache(maxsize=8)
+def get_env(template_dir: Path) -> "Environment":
+    """Get the shared bootstrap Environment for a template directory.
+
+    Args:
+        template_dir: Directory containing bootstrap templates
+
+    Returns:
+        Jinja2 environment loading from template_dir
+    """
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    return Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=False,  # Config files are not HTML
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # The default cache directory is private to the current user (0700)
+        # and its ownership is verified before use
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
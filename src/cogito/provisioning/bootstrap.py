@@ -4,20 +4,42 @@ This module coordinates project structure creation, configuration generation,
 example tool copying, and template rendering for new project instances.
 """
 
+import filecmp
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
-
-from cogito.provisioning.config_generator import ConfigGenerator
+from cogito.provisioning._jinja import get_env
+from cogito.provisioning.config_generator import _BOOTSTRAP_TEMPLATES, ConfigGenerator
 from cogito.provisioning.example_tools import ExampleToolsSelector
 from cogito.provisioning.project_template import (
     create_project_directories,
     get_canonical_structure,
     get_file_locations,
+    get_template_filenames,
 )
 
+# Framework root (four levels up from this file)
+_PACKAGE_ROOT = Path(__file__).parents[3]
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write content to a file unless the file already holds exactly that content.
+
+    Args:
+        path: File to write
+        content: Text content to write (UTF-8)
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+
 
 class ProjectBootstrapper:
     """Orchestrates creation of new thinking-tools-framework project instances."""
@@ -30,20 +52,14 @@ class ProjectBootstrapper:
                          Defaults to templates/bootstrap/ relative to package root.
         """
         if template_dir is None:
-            package_root = Path(__file__).parent.parent.parent.parent
-            template_dir = package_root / "templates" / "bootstrap"
+            template_dir = _BOOTSTRAP_TEMPLATES
 
         self.template_dir = template_dir
         self.config_generator = ConfigGenerator(template_dir)
         self.example_tools_selector = ExampleToolsSelector()
 
-        # Initialize Jinja2 environment for general templates
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        # Jinja2 environment for general templates, shared with ConfigGenerator
+        self.jinja_env = get_env(template_dir)
 
     def bootstrap_project(
         self,
@@ -106,8 +122,7 @@ class ProjectBootstrapper:
 
             # Write config files
             for config_name, content in configs.items():
-                config_path = project_root / "config" / config_name
-                config_path.write_text(content, encoding="utf-8")
+                _write_if_changed(project_root / "config" / config_name, content)
                 result["files_created"] += 1
 
             # Step 3: Render and write template files
@@ -119,12 +134,23 @@ class ProjectBootstrapper:
                 **context,
             }
 
+            # Not every file has a template (e.g. PROJECT-IMPERATIVES.md is copied)
+            template_filenames = get_template_filenames(self.template_dir)
             file_locations = get_file_locations(project_root, structure)
-            rendered_files = self._render_all_templates(file_locations, template_context)
-
-            for file_path, content in rendered_files.items():
-                file_path.write_text(content, encoding="utf-8")
-                result["files_created"] += 1
+            jobs = [
+                (template_filenames[template_name], output_path)
+                for template_name, output_path in file_locations.items()
+                if template_name in template_filenames
+            ]
+
+            # Each file is rendered and written in one task, so writes of
+            # finished files overlap with rendering of the next ones
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(jobs)))) as executor:
+                for _ in executor.map(
+                    lambda job: self._render_and_write(job[0], job[1], template_context),
+                    jobs,
+                ):
+                    result["files_created"] += 1
 
             # Step 4: Copy PROJECT-IMPERATIVES.md from framework root
             self._copy_project_imperatives(project_root)
@@ -158,79 +184,20 @@ class ProjectBootstrapper:
 
         return result
 
-    def _render_all_templates(
-        self, file_locations: dict[str, Path], context: dict[str, Any]
-    ) -> dict[Path, str]:
-        """Render all template files.
+    def _render_and_write(
+        self, template_filename: str, output_path: Path, context: dict[str, Any]
+    ) -> None:
+        """Render one template and write it to its output path.
+
+        Safe to call from worker threads; Jinja2 environments are thread-safe.
 
         Args:
-            file_locations: Mapping of template names to output paths
+            template_filename: Template file name in the template directory
+            output_path: Path to write the rendered content to
             context: Template rendering context
-
-        Returns:
-            Dictionary mapping output paths to rendered content
         """
-        rendered: dict[Path, str] = {}
-
-        for template_name, output_path in file_locations.items():
-            # Template names have path prefixes that need to be stripped
-            # Example: "docs_QUICK_START_md_j2" -> "QUICK-START.md.j2"
-            # Example: "README_md_j2" -> "README.md.j2"
-
-            # Strip path prefixes (docs_, src_cogito_, tests_, config_, bootstrap_)
-            prefixes = ["docs_", "src_cogito_", "tests_", "config_", "bootstrap_"]
-            base_name = template_name
-            for prefix in prefixes:
-                if base_name.startswith(prefix):
-                    base_name = base_name[len(prefix):]
-                    break
-
-            # Convert back to actual filename
-            # "QUICK_START_md_j2" -> "QUICK-START.md.j2"
-            # "__init___py_j2" -> "__init__.py.j2"
-            # "_gitignore_j2" -> ".gitignore.j2"
-            if base_name.endswith("_j2"):
-                # Remove _j2 suffix
-                base_name = base_name[:-3]
-
-                # Handle dotfiles (like .gitignore)
-                # "_gitignore" -> ".gitignore"
-                if base_name.startswith("_") and not base_name.startswith("__"):
-                    template_filename = f".{base_name[1:]}.j2"
-                else:
-                    # Replace underscore before extension with dot
-                    # Extensions: md, yml, toml, json, jsonl, py
-                    parts = base_name.rsplit("_", 1)
-                    if len(parts) == 2 and parts[1] in ["md", "yml", "toml", "json", "jsonl", "py"]:
-                        # Convert template name back to actual filename
-                        # Examples:
-                        #   QUICK_START -> QUICK-START (for docs)
-                        #   knowledge_graph -> knowledge_graph (for other files)
-                        #   __init__ -> __init__ (preserve double underscores)
-                        filename_part = parts[0]
-
-                        # Only convert underscores to hyphens for ALL-CAPS names (doc files)
-                        # Leave other files with underscores (knowledge_graph, process_memory)
-                        if filename_part.isupper() and not filename_part.startswith("__"):
-                            filename_part = filename_part.replace("_", "-")
-
-                        template_filename = f"{filename_part}.{parts[1]}.j2"
-                    else:
-                        template_filename = f"{base_name}.j2"
-            else:
-                template_filename = base_name
-
-            try:
-                template = self.jinja_env.get_template(template_filename)
-                content = template.render(**context)
-                rendered[output_path] = content
-            except Exception:
-                # Skip templates that don't exist (not all files use templates)
-                # Debug: Uncomment to see what templates are failing
-                # print(f"Skipping {template_filename}: {e}")
-                continue
-
-        return rendered
+        template = self.jinja_env.get_template(template_filename)
+        _write_if_changed(output_path, template.render(**context))
 
     def _copy_project_imperatives(self, project_root: Path) -> None:
         """Copy PROJECT-IMPERATIVES.md from framework root to new project.
@@ -238,12 +205,12 @@ class ProjectBootstrapper:
         Args:
             project_root: Root directory of new project
         """
-        # Find framework root (4 levels up from this file)
-        framework_root = Path(__file__).parent.parent.parent.parent
-        source = framework_root / "PROJECT-IMPERATIVES.md"
+        source = _PACKAGE_ROOT / "PROJECT-IMPERATIVES.md"
         dest = project_root / "PROJECT-IMPERATIVES.md"
 
         if source.exists():
-            # Read with utf-8 encoding and write to destination
-            content = source.read_text(encoding="utf-8")
-            dest.write_text(content, encoding="utf-8")
+            # Skip identical files (size is compared before contents)
+            if dest.exists() and filecmp.cmp(source, dest, shallow=False):
+                return
+            # Byte-for-byte copy, done by the OS where supported
+            shutil.copyfile(source, dest)
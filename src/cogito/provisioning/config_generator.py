@@ -7,7 +7,10 @@ for new thinking-tools-framework projects using Jinja2 templates.
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from cogito.provisioning._jinja import get_env
+
+# Default templates: templates/bootstrap/ under the framework root
+_BOOTSTRAP_TEMPLATES = Path(__file__).parents[3] / "templates" / "bootstrap"
 
 
 class ConfigGenerator:
@@ -21,17 +24,10 @@ class ConfigGenerator:
                          Defaults to templates/bootstrap/ relative to package root.
         """
         if template_dir is None:
-            # Default to templates/bootstrap directory
-            package_root = Path(__file__).parent.parent.parent.parent
-            template_dir = package_root / "templates" / "bootstrap"
+            template_dir = _BOOTSTRAP_TEMPLATES
 
         self.template_dir = template_dir
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=False,  # Config files are not HTML
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.env = get_env(template_dir)
 
     def generate_pyproject_toml(self, context: dict[str, Any]) -> str:
         """Generate pyproject.toml content from template.
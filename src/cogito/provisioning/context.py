@@ -1,5 +1,6 @@
 """Context snippet generation for focused topic exploration."""
 
+from itertools import chain
 from typing import Any
 
 from cogito.contracts.layer_protocols import StorageProtocol
@@ -44,16 +45,19 @@ class ContextGenerator:
         # Collect related entries if requested
         related_entries: list[dict[str, Any]] = []
         if include_related:
-            related_ids = set()
-            for entry in primary_entries:
-                links = entry.get("links", [])
-                if links:
-                    related_ids.update(links)
+            # Linked ids, deduplicated in first-seen order so the output order
+            # is stable
+            related_ids = dict.fromkeys(
+                chain.from_iterable(entry.get("links") or () for entry in primary_entries)
+            )
 
-            # Fetch related entries
+            # Fetch related entries, skipping the primary entries themselves
+            primary_ids = {entry["id"] for entry in primary_entries}
             for entry_id in related_ids:
+                if entry_id in primary_ids:
+                    continue
                 related = self.memory_store.get_entry(entry_id)
-                if related and related not in primary_entries:
+                if related:
                     related_entries.append(related)
 
         # Build context document
@@ -64,33 +68,30 @@ class ContextGenerator:
             "",
         ]
 
-        # Add primary entries
-        lines.append("## Primary Entries")
-        lines.append("")
+        # Add primary entries. Each element is a block of lines ending in a
+        # blank line, so an entry costs a few appends rather than one per line
+        lines.append("## Primary Entries\n")
 
         for entry in primary_entries:
-            lines.append(f"### {entry['id']}: {entry['title']}")
-            lines.append(f"*Type: {entry['type']}*")
-            lines.append("")
-            lines.append(f"**Summary**: {entry['summary']}")
-            lines.append("")
+            lines.append(
+                f"### {entry['id']}: {entry['title']}\n"
+                f"*Type: {entry['type']}*\n"
+                f"\n"
+                f"**Summary**: {entry['summary']}\n"
+            )
 
             if "rationale" in entry:
-                lines.append(f"**Rationale**: {entry['rationale']}")
-                lines.append("")
+                lines.append(f"**Rationale**: {entry['rationale']}\n")
 
             if "related_concepts" in entry and entry["related_concepts"]:
                 concepts = ", ".join(entry["related_concepts"])
-                lines.append(f"**Related Concepts**: {concepts}")
-                lines.append("")
+                lines.append(f"**Related Concepts**: {concepts}\n")
 
             if "tags" in entry and entry["tags"]:
                 tags_str = ", ".join(f"`{tag}`" for tag in entry["tags"])
-                lines.append(f"**Tags**: {tags_str}")
-                lines.append("")
+                lines.append(f"**Tags**: {tags_str}\n")
 
-            lines.append("---")
-            lines.append("")
+            lines.append("---\n")
 
         # Add related entries
         if related_entries:
@@ -120,11 +121,8 @@ class ContextGenerator:
         Returns:
             Markdown-formatted summary
         """
-        # Get all entries
-        all_entries = self.memory_store.list_entries()
-
-        # Filter by type
-        type_entries = [e for e in all_entries if e.get("type") == entry_type]
+        # Get entries of this type, filtered by the storage layer
+        type_entries = self.memory_store.list_entries(category=entry_type)
 
         if not type_entries:
             return f"# {entry_type}\n\nNo entries of type '{entry_type}' found.\n"
@@ -137,24 +135,18 @@ class ContextGenerator:
             "",
         ]
 
-        # Add each entry
+        # Add each entry, one block of lines (ending in a blank line) per append
         for entry in type_entries:
-            lines.append(f"## {entry['id']}: {entry['title']}")
-            lines.append("")
-            lines.append(entry["summary"])
-            lines.append("")
+            lines.append(f"## {entry['id']}: {entry['title']}\n\n{entry['summary']}\n")
 
             if "confidence_level" in entry:
                 confidence = entry["confidence_level"]
-                lines.append(f"**Confidence**: {confidence:.0%}")
-                lines.append("")
+                lines.append(f"**Confidence**: {confidence:.0%}\n")
 
             if "tags" in entry and entry["tags"]:
                 tags_str = ", ".join(f"`{tag}`" for tag in entry["tags"])
-                lines.append(f"**Tags**: {tags_str}")
-                lines.append("")
+                lines.append(f"**Tags**: {tags_str}\n")
 
-            lines.append("---")
-            lines.append("")
+            lines.append("---\n")
 
         return "\n".join(lines)
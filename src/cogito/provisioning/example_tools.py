@@ -5,25 +5,34 @@ to new project instances, providing working examples for users.
 """
 
 import shutil
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+# Default source of example tools: examples/ under the framework root
+_EXAMPLES_DIR = Path(__file__).parents[3] / "examples"
+
 
 class ExampleToolsSelector:
     """Selects and copies example thinking tools to new projects."""
 
-    # Curated list of starter tools (most representative from each category)
-    STARTER_TOOLS: dict[str, list[str]] = {
-        "metacognition": [
-            "think_aloud.yml",
-            "fresh_eyes.yml",
-            "context_preservation.yml",
-        ],
-        "problem_solving": [
-            "assumption_challenger.yml",
-            "decision_journal.yml",
-        ],
-    }
+    # Curated list of starter tools (most representative from each category).
+    # Read-only, so it can be shared without defensive copies.
+    STARTER_TOOLS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+        {
+            "metacognition": (
+                "think_aloud.yml",
+                "fresh_eyes.yml",
+                "context_preservation.yml",
+            ),
+            "problem_solving": (
+                "assumption_challenger.yml",
+                "decision_journal.yml",
+            ),
+        }
+    )
 
     def __init__(self, source_examples_dir: Path | None = None) -> None:
         """Initialize the example tools selector.
@@ -33,9 +42,7 @@ class ExampleToolsSelector:
                                 Defaults to examples/ in current framework.
         """
         if source_examples_dir is None:
-            # Default to examples/ directory in current framework
-            package_root = Path(__file__).parent.parent.parent.parent
-            source_examples_dir = package_root / "examples"
+            source_examples_dir = _EXAMPLES_DIR
 
         self.source_examples_dir = source_examples_dir
 
@@ -45,11 +52,15 @@ class ExampleToolsSelector:
         Returns:
             Dictionary mapping categories to lists of tool filenames
         """
-        # Deep copy to ensure lists are also copied
-        return {k: v.copy() for k, v in self.STARTER_TOOLS.items()}
+        # Fresh lists, since callers may edit the selection
+        return {k: list(v) for k, v in self.STARTER_TOOLS.items()}
 
     def copy_tool(
-        self, category: str, tool_filename: str, dest_category_dir: Path
+        self,
+        category: str,
+        tool_filename: str,
+        dest_category_dir: Path,
+        create_dir: bool = True,
     ) -> dict[str, Any]:
         """Copy a single tool file to destination project.
 
@@ -57,6 +68,8 @@ class ExampleToolsSelector:
             category: Tool category (e.g., 'metacognition')
             tool_filename: Tool YAML filename (e.g., 'think_aloud.yml')
             dest_category_dir: Destination category directory in new project
+            create_dir: Create dest_category_dir if needed. Batch callers that
+                created it already pass False to skip the mkdir syscall.
 
         Returns:
             Dictionary with copy results:
@@ -80,15 +93,18 @@ class ExampleToolsSelector:
             return result
 
         # Ensure destination directory exists
+        if create_dir:
+            try:
+                dest_category_dir.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                result["error"] = f"Failed to create destination directory: {e}"
+                return result
+
+        # Copy the contents only: new projects don't need the framework's
+        # timestamps or permission bits, and copyfile skips the copystat
+        # syscalls (sendfile on Linux)
         try:
-            dest_category_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            result["error"] = f"Failed to create destination directory: {e}"
-            return result
-
-        # Copy the file
-        try:
-            shutil.copy2(source_file, dest_file)
+            shutil.copyfile(source_file, dest_file)
             result["success"] = True
         except Exception as e:
             result["error"] = f"Failed to copy file: {e}"
@@ -117,12 +133,28 @@ class ExampleToolsSelector:
             "results": [],
         }
 
-        for category, tool_filenames in self.STARTER_TOOLS.items():
-            dest_category_dir = dest_examples_dir / category
-
-            for tool_filename in tool_filenames:
+        # Create each category directory once up front. Categories whose
+        # directory could not be created are left to copy_tool, which
+        # retries and reports the error per tool.
+        created: set[str] = set()
+        for category in self.STARTER_TOOLS:
+            try:
+                (dest_examples_dir / category).mkdir(parents=True, exist_ok=True)
+                created.add(category)
+            except OSError:
+                pass
+
+        jobs = [
+            (category, tool_filename, dest_examples_dir / category, category not in created)
+            for category, tool_filenames in self.STARTER_TOOLS.items()
+            for tool_filename in tool_filenames
+        ]
+
+        # Copies are independent and syscall-bound, so they overlap well in
+        # threads; map() keeps the results in STARTER_TOOLS order
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(jobs)))) as executor:
+            for copy_result in executor.map(lambda job: self.copy_tool(*job), jobs):
                 results["total"] += 1
-                copy_result = self.copy_tool(category, tool_filename, dest_category_dir)
                 results["results"].append(copy_result)
 
                 if copy_result["success"]:
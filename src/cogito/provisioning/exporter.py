@@ -1,6 +1,7 @@
 """Process memory export functionality for various formats."""
 
 import json
+from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
@@ -8,6 +9,62 @@ import yaml
 
 from cogito.contracts.layer_protocols import StorageProtocol
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+# Prefer the LibYAML-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+
+# Separators for compact output. orjson has no spaces after "," and ":",
+# so the standard library fallback omits them too and both produce the same
+# minified document (json.dumps' defaults would add them)
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def _dumps_json(entries: list[dict[str, Any]], pretty: bool) -> str:
+    """Serialize entries as JSON, with orjson when it is installed.
+
+    Args:
+        entries: Process memory entries
+        pretty: Indent with two spaces; otherwise emit compact JSON
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(entries, option=option).decode()
+    if pretty:
+        return json.dumps(entries, indent=2, ensure_ascii=False)
+    return json.dumps(entries, ensure_ascii=False, separators=_COMPACT_SEPARATORS)
+
+
+def _write_json(entries: list[dict[str, Any]], pretty: bool, output_path: Path) -> None:
+    """Write entries as JSON to a file without building a str first.
+
+    With orjson the UTF-8 bytes it produces are written directly; otherwise
+    the standard library streams the document into the file.
+
+    Args:
+        entries: Process memory entries
+        pretty: Indent with two spaces; otherwise emit compact JSON
+        output_path: File to write
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        output_path.write_bytes(orjson.dumps(entries, option=option))
+        return
+    with output_path.open("w", encoding="utf-8") as f:
+        if pretty:
+            json.dump(entries, f, indent=2, ensure_ascii=False)
+        else:
+            json.dump(entries, f, ensure_ascii=False, separators=_COMPACT_SEPARATORS)
+
 
 class ProcessMemoryExporter:
     """Export process memory entries in various formats."""
@@ -40,13 +97,7 @@ class ProcessMemoryExporter:
             IOError: If output_path specified but write fails
         """
         # Get entries (filtered if specified)
-        entries = self.memory_store.list_entries()
-
-        # Apply filters manually
-        if category:
-            entries = [e for e in entries if e.get("type") == category]
-        if tags:
-            entries = [e for e in entries if all(tag in e.get("tags", []) for tag in tags)]
+        entries = self.memory_store.list_entries(category=category, tags=tags)
 
         # Build markdown
         lines = [
@@ -57,50 +108,41 @@ class ProcessMemoryExporter:
         ]
 
         # Group by type
-        by_type: dict[str, list[dict[str, Any]]] = {}
+        by_type: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
         for entry in entries:
-            entry_type = entry.get("type", "Unknown")
-            if entry_type not in by_type:
-                by_type[entry_type] = []
-            by_type[entry_type].append(entry)
+            by_type[entry.get("type", "Unknown")].append(entry)
 
         # Output each type
         for entry_type, type_entries in sorted(by_type.items()):
-            lines.append(f"## {entry_type}")
-            lines.append("")
+            # Each element is a block of lines ending in a blank line, so an
+            # entry costs a few appends rather than one per line
+            lines.append(f"## {entry_type}\n")
 
             for entry in type_entries:
-                lines.append(f"### {entry['id']}: {entry['title']}")
-                lines.append("")
-                lines.append(f"**Summary**: {entry['summary']}")
-                lines.append("")
+                lines.append(
+                    f"### {entry['id']}: {entry['title']}\n\n**Summary**: {entry['summary']}\n"
+                )
 
                 if "rationale" in entry:
-                    lines.append(f"**Rationale**: {entry['rationale']}")
-                    lines.append("")
+                    lines.append(f"**Rationale**: {entry['rationale']}\n")
 
                 if "related_concepts" in entry and entry["related_concepts"]:
                     concepts = ", ".join(entry["related_concepts"])
-                    lines.append(f"**Related Concepts**: {concepts}")
-                    lines.append("")
+                    lines.append(f"**Related Concepts**: {concepts}\n")
 
                 if "tags" in entry and entry["tags"]:
                     tags_str = ", ".join(f"`{tag}`" for tag in entry["tags"])
-                    lines.append(f"**Tags**: {tags_str}")
-                    lines.append("")
+                    lines.append(f"**Tags**: {tags_str}\n")
 
                 if "links" in entry and entry["links"]:
                     links_str = ", ".join(entry["links"])
-                    lines.append(f"**Links**: {links_str}")
-                    lines.append("")
+                    lines.append(f"**Links**: {links_str}\n")
 
                 if "confidence_level" in entry:
                     confidence = entry["confidence_level"]
-                    lines.append(f"**Confidence**: {confidence:.0%}")
-                    lines.append("")
+                    lines.append(f"**Confidence**: {confidence:.0%}\n")
 
-                lines.append("---")
-                lines.append("")
+                lines.append("---\n")
 
         markdown = "\n".join(lines)
 
@@ -116,6 +158,7 @@ class ProcessMemoryExporter:
         category: str | None = None,
         tags: list[str] | None = None,
         pretty: bool = True,
+        return_str: bool = True,
     ) -> str:
         """Export process memory entries as JSON.
 
@@ -123,28 +166,26 @@ class ProcessMemoryExporter:
             output_path: Optional path to write JSON file
             category: Optional filter by entry type/category
             tags: Optional filter by tags (must have all)
-            pretty: Whether to pretty-print JSON (default: True)
+            pretty: Whether to pretty-print JSON (default: True). Compact
+                output has no spaces after separators
+            return_str: If False and output_path is given, write the JSON
+                into the file without building a str, and return ""
 
         Returns:
-            JSON-formatted string
+            JSON-formatted string ("" when streamed to output_path)
 
         Raises:
             IOError: If output_path specified but write fails
         """
         # Get entries (filtered if specified)
-        entries = self.memory_store.list_entries()
+        entries = self.memory_store.list_entries(category=category, tags=tags)
 
-        # Apply filters manually
-        if category:
-            entries = [e for e in entries if e.get("type") == category]
-        if tags:
-            entries = [e for e in entries if all(tag in e.get("tags", []) for tag in tags)]
+        if output_path and not return_str:
+            _write_json(entries, pretty, output_path)
+            return ""
 
         # Convert to JSON
-        if pretty:
-            json_str = json.dumps(entries, indent=2, ensure_ascii=False)
-        else:
-            json_str = json.dumps(entries, ensure_ascii=False)
+        json_str = _dumps_json(entries, pretty)
 
         # Write to file if specified
         if output_path:
@@ -172,17 +213,12 @@ class ProcessMemoryExporter:
             IOError: If output_path specified but write fails
         """
         # Get entries (filtered if specified)
-        entries = self.memory_store.list_entries()
-
-        # Apply filters manually
-        if category:
-            entries = [e for e in entries if e.get("type") == category]
-        if tags:
-            entries = [e for e in entries if all(tag in e.get("tags", []) for tag in tags)]
+        entries = self.memory_store.list_entries(category=category, tags=tags)
 
         # Convert to YAML
         yaml_str = yaml.dump(
             entries,
+            Dumper=_SafeDumper,
             default_flow_style=False,
             allow_unicode=True,
             sort_keys=False,
@@ -1,5 +1,8 @@
 """Session handover document generation from process memory."""
 
+import heapq
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -7,6 +10,28 @@ from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from cogito.contracts.layer_protocols import StorageProtocol
 
+# Built-in templates: templates/ under the framework root
+_PACKAGE_TEMPLATES = str(Path(__file__).parents[3] / "templates")
+
+
+@lru_cache(maxsize=8)
+def _get_env(templates_dir: str) -> Environment:
+    """Get the shared handover Environment for a templates directory.
+
+    Sharing one Environment per directory also shares its compiled
+    template cache across generator instances.
+
+    Args:
+        templates_dir: Directory containing handover templates
+
+    Returns:
+        Jinja2 environment loading from templates_dir
+    """
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=select_autoescape(["html", "xml"]),
+    )
+
 
 class HandoverGenerator:
     """Generate comprehensive session handover documents from process memory."""
@@ -25,19 +50,20 @@ class HandoverGenerator:
         """
         self.memory_store = memory_store
 
-        # Set up Jinja2 environment
+        # Jinja2 environment, fetched on first use
         if templates_dir and templates_dir.exists():
-            loader = FileSystemLoader(str(templates_dir))
+            self._templates_dir = str(templates_dir)
         else:
             # Use package templates
-            loader = FileSystemLoader(
-                str(Path(__file__).parent.parent.parent.parent / "templates")
-            )
+            self._templates_dir = _PACKAGE_TEMPLATES
+        self._env: Environment | None = None
 
-        self.env = Environment(
-            loader=loader,
-            autoescape=select_autoescape(["html", "xml"]),
-        )
+    @property
+    def env(self) -> Environment:
+        """Jinja2 environment for handover templates, shared per directory."""
+        if self._env is None:
+            self._env = _get_env(self._templates_dir)
+        return self._env
 
     def generate_handover_document(
         self,
@@ -59,54 +85,62 @@ class HandoverGenerator:
         # Get all entries (with or without deprecated based on flag)
         all_entries = self.memory_store.list_entries(include_deprecated=include_deprecated)
 
-        # Organize entries by type
-        by_type: dict[str, list[dict[str, Any]]] = {}
+        # Organize entries by type, count confidence levels and collect key
+        # concepts in a single pass
+        by_type: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        high_confidence = medium_confidence = low_confidence = 0
+        all_concepts: set[str] = set()
         for entry in all_entries:
-            entry_type = entry.get("type", "Unknown")
-            if entry_type not in by_type:
-                by_type[entry_type] = []
-            by_type[entry_type].append(entry)
+            by_type[entry.get("type", "Unknown")].append(entry)
+
+            confidence = entry.get("confidence_level", 0)
+            if confidence >= 0.9:
+                high_confidence += 1
+            elif confidence >= 0.7:
+                medium_confidence += 1
+            else:
+                low_confidence += 1
+
+            concepts = entry.get("related_concepts")
+            if concepts:
+                all_concepts.update(concepts)
 
         # Calculate statistics
         stats = {
             "total_entries": len(all_entries),
             "by_type": {t: len(entries) for t, entries in by_type.items()},
-            "high_confidence": len([e for e in all_entries if e.get("confidence_level", 0) >= 0.9]),
-            "medium_confidence": len(
-                [e for e in all_entries if 0.7 <= e.get("confidence_level", 0) < 0.9]
-            ),
-            "low_confidence": len([e for e in all_entries if e.get("confidence_level", 0) < 0.7]),
+            "high_confidence": high_confidence,
+            "medium_confidence": medium_confidence,
+            "low_confidence": low_confidence,
         }
 
-        # Extract key concepts
-        all_concepts: set[str] = set()
-        for entry in all_entries:
-            concepts = entry.get("related_concepts", [])
-            if concepts:
-                all_concepts.update(concepts)
-
         # Get recent entries (last 10)
-        recent_entries = sorted(
-            all_entries,
-            key=lambda e: e.get("timestamp_created", ""),
-            reverse=True,
-        )[:10]
+        # Same result as sorted(..., reverse=True)[:10], ties included, without
+        # sorting every entry
+        recent_entries = heapq.nlargest(
+            10, all_entries, key=lambda e: e.get("timestamp_created", "")
+        )
 
         # Prepare template context
         context = {
             "stats": stats,
-            "by_type": by_type,
+            # Plain dict, so a missing type stays undefined in the template
+            "by_type": dict(by_type),
             "recent_entries": recent_entries,
-            "key_concepts": sorted(all_concepts),
             "all_entries": all_entries,
         }
 
         # Render template
         try:
             template = self.env.get_template("handover_document.md.j2")
+            # The template may use every concept, so the full sorted list is
+            # only built once it is known to be needed
+            context["key_concepts"] = sorted(all_concepts)
             handover_doc = template.render(**context)
         except Exception:
-            # Fallback to simple handover if template missing
+            # Fallback to simple handover if template missing; it lists only
+            # the first 20 concepts
+            context["key_concepts"] = heapq.nsmallest(20, all_concepts)
             handover_doc = self._generate_simple_handover(context)
 
         # Write to file if specified
@@ -119,7 +153,8 @@ class HandoverGenerator:
         """Generate simple handover document without template.
 
         Args:
-            context: Template context dictionary
+            context: Template context dictionary, with at most 20 sorted
+                key_concepts
 
         Returns:
             Markdown-formatted handover document
@@ -169,7 +204,7 @@ class HandoverGenerator:
         ])
 
         # Add key concepts
-        for concept in context["key_concepts"][:20]:
+        for concept in context["key_concepts"]:
             lines.append(f"- {concept}")
 
         lines.extend([
@@ -8,12 +8,21 @@ import yaml
 
 from cogito.contracts.layer_protocols import StorageProtocol
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+# Parser for JSONL lines. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so both are handled the same way
+_loads = json.loads if orjson is None else orjson.loads
+
 
 class ProcessMemoryImporter:
     """Import process memory entries from external files with validation."""
 
     # Required fields for process memory entries
-    REQUIRED_FIELDS = {"id", "type", "title", "summary"}
+    REQUIRED_FIELDS = frozenset({"id", "type", "title", "summary"})
 
     def __init__(self, memory_store: StorageProtocol) -> None:
         """Initialize importer with memory store.
@@ -74,6 +83,9 @@ class ProcessMemoryImporter:
     ) -> tuple[int, list[str]]:
         """Import process memory entries from JSONL file.
 
+        Each line is validated as soon as it is parsed, so the entries are
+        walked only once.
+
         Args:
             file_path: Path to JSONL file
             merge: If True, merge with existing entries. If False, validation only.
@@ -85,16 +97,18 @@ class ProcessMemoryImporter:
             FileNotFoundError: If file_path doesn't exist
             json.JSONDecodeError: If any line is not valid JSON
         """
-        # Load JSONL
-        entries = []
+        validation_errors = []
+        valid_entries = []
+
+        # Load and validate JSONL
         with file_path.open("r", encoding="utf-8") as f:
+            index = 0
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    entry = json.loads(line)
-                    entries.append(entry)
+                    entry = _loads(line)
                 except json.JSONDecodeError as e:
                     raise json.JSONDecodeError(
                         f"Invalid JSON on line {line_num}: {e.msg}",
@@ -102,8 +116,14 @@ class ProcessMemoryImporter:
                         e.pos,
                     ) from e
 
-        # Validate and import
-        return self._validate_and_import(entries, merge)
+                error = self._validate_entry(index, entry)
+                if error:
+                    validation_errors.append(error)
+                else:
+                    valid_entries.append(entry)
+                index += 1
+
+        return self._import_valid(valid_entries, validation_errors, merge)
 
     def _validate_and_import(
         self, data: Any, merge: bool
@@ -130,71 +150,77 @@ class ProcessMemoryImporter:
 
         # Validate each entry
         for i, entry in enumerate(entries):
-            if not isinstance(entry, dict):
-                validation_errors.append(
-                    f"Entry {i}: Not a dictionary (got {type(entry).__name__})"
-                )
-                continue
-
-            # Check required fields
-            missing_fields = self.REQUIRED_FIELDS - set(entry.keys())
-            if missing_fields:
-                validation_errors.append(
-                    f"Entry {i} ({entry.get('id', 'unknown')}): "
-                    f"Missing required fields: {missing_fields}"
-                )
-                continue
-
-            # Validate field types
-            if not isinstance(entry.get("id"), str):
-                validation_errors.append(
-                    f"Entry {i}: 'id' must be a string"
-                )
-                continue
-
-            if not isinstance(entry.get("type"), str):
-                validation_errors.append(
-                    f"Entry {i} ({entry['id']}): 'type' must be a string"
-                )
-                continue
-
-            if not isinstance(entry.get("title"), str):
-                validation_errors.append(
-                    f"Entry {i} ({entry['id']}): 'title' must be a string"
-                )
-                continue
-
-            if not isinstance(entry.get("summary"), str):
-                validation_errors.append(
-                    f"Entry {i} ({entry['id']}): 'summary' must be a string"
-                )
-                continue
-
-            # Validate optional fields if present
-            if "tags" in entry and not isinstance(entry["tags"], list):
-                validation_errors.append(
-                    f"Entry {i} ({entry['id']}): 'tags' must be a list"
-                )
-                continue
-
-            if "links" in entry and not isinstance(entry["links"], list):
-                validation_errors.append(
-                    f"Entry {i} ({entry['id']}): 'links' must be a list"
-                )
-                continue
-
-            if "related_concepts" in entry and not isinstance(entry["related_concepts"], list):
-                validation_errors.append(
-                    f"Entry {i} ({entry['id']}): 'related_concepts' must be a list"
-                )
-                continue
-
-            # Entry is valid
-            valid_entries.append(entry)
+            error = self._validate_entry(i, entry)
+            if error:
+                validation_errors.append(error)
+            else:
+                valid_entries.append(entry)
 
+        return self._import_valid(valid_entries, validation_errors, merge)
+
+    def _import_valid(
+        self, valid_entries: list[dict[str, Any]], validation_errors: list[str], merge: bool
+    ) -> tuple[int, list[str]]:
+        """Optionally import validated entries.
+
+        Args:
+            valid_entries: Entries that passed validation
+            validation_errors: Errors for the entries that did not
+            merge: If True, add entries to store. If False, validation only.
+
+        Returns:
+            Tuple of (number_of_valid_entries, list_of_validation_errors)
+        """
         # Import if merge=True and there are valid entries
         if merge and valid_entries:
-            for entry in valid_entries:
-                self.memory_store.append_entry(entry)
+            self.memory_store.append_entries(valid_entries)
 
         return (len(valid_entries), validation_errors)
+
+    def _validate_entry(self, i: int, entry: Any) -> str | None:
+        """Validate a single entry.
+
+        Args:
+            i: Position of the entry, used in error messages
+            entry: Candidate entry
+
+        Returns:
+            Validation error message, or None if the entry is valid
+        """
+        if not isinstance(entry, dict):
+            return f"Entry {i}: Not a dictionary (got {type(entry).__name__})"
+
+        # Check required fields; the keys view comparison allocates nothing
+        # for the common, complete entry
+        if not entry.keys() >= self.REQUIRED_FIELDS:
+            missing_fields = self.REQUIRED_FIELDS - entry.keys()
+            return (
+                f"Entry {i} ({entry.get('id', 'unknown')}): "
+                f"Missing required fields: {missing_fields}"
+            )
+
+        # Validate field types
+        if not isinstance(entry["id"], str):
+            return f"Entry {i}: 'id' must be a string"
+
+        if not isinstance(entry["type"], str):
+            return f"Entry {i} ({entry['id']}): 'type' must be a string"
+
+        if not isinstance(entry["title"], str):
+            return f"Entry {i} ({entry['id']}): 'title' must be a string"
+
+        if not isinstance(entry["summary"], str):
+            return f"Entry {i} ({entry['id']}): 'summary' must be a string"
+
+        # Validate optional fields if present
+        if "tags" in entry and not isinstance(entry["tags"], list):
+            return f"Entry {i} ({entry['id']}): 'tags' must be a list"
+
+        if "links" in entry and not isinstance(entry["links"], list):
+            return f"Entry {i} ({entry['id']}): 'links' must be a list"
+
+        if "related_concepts" in entry and not isinstance(entry["related_concepts"], list):
+            return f"Entry {i} ({entry['id']}): 'related_concepts' must be a list"
+
+        # Entry is valid
+        return None
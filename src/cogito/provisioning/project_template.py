@@ -5,9 +5,13 @@ instances and provides functions to generate the directory tree.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# Key prefixes used by get_file_locations, one per structure section
+_TEMPLATE_KEY_PREFIXES = ("", "src_cogito_", "tests_", "docs_", "config_", "bootstrap_")
+
 
 @dataclass
 class ProjectStructure:
@@ -97,8 +101,10 @@ def create_project_directories(
         errors.append(f"Failed to create root directory {project_root}: {e}")
         return {"directories_created": directories_created, "errors": errors}
 
-    # Define all directories to create
+    # Define all directories to create, each after its parent, so every
+    # mkdir below succeeds in one call without creating missing ancestors
     directories = [
+        project_root / "src",
         project_root / "src" / "cogito",
         project_root / "tests",
         project_root / "docs",
@@ -131,6 +137,22 @@ def create_project_directories(
     return {"directories_created": directories_created, "errors": errors}
 
 
+def _template_key(prefix: str, filename: str) -> str:
+    """Build the template name for a generated file.
+
+    Args:
+        prefix: Structure section prefix (e.g. "docs_", or "" for root files)
+        filename: Name of the generated file
+
+    Returns:
+        Template name such as "docs_QUICK_START_md_j2"
+    """
+    key = filename.replace(".", "_")
+    if prefix == "docs_":
+        key = key.replace("-", "_")
+    return f"{prefix}{key}_j2"
+
+
 def get_file_locations(project_root: Path, structure: ProjectStructure) -> dict[str, Path]:
     """Get full paths for all template files to be generated.
 
@@ -145,32 +167,59 @@ def get_file_locations(project_root: Path, structure: ProjectStructure) -> dict[
 
     # Root files
     for filename in structure.root_files:
-        template_name = filename.replace(".", "_") + "_j2"
+        template_name = _template_key("", filename)
         locations[template_name] = project_root / filename
 
     # src/cogito files
     for filename in structure.src_cogito_files:
-        template_name = f"src_cogito_{filename.replace('.', '_')}_j2"
+        template_name = _template_key("src_cogito_", filename)
         locations[template_name] = project_root / "src" / "cogito" / filename
 
     # tests files
     for filename in structure.tests_files:
-        template_name = f"tests_{filename.replace('.', '_')}_j2"
+        template_name = _template_key("tests_", filename)
         locations[template_name] = project_root / "tests" / filename
 
     # docs files
     for filename in structure.docs_files:
-        template_name = f"docs_{filename.replace('.', '_').replace('-', '_')}_j2"
+        template_name = _template_key("docs_", filename)
         locations[template_name] = project_root / "docs" / filename
 
     # config files
     for filename in structure.config_files:
-        template_name = f"config_{filename.replace('.', '_')}_j2"
+        template_name = _template_key("config_", filename)
         locations[template_name] = project_root / "config" / filename
 
     # bootstrap files
     for filename in structure.bootstrap_files:
-        template_name = f"bootstrap_{filename.replace('.', '_')}_j2"
+        template_name = _template_key("bootstrap_", filename)
         locations[template_name] = project_root / ".bootstrap" / filename
 
     return locations
+
+
+@lru_cache(maxsize=8)
+def get_template_filenames(template_dir: Path) -> dict[str, str]:
+    """Get the template file for every template name get_file_locations can produce.
+
+    The template directory is scanned once and its naming scheme inverted,
+    so lookups need no per-bootstrap string munging.
+
+    Args:
+        template_dir: Directory containing bootstrap templates
+
+    Returns:
+        Dictionary mapping template names (e.g. "docs_QUICK_START_md_j2") to
+        template file names (e.g. "QUICK-START.md.j2")
+    """
+    filenames: dict[str, str] = {}
+    if not template_dir.is_dir():
+        return filenames
+
+    for path in template_dir.iterdir():
+        if not path.is_file() or path.suffix != ".j2":
+            continue
+        for prefix in _TEMPLATE_KEY_PREFIXES:
+            filenames[_template_key(prefix, path.stem)] = path.name
+
+    return filenames
@@ -4,7 +4,10 @@ import re
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound, select_autoescape
+
+# Built-in templates: templates/ under the framework root
+_PACKAGE_TEMPLATES = str(Path(__file__).parents[3] / "templates")
 
 
 class SkillGenerator:
@@ -15,6 +18,18 @@ class SkillGenerator:
     MAX_DESCRIPTION_LENGTH = 1024
     FORBIDDEN_NAME_PATTERNS = ["anthropic", "claude"]
 
+    # When-to-use guidance by tool category
+    CATEGORY_HINTS = {
+        "metacognition": "working through complex problems step-by-step",
+        "review": "conducting code or system reviews",
+        "handoff": "documenting decisions or transferring knowledge",
+        "debugging": "investigating errors or unexpected behavior",
+        "planning": "designing architecture or breaking down tasks",
+    }
+
+    # Runs of anything but lowercase letters and digits, hyphens included
+    _NAME_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
     def __init__(self, templates_dir: Path | None = None) -> None:
         """Initialize skill generator.
 
@@ -27,15 +42,16 @@ class SkillGenerator:
             loader = FileSystemLoader(str(templates_dir))
         else:
             # Use package templates
-            loader = FileSystemLoader(
-                str(Path(__file__).parent.parent.parent.parent / "templates")
-            )
+            loader = FileSystemLoader(_PACKAGE_TEMPLATES)
 
         self.env = Environment(
             loader=loader,
             autoescape=select_autoescape([]),
         )
 
+        # Templates by name, loaded on first use (None if missing)
+        self._templates: dict[str, Template | None] = {}
+
     def generate_skill_name(self, display_name: str) -> str:
         """Convert display name to skill name format.
 
@@ -51,11 +67,9 @@ class SkillGenerator:
         # Convert to lowercase
         name = display_name.lower()
 
-        # Replace spaces and special chars with hyphens
-        name = re.sub(r"[^a-z0-9-]", "-", name)
-
-        # Remove consecutive hyphens
-        name = re.sub(r"-+", "-", name)
+        # Replace spaces and special chars with hyphens, collapsing runs into
+        # a single hyphen
+        name = self._NAME_SEPARATOR_RE.sub("-", name)
 
         # Strip leading/trailing hyphens
         name = name.strip("-")
@@ -116,17 +130,9 @@ class SkillGenerator:
             When-to-use clause
         """
         # Extract category-based guidance
-        category = metadata.get("category", "")
-        category_hints = {
-            "metacognition": "working through complex problems step-by-step",
-            "review": "conducting code or system reviews",
-            "handoff": "documenting decisions or transferring knowledge",
-            "debugging": "investigating errors or unexpected behavior",
-            "planning": "designing architecture or breaking down tasks",
-        }
-
-        if category in category_hints:
-            return category_hints[category]
+        hint = self.CATEGORY_HINTS.get(metadata.get("category", ""))
+        if hint is not None:
+            return hint
 
         # Extract from tags
         tags = metadata.get("tags", [])
@@ -177,12 +183,11 @@ class SkillGenerator:
         }
 
         # Render template
-        try:
-            template = self.env.get_template("SKILL.md.j2")
-            return template.render(**context)
-        except Exception:
+        template = self._get_template("SKILL.md.j2")
+        if template is None:
             # Fallback to simple generation if template missing
             return self._generate_simple_skill_md(context)
+        return template.render(**context)
 
     def _generate_simple_skill_md(self, context: dict[str, Any]) -> str:
         """Generate simple SKILL.md without template.
@@ -195,16 +200,19 @@ class SkillGenerator:
         """
         metadata = context["metadata"]
         parameters = context["parameters"]
+        tool_name = metadata.get("name", "tool")
 
         # Build frontmatter
-        frontmatter = f"""---
+        parts = [
+            f"""---
 name: {context['skill_name']}
 description: {context['description']}
 ---
 """
+        ]
 
         # Build instructions
-        instructions = f"""# {context['display_name']}
+        parts.append(f"""# {context['display_name']}
 
 ## Instructions
 
@@ -214,48 +222,45 @@ description: {context['description']}
 - {self._infer_use_cases(metadata, parameters)}
 
 **Parameters:**
-"""
+""")
 
         # Add parameter docs
         if parameters and "properties" in parameters:
+            required_params = parameters.get("required", [])
             for param_name, param_spec in parameters["properties"].items():
-                required = param_name in parameters.get("required", [])
-                req_str = "required" if required else "optional"
+                req_str = "required" if param_name in required_params else "optional"
                 param_desc = param_spec.get("description", "No description")
-                instructions += f"- `{param_name}` ({req_str}): {param_desc}\n"
+                parts.append(f"- `{param_name}` ({req_str}): {param_desc}\n")
 
-        instructions += f"""
+        parts.append(f"""
 **Execution:**
 ```bash
-cogito execute {metadata.get('name', 'tool')} \\
+cogito execute {tool_name} \\
   --parameter "value"
 ```
 
 **Output:** Structured prompts or guidance based on parameters.
-"""
+""")
 
         # Build examples section
-        examples = "\n## Examples\n\n"
-        tool_examples = metadata.get("examples", [])
-        if tool_examples:
-            for i, example in enumerate(tool_examples, 1):
-                examples += f"### Example {i}\n```bash\n"
-                examples += f"cogito execute {metadata.get('name', 'tool')}"
-                if isinstance(example, dict) and "parameters" in example:
-                    for k, v in example["parameters"].items():
-                        examples += f' \\\n  --{k} "{v}"'
-                examples += "\n```\n\n"
+        parts.append("\n## Examples\n\n")
+        for i, example in enumerate(metadata.get("examples") or [], 1):
+            parts.append(f"### Example {i}\n```bash\ncogito execute {tool_name}")
+            if isinstance(example, dict) and "parameters" in example:
+                for k, v in example["parameters"].items():
+                    parts.append(f' \\\n  --{k} "{v}"')
+            parts.append("\n```\n\n")
 
         # Build reference section
-        reference = f"""
+        parts.append(f"""
 ## Reference
 
 **Category:** {metadata.get('category', 'unknown')}
 **Tags:** {', '.join(metadata.get('tags', []))}
 **Source:** {context['source_path']}
-"""
+""")
 
-        return frontmatter + instructions + examples + reference
+        return "".join(parts)
 
     def generate_bash_wrapper(self, tool_name: str) -> str:
         """Generate bash execution wrapper script.
@@ -266,12 +271,12 @@ cogito execute {metadata.get('name', 'tool')} \\
         Returns:
             Bash script content
         """
-        try:
-            template = self.env.get_template("execute.sh.j2")
+        template = self._get_template("execute.sh.j2")
+        if template is not None:
             return template.render(tool_name=tool_name)
-        except Exception:
-            # Fallback to simple wrapper
-            return f"""#!/usr/bin/env bash
+
+        # Fallback to simple wrapper
+        return f"""#!/usr/bin/env bash
 # Auto-generated execution wrapper for {tool_name}
 set -euo pipefail
 
@@ -281,3 +286,25 @@ COGITO_BIN="${{COGITO_BIN:-cogito}}"
 # Execute thinking tool via CLI
 exec "$COGITO_BIN" execute "$TOOL_NAME" "$@"
 """
+
+    def _get_template(self, name: str) -> Template | None:
+        """Get a template by name, loading it only once per generator.
+
+        Holding the template skips Jinja2's per-call cache lookup and its
+        up-to-date check, which stats the template file.
+
+        Args:
+            name: Template file name
+
+        Returns:
+            Loaded template, or None if the templates directory lacks it
+        """
+        try:
+            return self._templates[name]
+        except KeyError:
+            try:
+                template: Template | None = self.env.get_template(name)
+            except TemplateNotFound:
+                template = None
+            self._templates[name] = template
+            return template
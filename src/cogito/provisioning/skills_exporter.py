@@ -1,6 +1,7 @@
 """Skills export functionality for thinking tools."""
 
 import os
+import shutil
 from pathlib import Path
 from typing import Any
 
@@ -88,10 +89,8 @@ class SkillsExporter:
                 symlink_path.symlink_to(source_path.resolve())
             except OSError:
                 # Symlink failed (e.g., Windows without permissions)
-                # Copy file instead
-                symlink_path.write_text(
-                    source_path.read_text(encoding="utf-8"), encoding="utf-8"
-                )
+                # Copy file instead (byte-for-byte, done by the OS where supported)
+                shutil.copyfile(source_path, symlink_path)
 
         return {
             "skill_name": skill_name,
@@ -117,17 +116,8 @@ class SkillsExporter:
         Returns:
             Dictionary with export results
         """
-        # Get tools in category
-        all_tool_names = self.registry.list_tools()
-        category_tools: list[str] = []
-
-        # Filter by category
-        for tool_name in all_tool_names:
-            tool_spec = self.registry.get_tool(tool_name)
-            if tool_spec:
-                metadata = tool_spec.get("metadata", {})
-                if metadata.get("category") == category:
-                    category_tools.append(tool_name)
+        # Get tools in category from the registry's category index
+        category_tools = self.registry.get_tools_by_category(category)
 
         results: dict[str, Any] = {
             "category": category,
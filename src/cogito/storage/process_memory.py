@@ -52,29 +52,49 @@ class ProcessMemoryStore:
         Raises:
             ProcessMemoryError: If entry is invalid or append fails
         """
-        # Validate entry has required fields
-        if "id" not in entry:
-            raise ProcessMemoryError("Entry must have 'id' field")
+        self.append_entries([entry])
 
-        # Add timestamp if not present
-        if "timestamp_created" not in entry:
-            entry["timestamp_created"] = datetime.utcnow().isoformat()
+    def append_entries(self, entries: list[dict[str, Any]]) -> None:
+        """Append several entries to process memory in one write.
 
-        # Ensure deprecated field exists
-        if "deprecated" not in entry:
-            entry["deprecated"] = False
+        Every entry is validated before anything is written, so an invalid
+        entry leaves the file unchanged.
+
+        Args:
+            entries: Process memory entries (each must have 'id' field)
+
+        Raises:
+            ProcessMemoryError: If any entry is invalid or append fails
+        """
+        for entry in entries:
+            # Validate entry has required fields
+            if "id" not in entry:
+                raise ProcessMemoryError("Entry must have 'id' field")
+
+            # Add timestamp if not present
+            if "timestamp_created" not in entry:
+                entry["timestamp_created"] = datetime.utcnow().isoformat()
+
+            # Ensure deprecated field exists
+            if "deprecated" not in entry:
+                entry["deprecated"] = False
+
+        if not entries:
+            return
 
         try:
+            data = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+
             # Append to file (create if doesn't exist)
             self._memory_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(self._memory_path, "a", encoding="utf-8") as f:
-                json.dump(entry, f, ensure_ascii=False)
-                f.write("\n")
+                f.write(data)
 
             # Update cache if loaded
             if self._cache_loaded:
-                self._cache[entry["id"]] = entry
+                for entry in entries:
+                    self._cache[entry["id"]] = entry
 
         except Exception as e:
             raise ProcessMemoryError(f"Failed to append entry: {e}") from e
@@ -139,6 +159,9 @@ class ProcessMemoryStore:
         """
         self._ensure_cache_loaded()
 
+        # Built once so each entry is checked with a single C-level subset test
+        required_tags = frozenset(tags) if tags else None
+
         results = []
         for entry in self._cache.values():
             # Skip deprecated unless explicitly included
@@ -150,10 +173,8 @@ class ProcessMemoryStore:
                 continue
 
             # Filter by tags
-            if tags:
-                entry_tags = entry.get("tags", [])
-                if not all(tag in entry_tags for tag in tags):
-                    continue
+            if required_tags and not required_tags.issubset(entry.get("tags", [])):
+                continue
 
             results.append(entry)
 
@@ -180,6 +201,8 @@ class ProcessMemoryStore:
         if not self._memory_path.exists():
             return
 
+        required_tags = frozenset(tags) if tags else None
+
         try:
             with open(self._memory_path, encoding="utf-8") as f:
                 for line in f:
@@ -200,10 +223,8 @@ class ProcessMemoryStore:
                     if category and entry.get("type") != category:
                         continue
 
-                    if tags:
-                        entry_tags = entry.get("tags", [])
-                        if not all(tag in entry_tags for tag in tags):
-                            continue
+                    if required_tags and not required_tags.issubset(entry.get("tags", [])):
+                        continue
 
                     yield entry
 
@@ -281,6 +302,8 @@ class ProcessMemoryStore:
         """
         self._ensure_cache_loaded()
 
+        required_tags = frozenset(tags) if tags else None
+
         results = []
 
         for entry in self._cache.values():
@@ -293,10 +316,8 @@ class ProcessMemoryStore:
                 continue
 
             # Filter by tags
-            if tags:
-                entry_tags = entry.get("tags", [])
-                if not all(tag in entry_tags for tag in tags):
-                    continue
+            if required_tags and not required_tags.issubset(entry.get("tags", [])):
+                continue
 
             # Search by keyword if provided
             if keyword:
@@ -9,8 +9,10 @@ import click
 
 from cogito import __version__
 from cogito.contracts.layer_protocols import (
+    TRANSPORTS,
     StorageProtocol,
     ToolRegistryProtocol,
+    Transport,
 )
 from cogito.orchestration.executor import ToolExecutor
 from cogito.orchestration.registry import ToolRegistry
@@ -361,7 +363,7 @@ def memory_export(
         if format == "markdown":
             result = exporter.export_to_markdown(output, category)
         elif format == "json":
-            result = exporter.export_to_json(output, category)
+            result = exporter.export_to_json(output, category, return_str=output is None)
         else:  # yaml
             result = exporter.export_to_yaml(output, category)
 
@@ -899,7 +901,21 @@ def bootstrap(
     default=None,
     help="Path to process_memory.jsonl file",
 )
-def serve(tools_dir: Path | None, memory_file: Path | None) -> None:
+@click.option(
+    "--transport",
+    type=click.Choice(TRANSPORTS),
+    default="stdio",
+    help="MCP transport (http keeps one long-lived server for many clients)",
+)
+@click.option("--host", default="127.0.0.1", help="Bind address for http/sse")
+@click.option("--port", type=int, default=8000, help="Port for http/sse")
+def serve(
+    tools_dir: Path | None,
+    memory_file: Path | None,
+    transport: Transport,
+    host: str,
+    port: int,
+) -> None:
     """Start MCP server for thinking tools.
 
     This command starts the FastMCP server, making thinking tools
@@ -907,7 +923,7 @@ def serve(tools_dir: Path | None, memory_file: Path | None) -> None:
     """
     try:
         # Import here to avoid circular dependency
-        from cogito.integration.mcp_server import create_server, mcp
+        from cogito.integration.mcp_server import create_server, run_server
 
         # Default to examples directory
         if tools_dir is None:
@@ -922,9 +938,11 @@ def serve(tools_dir: Path | None, memory_file: Path | None) -> None:
         click.echo(f"Starting MCP server with tools from {tools_dir}")
         if memory_file:
             click.echo(f"Process memory: {memory_file}")
+        if transport != "stdio":
+            click.echo(f"Serving over {transport} at {host}:{port}")
 
         # Run server
-        mcp.run()
+        run_server(transport, host=host, port=port)
 
     except Exception as e:
         raise click.ClickException(str(e)) from e
@@ -1,8 +1,9 @@
 """Unit tests for bootstrap orchestrator."""
 
+import os
 from pathlib import Path
 
-from cogito.provisioning.bootstrap import ProjectBootstrapper
+from cogito.provisioning.bootstrap import ProjectBootstrapper, _write_if_changed
 
 
 class TestProjectBootstrapper:
@@ -24,6 +25,13 @@ class TestProjectBootstrapper:
 
         assert bootstrapper.template_dir == template_dir
 
+    def test_initialization_shares_jinja_environment(self) -> None:
+        """Test the bootstrapper and its config generator share one Environment."""
+        bootstrapper = ProjectBootstrapper()
+
+        assert bootstrapper.jinja_env is bootstrapper.config_generator.env
+        assert ProjectBootstrapper().jinja_env is bootstrapper.jinja_env
+
     def test_bootstrap_project_basic(self, tmp_path: Path) -> None:
         """Test bootstrapping a basic project."""
         bootstrapper = ProjectBootstrapper()
@@ -43,6 +51,7 @@ class TestProjectBootstrapper:
         assert project_root.exists()
         assert (project_root / "src" / "cogito").exists()
         assert (project_root / "config").exists()
+        assert (project_root / "LICENSE").exists()
 
     def test_bootstrap_project_with_examples(self, tmp_path: Path) -> None:
         """Test bootstrapping project with example tools."""
@@ -155,3 +164,16 @@ class TestProjectBootstrapper:
             content = imperatives.read_text(encoding="utf-8")
             assert len(content) > 0
             assert "Imperative" in content  # Basic content check
+
+
+def test_write_if_changed_skips_identical_content(tmp_path: Path) -> None:
+    """Test unchanged files are not rewritten and changed files are."""
+    path = tmp_path / "README.md"
+    _write_if_changed(path, "# Project\n")
+    os.utime(path, (0, 0))
+
+    _write_if_changed(path, "# Project\n")
+    assert path.stat().st_mtime == 0
+
+    _write_if_changed(path, "# Renamed\n")
+    assert path.read_text(encoding="utf-8") == "# Renamed\n"
@@ -517,6 +517,25 @@ class TestCLIServe:
         assert "Starting MCP server" in result.output
 
 
+    @patch("cogito.integration.mcp_server.mcp")
+    @patch("cogito.integration.mcp_server.create_server")
+    def test_serve_http_transport(
+        self,
+        mock_create_server: MagicMock,
+        mock_mcp: MagicMock,
+        cli_runner: CliRunner,
+        tmp_path: Path,
+    ) -> None:
+        """Test serve command passes http transport, host and port to FastMCP."""
+        result = cli_runner.invoke(
+            cli,
+            ["serve", "--tools-dir", str(tmp_path), "--transport", "http", "--port", "9000"],
+        )
+
+        assert result.exit_code == 0
+        mock_mcp.run.assert_called_once_with(transport="http", host="127.0.0.1", port=9000)
+        assert "Serving over http at 127.0.0.1:9000" in result.output
+
 class TestCLIDebugMode:
     """Test CLI debug mode."""
 
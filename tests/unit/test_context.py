@@ -101,6 +101,38 @@ def test_generate_context_with_related_entries(temp_memory_store: ProcessMemoryS
         assert "test-002" in context
 
 
+def test_generate_context_related_entries_in_link_order(tmp_path: Path) -> None:
+    """Test related entries follow link order, once each, excluding primaries."""
+    store = ProcessMemoryStore(tmp_path / "memory.jsonl")
+    store.append_entry({
+        "id": "pm-001",
+        "type": "StrategicDecision",
+        "title": "Caching plan",
+        "summary": "Cache compiled templates",
+        "links": ["pm-004", "pm-002", "pm-003", "pm-004"],
+    })
+    store.append_entry({
+        "id": "pm-002",
+        "type": "LessonLearned",
+        "title": "Caching pitfalls",
+        "summary": "Invalidate on change",
+    })
+    for entry_id in ("pm-003", "pm-004"):
+        store.append_entry({
+            "id": entry_id,
+            "type": "Observation",
+            "title": f"Note {entry_id}",
+            "summary": "Unrelated",
+        })
+
+    context = ContextGenerator(store).generate_context_for_topic("Caching")
+
+    related = context.split("## Related Entries", 1)[1]
+    assert "2 additional entries" in related
+    assert related.index("pm-004") < related.index("pm-003")
+    assert "pm-002" not in related
+
+
 def test_generate_context_without_related(temp_memory_store: ProcessMemoryStore) -> None:
     """Test excluding related entries."""
     generator = ContextGenerator(temp_memory_store)
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from cogito.provisioning.example_tools import ExampleToolsSelector
 
 
@@ -49,6 +51,12 @@ class TestExampleToolsSelector:
         # Should not affect the other
         assert "new_tool.yml" not in tools2["metacognition"]
 
+    def test_starter_tools_constant_is_read_only(self) -> None:
+        """Test that the shared STARTER_TOOLS constant cannot be modified."""
+        with pytest.raises(TypeError):
+            ExampleToolsSelector.STARTER_TOOLS["review"] = ("x.yml",)  # type: ignore[index]
+        assert isinstance(ExampleToolsSelector.STARTER_TOOLS["metacognition"], tuple)
+
     def test_copy_tool_success(self, tmp_path: Path) -> None:
         """Test successfully copying a tool file."""
         selector = ExampleToolsSelector()
@@ -103,6 +111,23 @@ class TestExampleToolsSelector:
             all_tools = list(dest_examples_dir.rglob("*.yml"))
             assert len(all_tools) > 0
 
+    def test_copy_starter_tools_preserves_order(self, tmp_path: Path) -> None:
+        """Test results come back in STARTER_TOOLS order despite concurrent copies."""
+        selector = ExampleToolsSelector()
+
+        result = selector.copy_starter_tools(tmp_path / "examples")
+
+        expected = [
+            f"{category}/{filename}"
+            for category, filenames in ExampleToolsSelector.STARTER_TOOLS.items()
+            for filename in filenames
+        ]
+        destinations = [
+            Path(r["destination"]).relative_to(tmp_path / "examples").as_posix()
+            for r in result["results"]
+        ]
+        assert destinations == expected
+
     def test_copy_starter_tools_with_failures(self, tmp_path: Path) -> None:
         """Test copying starter tools handles failures gracefully."""
         # Create selector with non-existent source
@@ -9,7 +9,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from cogito.orchestration.executor import ToolExecutionError, ToolExecutor
-from cogito.processing.renderer import TemplateRenderError
+from cogito.processing.renderer import TemplateRenderer, TemplateRenderError
 from cogito.processing.validator import ParameterValidationError
 
 
@@ -63,6 +63,14 @@ class TestToolExecutorInit:
         assert executor._param_validator is not None
         assert executor._renderer is not None
 
+    def test_init_defaults_are_shared(self) -> None:
+        """Test that executors without explicit components share one instance."""
+        first = ToolExecutor()
+        second = ToolExecutor()
+
+        assert first._renderer is second._renderer
+        assert first._param_validator is second._param_validator
+
     def test_init_with_custom_validator(self) -> None:
         """Test initialization with custom parameter validator."""
         mock_validator = MagicMock()
@@ -245,6 +253,63 @@ class TestToolExecutorExecute:
         assert call_order == ["validator", "renderer"]
 
 
+class TestToolExecutorExecuteBatch:
+    """Tests for ToolExecutor.execute_batch method."""
+
+    def test_execute_batch_preserves_order(self, minimal_tool_spec: dict[str, Any]) -> None:
+        """Test that each parameter set is rendered, in input order."""
+        executor = ToolExecutor()
+        results = executor.execute_batch(
+            minimal_tool_spec, [{"param1": "first"}, None, {"param1": "third"}]
+        )
+
+        assert results == [
+            "Test template: first",
+            "Test template: default_value",
+            "Test template: third",
+        ]
+
+    def test_execute_batch_empty(self, minimal_tool_spec: dict[str, Any]) -> None:
+        """Test that an empty batch renders nothing."""
+        assert ToolExecutor().execute_batch(minimal_tool_spec, []) == []
+
+    def test_execute_batch_compiles_once(self, minimal_tool_spec: dict[str, Any]) -> None:
+        """Test that the template is compiled once for the whole batch."""
+        executor = ToolExecutor(template_renderer=TemplateRenderer())
+        compile_spy = MagicMock(wraps=executor._renderer._compile)
+        executor._renderer._compile = compile_spy  # type: ignore[method-assign]
+
+        executor.execute_batch(minimal_tool_spec, [{"param1": str(i)} for i in range(5)])
+
+        assert compile_spy.call_count == 1
+
+    def test_execute_batch_validation_error_reports_item(
+        self, tool_with_required_params: dict[str, Any]
+    ) -> None:
+        """Test that a failing parameter set stops the batch before rendering."""
+        executor = ToolExecutor()
+        executor._renderer = MagicMock()
+
+        with pytest.raises(ToolExecutionError) as exc_info:
+            executor.execute_batch(tool_with_required_params, [{"value": "ok"}, {}])
+
+        assert exc_info.value.phase == "validation"
+        assert "batch item 1" in str(exc_info.value)
+        executor._renderer.render_many.assert_not_called()
+
+    def test_execute_batch_rendering_error(self, minimal_tool_spec: dict[str, Any]) -> None:
+        """Test that template errors are reported in the rendering phase."""
+        mock_renderer = MagicMock()
+        mock_renderer.render_many.side_effect = TemplateRenderError("Render failed")
+        executor = ToolExecutor(template_renderer=mock_renderer)
+
+        with pytest.raises(ToolExecutionError) as exc_info:
+            executor.execute_batch(minimal_tool_spec, [{}])
+
+        assert exc_info.value.phase == "rendering"
+        assert exc_info.value.tool_name == "test_tool"
+
+
 class TestToolExecutorExecuteByName:
     """Test execute_by_name() method."""
 
@@ -326,6 +391,17 @@ class TestToolExecutionError:
         assert error.tool_name is None
         assert error.phase is None
 
+    def test_error_wrapping_error_includes_cause(self) -> None:
+        """Test that a wrapped error is appended to the message in args and str()."""
+        cause = ParameterValidationError("bad value")
+        error = ToolExecutionError(
+            "Parameter validation failed", tool_name="my_tool", phase="validation", error=cause
+        )
+
+        assert error.error is cause
+        assert error.args == ("Parameter validation failed: bad value",)
+        assert str(error) == "Parameter validation failed: bad value"
+
     def test_error_is_exception_subclass(self) -> None:
         """Test that ToolExecutionError is an Exception."""
         error = ToolExecutionError("Test")
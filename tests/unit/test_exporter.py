@@ -139,6 +139,56 @@ def test_export_to_json_with_file(temp_memory_store: ProcessMemoryStore, tmp_pat
     assert file_content == json_str
 
 
+@pytest.mark.parametrize("pretty", [True, False])
+def test_export_to_json_streamed_to_file(
+    temp_memory_store: ProcessMemoryStore, tmp_path: Path, pretty: bool
+) -> None:
+    """Test streamed JSON export writes the same document and returns nothing."""
+    exporter = ProcessMemoryExporter(temp_memory_store)
+    output_file = tmp_path / "export.json"
+
+    result = exporter.export_to_json(output_path=output_file, pretty=pretty, return_str=False)
+
+    assert result == ""
+    file_content = output_file.read_text(encoding="utf-8")
+    assert json.loads(file_content) == json.loads(exporter.export_to_json(pretty=pretty))
+    assert ("\n" in file_content) is pretty
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_export_to_json_without_orjson(
+    temp_memory_store: ProcessMemoryStore, monkeypatch: pytest.MonkeyPatch, pretty: bool
+) -> None:
+    """Test the standard library fallback produces the same JSON data."""
+    exporter = ProcessMemoryExporter(temp_memory_store)
+    expected = json.loads(exporter.export_to_json(pretty=pretty))
+
+    monkeypatch.setattr("cogito.provisioning.exporter.orjson", None)
+    json_str = exporter.export_to_json(pretty=pretty)
+
+    assert json.loads(json_str) == expected
+    assert ("\n" in json_str) is pretty
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_export_to_json_streamed_without_orjson(
+    temp_memory_store: ProcessMemoryStore,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    pretty: bool,
+) -> None:
+    """Test the standard library fallback writes the same file as orjson."""
+    exporter = ProcessMemoryExporter(temp_memory_store)
+    output_file = tmp_path / "export.json"
+    exporter.export_to_json(output_path=output_file, pretty=pretty, return_str=False)
+    expected = output_file.read_text(encoding="utf-8")
+
+    monkeypatch.setattr("cogito.provisioning.exporter.orjson", None)
+    exporter.export_to_json(output_path=output_file, pretty=pretty, return_str=False)
+
+    assert output_file.read_text(encoding="utf-8") == expected
+
+
 def test_export_to_yaml_basic(temp_memory_store: ProcessMemoryStore) -> None:
     """Test basic YAML export."""
     exporter = ProcessMemoryExporter(temp_memory_store)
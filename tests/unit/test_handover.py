@@ -75,6 +75,9 @@ def test_generate_handover_statistics(temp_memory_store: ProcessMemoryStore) ->
 
     # Verify counts (1 high ≥0.9, 1 medium 0.7-0.9, 1 low <0.7)
     assert "1 entries" in handover or "1 entry" in handover
+    assert "High confidence (≥90%): 1 entries" in handover
+    assert "Medium confidence (70-89%): 1 entries" in handover
+    assert "Low confidence (<70%): 1 entries" in handover
 
 
 def test_generate_handover_recent_entries(temp_memory_store: ProcessMemoryStore) -> None:
@@ -102,6 +105,27 @@ def test_generate_handover_key_concepts(temp_memory_store: ProcessMemoryStore) -
     assert "automation" in handover
 
 
+def test_simple_handover_lists_first_twenty_concepts(tmp_path: Path) -> None:
+    """Test the fallback document lists the 20 alphabetically first concepts."""
+    store = ProcessMemoryStore(tmp_path / "memory.jsonl")
+    store.append_entry({
+        "id": "test-001",
+        "type": "Observation",
+        "title": "Many concepts",
+        "summary": "An entry with many concepts",
+        "related_concepts": [f"concept-{i:02d}" for i in range(30, 0, -1)],
+    })
+    # No handover template here, so the simple fallback is used
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    generator = HandoverGenerator(store, templates_dir=templates_dir)
+
+    handover = generator.generate_handover_document()
+
+    listed = [line[2:] for line in handover.splitlines() if line.startswith("- concept-")]
+    assert listed == [f"concept-{i:02d}" for i in range(1, 21)]
+
+
 def test_generate_handover_with_file(
     temp_memory_store: ProcessMemoryStore, tmp_path: Path
 ) -> None:
@@ -167,6 +191,16 @@ def test_generate_handover_empty_store(tmp_path: Path) -> None:
     assert "0 process memory entries" in handover
 
 
+def test_generators_share_template_environment(
+    temp_memory_store: ProcessMemoryStore,
+) -> None:
+    """Test the Environment is created on first use and shared per directory."""
+    generator = HandoverGenerator(temp_memory_store)
+    assert generator._env is None
+
+    assert generator.env is HandoverGenerator(temp_memory_store).env
+
+
 def test_generate_handover_simple_fallback(temp_memory_store: ProcessMemoryStore) -> None:
     """Test handover generation works with template."""
     # The generator finds the actual template, so this tests template rendering
@@ -239,6 +239,25 @@ def test_import_partial_success(
     assert temp_memory_store.get_entry("test-002") is None
 
 
+def test_import_from_jsonl_reports_invalid_lines(
+    temp_memory_store: ProcessMemoryStore, valid_entry: dict, tmp_path: Path
+) -> None:
+    """Test JSONL validation errors are numbered by entry, skipping blank lines."""
+    importer = ProcessMemoryImporter(temp_memory_store)
+
+    jsonl_file = tmp_path / "import.jsonl"
+    jsonl_file.write_text(
+        json.dumps(valid_entry) + "\n\n" + json.dumps(["not", "a", "dict"]) + "\n",
+        encoding="utf-8",
+    )
+
+    count, errors = importer.import_from_jsonl(jsonl_file, merge=True)
+
+    assert count == 1
+    assert errors == ["Entry 1: Not a dictionary (got list)"]
+    assert temp_memory_store.get_entry("test-001") is not None
+
+
 def test_import_invalid_json(temp_memory_store: ProcessMemoryStore, tmp_path: Path) -> None:
     """Test importing invalid JSON raises error."""
     importer = ProcessMemoryImporter(temp_memory_store)
@@ -262,8 +281,8 @@ def test_import_invalid_jsonl(temp_memory_store: ProcessMemoryStore, tmp_path: P
         f.write('{"id": "test-001", "type": "Test", "title": "Valid", "summary": "Valid"}\n')
         f.write("{ invalid json }\n")
 
-    # Import should raise JSONDecodeError
-    with pytest.raises(json.JSONDecodeError):
+    # Import should raise JSONDecodeError naming the line
+    with pytest.raises(json.JSONDecodeError, match="line 2"):
         importer.import_from_jsonl(jsonl_file, merge=True)
 
 
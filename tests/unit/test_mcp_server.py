@@ -1,11 +1,15 @@
 """Unit tests for MCP server implementation using FastMCP."""
 
 import json
+import subprocess
+import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from fastmcp.client import Client
 
+from cogito.integration import mcp_server
 from cogito.integration.mcp_server import create_server, mcp
 
 
@@ -83,6 +87,16 @@ def temp_memory_file(tmp_path: Path) -> Path:
 class TestMCPServerInit:
     """Test MCP server initialization."""
 
+    def test_package_exports_server_lazily(self) -> None:
+        """Test importing cogito defers loading the MCP server until accessed."""
+        code = (
+            "import sys, cogito\n"
+            "assert 'fastmcp' not in sys.modules\n"
+            "assert cogito.mcp is cogito.integration.mcp\n"
+            "assert 'fastmcp' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_create_server(self, temp_tools_dir: Path) -> None:
         """Test create_server factory function."""
         server = create_server(temp_tools_dir)
@@ -93,6 +107,15 @@ class TestMCPServerInit:
         server = create_server(temp_tools_dir, memory_path=temp_memory_file)
         assert server is not None
 
+    def test_create_server_reuses_template_renderer(self, temp_tools_dir: Path) -> None:
+        """Test that re-initializing the server keeps the same renderer."""
+        create_server(temp_tools_dir)
+        first = mcp_server._get_executor()._renderer
+        create_server(temp_tools_dir)
+        second = mcp_server._get_executor()._renderer
+
+        assert first is second
+
 
 class TestMCPServerToolExecution:
     """Test tool execution functionality."""
@@ -262,6 +285,17 @@ class TestMCPServerGraphQueries:
             assert len(data) == 1
             assert data[0]["id"] == "test-002"
 
+    def test_knowledge_graph_built_on_first_use(
+        self, temp_tools_dir: Path, temp_memory_file: Path
+    ) -> None:
+        """Test create_server defers building the knowledge graph."""
+        create_server(temp_tools_dir, memory_path=temp_memory_file)
+        assert mcp_server._knowledge_graph is None
+
+        graph = mcp_server._get_knowledge_graph()
+        assert graph.get_graph_stats()["total_nodes"] == 2
+        assert mcp_server._get_knowledge_graph() is graph
+
     @pytest.mark.asyncio
     async def test_query_graph_by_concept(
         self, temp_tools_dir: Path, temp_memory_file: Path
@@ -354,6 +388,53 @@ class TestMCPServerPrompts:
             assert prompts is not None
 
 
+    @pytest.mark.asyncio
+    async def test_get_tool_usage_guide_content(self, temp_tools_dir: Path) -> None:
+        """Test usage guide lists metadata and marks required parameters."""
+        create_server(temp_tools_dir)
+
+        async with Client(mcp) as client:
+            result = await client.get_prompt("get_tool_usage_guide", {"tool_name": "test_tool"})
+
+        guide = result.messages[0].content.text
+        assert guide.startswith("# Test Tool\n\nA test tool\n\n**Category:** test\n")
+        assert guide.endswith("- **input** (required): Test input\n")
+
+    @pytest.mark.asyncio
+    async def test_get_tool_usage_guide_refreshes_on_reload(self, temp_tools_dir: Path) -> None:
+        """Test cached usage guide is re-rendered after the tool is reloaded."""
+        create_server(temp_tools_dir)
+        tool_file = temp_tools_dir / "test_tool.yml"
+
+        async with Client(mcp) as client:
+            args = {"tool_name": "test_tool"}
+            first = await client.get_prompt("get_tool_usage_guide", args)
+            assert "A test tool" in first.messages[0].content.text
+
+            tool_file.write_text(
+                tool_file.read_text().replace("A test tool", "An updated tool")
+            )
+            mcp_server._get_registry().reload_tool("test_tool")
+            second = await client.get_prompt("get_tool_usage_guide", args)
+            assert "An updated tool" in second.messages[0].content.text
+
+    @pytest.mark.asyncio
+    async def test_get_process_memory_context_content(
+        self, temp_tools_dir: Path, temp_memory_file: Path
+    ) -> None:
+        """Test memory context prompt includes each matching entry."""
+        create_server(temp_tools_dir, memory_path=temp_memory_file)
+
+        async with Client(mcp) as client:
+            result = await client.get_prompt(
+                "get_process_memory_context", {"concept": "Related"}
+            )
+
+        context = result.messages[0].content.text
+        assert context == (
+            "# Process Memory: Related\n\n## test-002: Related Entry\nA related entry\n\n"
+        )
+
 class TestMCPServerProgressiveDisclosure:
     """Test progressive disclosure resources."""
 
@@ -387,9 +468,73 @@ class TestMCPServerProgressiveDisclosure:
             assert resources is not None
 
 
+    @pytest.mark.asyncio
+    async def test_discover_tool_categories_filters_entries(self, temp_tools_dir: Path) -> None:
+        """Test discovery lists YAML tools only and skips hidden directories."""
+        category_dir = temp_tools_dir / "test_category"
+        category_dir.mkdir()
+        (temp_tools_dir / "test_tool.yml").rename(category_dir / "test_tool.yml")
+        (category_dir / "other.yaml").write_text("metadata: {}\n")
+        (category_dir / "README.md").write_text("docs")
+        (category_dir / "nested.yml").mkdir()
+        (temp_tools_dir / ".hidden").mkdir()
+        (temp_tools_dir / ".hidden" / "secret.yml").write_text("metadata: {}\n")
+
+        create_server(temp_tools_dir)
+
+        async with Client(mcp) as client:
+            result = await client.read_resource("thinking-tools://discover")
+
+        assert json.loads(result[0].text) == {"test_category": ["other", "test_tool"]}
+
 class TestMCPServerTokenTracking:
     """Test token usage tracking."""
 
+    def test_estimate_tokens(self) -> None:
+        """Test input token estimate from parameter keys and values."""
+        assert mcp_server._estimate_tokens({}) == 0
+        assert mcp_server._estimate_tokens({"input": "test value"}) == 3
+        assert mcp_server._estimate_tokens({"depth": 12, "tags": ["a", "b"]}) == 5
+
+    def test_token_tracker_bounded_breakdown(self) -> None:
+        """Test breakdown keeps recent operations while totals cover all."""
+        tracker = mcp_server.SimpleTokenTracker(max_operations=2)
+        for i in range(5):
+            tracker.track("execute_tool", i, 1, f"tool_{i}")
+
+        summary = tracker.summary()
+        assert summary["total_ops"] == 5
+        assert summary["total_tokens"] == 15
+        assert [op["tool"] for op in summary["breakdown"]] == ["tool_3", "tool_4"]
+
+    def test_dumps_matches_stdlib_json(self) -> None:
+        """Test response serializer round-trips and indents like json.dumps."""
+        payload = {"name": "tool", "tags": ["a", "b"], "nested": {"depth": 2}}
+        dumped = mcp_server._dumps(payload)
+        assert json.loads(dumped) == payload
+        assert dumped == json.dumps(payload, indent=2)
+
+    def test_token_tracker_columns(self) -> None:
+        """Test tracker totals and breakdown built from columnar storage."""
+        tracker = mcp_server.SimpleTokenTracker()
+        tracker.track("execute_tool", 3, 7, "tool_a")
+        tracker.track("list_tools", 2, 0)
+
+        summary = tracker.summary()
+        assert summary["total_ops"] == 2
+        assert summary["total_tokens"] == 12
+        assert summary["breakdown"][0] == {
+            "op": "execute_tool",
+            "tool": "tool_a",
+            "in": 3,
+            "out": 7,
+            "total": 10,
+        }
+        assert summary["breakdown"][1]["tool"] is None
+
+        tracker.reset()
+        assert tracker.summary() == {"total_ops": 0, "total_tokens": 0, "breakdown": []}
+
     @pytest.mark.asyncio
     async def test_get_token_usage_stats_initial(self, temp_tools_dir: Path) -> None:
         """Test token usage stats with no operations."""
@@ -442,3 +587,93 @@ class TestMCPServerTokenTracking:
             assert "in" in first_op
             assert "out" in first_op
             assert "total" in first_op
+
+
+class TestMCPServerToolSpecCache:
+    """Test memoized tool spec reads."""
+
+    @pytest.mark.asyncio
+    async def test_get_tool_yaml_spec_rereads_modified_file(self, temp_tools_dir: Path) -> None:
+        """Test that cached spec text is refreshed when the file changes."""
+        category_dir = temp_tools_dir / "test_category"
+        category_dir.mkdir()
+        tool_file = category_dir / "test_tool.yml"
+        (temp_tools_dir / "test_tool.yml").rename(tool_file)
+
+        create_server(temp_tools_dir)
+        uri = "thinking-tools://tool-spec/test_category/test_tool"
+
+        async with Client(mcp) as client:
+            first = await client.read_resource(uri)
+            assert "name: test_tool" in first[0].text
+
+            tool_file.write_text(tool_file.read_text() + "# edited\n")
+            second = await client.read_resource(uri)
+            assert second[0].text.endswith("# edited\n")
+
+    @pytest.mark.asyncio
+    async def test_get_tool_yaml_spec_extension_fallback(self, temp_tools_dir: Path) -> None:
+        """Test .yaml specs are found and missing specs report an error."""
+        category_dir = temp_tools_dir / "test_category"
+        category_dir.mkdir()
+        (temp_tools_dir / "test_tool.yml").rename(category_dir / "test_tool.yaml")
+
+        create_server(temp_tools_dir)
+
+        async with Client(mcp) as client:
+            found = await client.read_resource("thinking-tools://tool-spec/test_category/test_tool")
+            assert "name: test_tool" in found[0].text
+
+            missing = await client.read_resource("thinking-tools://tool-spec/test_category/nope")
+            assert missing[0].text == "Error: Tool 'test_category/nope' not found"
+
+    @pytest.mark.asyncio
+    async def test_discover_tool_categories_refreshes_on_new_tool(
+        self, temp_tools_dir: Path
+    ) -> None:
+        """Test that the cached discovery result is invalidated by new files."""
+        category_dir = temp_tools_dir / "test_category"
+        category_dir.mkdir()
+        (temp_tools_dir / "test_tool.yml").rename(category_dir / "test_tool.yml")
+
+        create_server(temp_tools_dir)
+        # Exercise the mtime fallback used when no watcher is running
+        mcp_server._stop_tools_watcher()
+
+        async with Client(mcp) as client:
+            first = json.loads((await client.read_resource("thinking-tools://discover"))[0].text)
+            assert first == {"test_category": ["test_tool"]}
+
+            (category_dir / "another_tool.yaml").write_text("metadata: {}\n")
+            second = json.loads((await client.read_resource("thinking-tools://discover"))[0].text)
+            assert second == {"test_category": ["another_tool", "test_tool"]}
+
+    @pytest.mark.asyncio
+    async def test_discover_tool_categories_watcher_invalidation(
+        self, temp_tools_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that with a watcher running, only its events refresh discovery."""
+        category_dir = temp_tools_dir / "test_category"
+        category_dir.mkdir()
+        (temp_tools_dir / "test_tool.yml").rename(category_dir / "test_tool.yml")
+
+        create_server(temp_tools_dir)
+        mcp_server._stop_tools_watcher()
+        monkeypatch.setattr(mcp_server, "_tools_observer", object())
+        uri = "thinking-tools://discover"
+
+        async with Client(mcp) as client:
+            first = json.loads((await client.read_resource(uri))[0].text)
+            assert first == {"test_category": ["test_tool"]}
+
+            (category_dir / "another_tool.yaml").write_text("metadata: {}\n")
+            cached = json.loads((await client.read_resource(uri))[0].text)
+            assert cached == first
+
+            handler = mcp_server._DiscoverCacheInvalidator()
+            handler.dispatch(SimpleNamespace(event_type="closed"))
+            assert json.loads((await client.read_resource(uri))[0].text) == first
+
+            handler.dispatch(SimpleNamespace(event_type="created"))
+            second = json.loads((await client.read_resource(uri))[0].text)
+            assert second == {"test_category": ["another_tool", "test_tool"]}
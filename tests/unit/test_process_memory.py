@@ -100,6 +100,23 @@ class TestProcessMemoryStoreAppend:
 
         assert store.get_entry_count() == 3
 
+    def test_append_entries(self, temp_memory_file: Path) -> None:
+        """Test appending a batch writes one line per entry."""
+        store = ProcessMemoryStore(temp_memory_file)
+        store.append_entries([{"id": "test-001", "value": 1}, {"id": "test-002", "value": 2}])
+
+        lines = temp_memory_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["test-001", "test-002"]
+        assert store.get_entry("test-002")["deprecated"] is False
+
+    def test_append_entries_invalid_entry_writes_nothing(self, temp_memory_file: Path) -> None:
+        """Test a batch with an invalid entry leaves the file unchanged."""
+        store = ProcessMemoryStore(temp_memory_file)
+        with pytest.raises(ProcessMemoryError):
+            store.append_entries([{"id": "test-001"}, {"title": "No ID"}])
+
+        assert not temp_memory_file.exists()
+
 
 class TestProcessMemoryStoreDeprecation:
     """Test entry deprecation."""
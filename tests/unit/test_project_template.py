@@ -7,6 +7,7 @@ from cogito.provisioning.project_template import (
     create_project_directories,
     get_canonical_structure,
     get_file_locations,
+    get_template_filenames,
 )
 
 
@@ -160,3 +161,29 @@ class TestGetFileLocations:
         # Minimal should have same or fewer locations
         # (Both have same template files, just different directory structure)
         assert len(minimal_locations) >= 5  # At least core files
+
+
+class TestGetTemplateFilenames:
+    """Tests for get_template_filenames function."""
+
+    def test_maps_template_names_to_files(self, tmp_path: Path) -> None:
+        """Test template names from get_file_locations resolve to template files."""
+        for name in ("README.md.j2", "QUICK-START.md.j2", "__init__.py.j2", "LICENSE.j2"):
+            (tmp_path / name).write_text("", encoding="utf-8")
+
+        filenames = get_template_filenames(tmp_path)
+
+        assert filenames["README_md_j2"] == "README.md.j2"
+        assert filenames["docs_QUICK_START_md_j2"] == "QUICK-START.md.j2"
+        assert filenames["src_cogito___init___py_j2"] == "__init__.py.j2"
+        assert filenames["tests___init___py_j2"] == "__init__.py.j2"
+        assert filenames["LICENSE_j2"] == "LICENSE.j2"
+
+    def test_files_without_templates_are_absent(self, tmp_path: Path) -> None:
+        """Test files with no template in the directory are not mapped."""
+        locations = get_file_locations(tmp_path, get_canonical_structure())
+
+        filenames = get_template_filenames(tmp_path / "missing")
+
+        assert filenames == {}
+        assert "PROJECT-IMPERATIVES_md_j2" in locations
@@ -3,18 +3,23 @@
 Tests auto-discovery, caching, category organization, and hot-reload.
 """
 
+import os
+import threading
+import time
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 import yaml
+from jinja2.sandbox import ImmutableSandboxedEnvironment
 
 from cogito.orchestration.registry import (
     ToolDiscoveryError,
     ToolLoadError,
     ToolRegistry,
 )
+from cogito.processing.renderer import TemplateRenderer
 
 
 @pytest.fixture
@@ -66,7 +71,11 @@ class TestToolRegistryInit:
         assert registry._validator is not None
         assert registry._tools == {}
         assert registry._tool_paths == {}
-        assert registry._categories == {}
+        assert registry.list_categories() == []
+
+    def test_init_shares_schema_validator(self) -> None:
+        """Test that registries reuse one SchemaValidator and its compiled schema."""
+        assert ToolRegistry()._validator is ToolRegistry()._validator
 
     def test_init_with_custom_dirs(self) -> None:
         """Test initialization with custom tool directories."""
@@ -97,7 +106,20 @@ class TestToolRegistryLoadTool:
 
         assert loaded_spec == minimal_tool_spec
         assert registry.get_tool("test_tool") == minimal_tool_spec
-        assert registry._tool_paths["test_tool"] == tool_file
+        assert registry._tool_paths["test_tool"] == str(tool_file)
+
+    def test_load_tool_accepts_str_path(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test load_tool takes plain string paths and get_tool_path returns a Path."""
+        tool_file = temp_tool_dir / "test_tool.yml"
+        with open(tool_file, "w", encoding="utf-8") as f:
+            yaml.dump(minimal_tool_spec, f)
+
+        registry = ToolRegistry(enable_validation=False)
+        registry.load_tool(str(tool_file))
+
+        assert registry.get_tool_path("test_tool") == tool_file
 
     def test_load_tool_updates_category_index(
         self, temp_tool_dir: Path, tool_with_category: dict[str, Any]
@@ -110,8 +132,8 @@ class TestToolRegistryLoadTool:
         registry = ToolRegistry(enable_validation=False)
         registry.load_tool(tool_file)
 
-        assert "metacognition" in registry._categories
-        assert "categorized_tool" in registry._categories["metacognition"]
+        assert "metacognition" in registry.list_categories()
+        assert "categorized_tool" in registry.get_tools_by_category("metacognition")
 
     def test_load_tool_with_missing_metadata(self, temp_tool_dir: Path) -> None:
         """Test loading tool without metadata raises error."""
@@ -193,8 +215,8 @@ class TestToolRegistryLoadTool:
         registry = ToolRegistry(enable_validation=False)
         registry.load_tool(tool_file)
 
-        assert "uncategorized" in registry._categories
-        assert "test_tool" in registry._categories["uncategorized"]
+        assert "uncategorized" in registry.list_categories()
+        assert "test_tool" in registry.get_tools_by_category("uncategorized")
 
 
 class TestToolRegistryDiscoverTools:
@@ -261,6 +283,98 @@ class TestToolRegistryDiscoverTools:
         assert count == 1
         assert "test_tool" in registry.list_tools()
 
+    def test_discover_tools_ignores_non_tool_entries(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test discovery skips non-YAML files and directories named like YAML."""
+        (temp_tool_dir / "folder.yml").mkdir()
+        (temp_tool_dir / "notes.txt").write_text("not a tool")
+
+        with open(temp_tool_dir / "folder.yml" / "tool.yaml", "w", encoding="utf-8") as f:
+            yaml.dump(minimal_tool_spec, f)
+
+        registry = ToolRegistry(tool_dirs=[temp_tool_dir], enable_validation=False)
+        count = registry.discover_tools()
+
+        assert count == 1
+        assert registry.get_tool_path("test_tool") == temp_tool_dir / "folder.yml" / "tool.yaml"
+
+    def test_load_tool_non_ascii_content(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test UTF-8 content is decoded correctly when read as bytes."""
+        spec = minimal_tool_spec.copy()
+        spec["metadata"] = {**spec["metadata"], "description": "Café – naïve ✓"}
+        tool_file = temp_tool_dir / "unicode.yml"
+        with open(tool_file, "w", encoding="utf-8") as f:
+            yaml.dump(spec, f, allow_unicode=True)
+
+        registry = ToolRegistry(enable_validation=False)
+        loaded = registry.load_tool(tool_file)
+
+        assert loaded["metadata"]["description"] == "Café – naïve ✓"
+
+    def test_load_tool_interns_shared_strings(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test repeated keys and short values share one string instance."""
+        for name in ("tool_a", "tool_b"):
+            spec = minimal_tool_spec.copy()
+            spec["metadata"] = {**spec["metadata"], "name": name}
+            with open(temp_tool_dir / f"{name}.yml", "w", encoding="utf-8") as f:
+                yaml.dump(spec, f)
+
+        registry = ToolRegistry(tool_dirs=[temp_tool_dir], enable_validation=False)
+        registry.discover_tools()
+
+        meta_a = registry.get_tool_metadata("tool_a")
+        meta_b = registry.get_tool_metadata("tool_b")
+        assert meta_a["category"] is meta_b["category"]
+        key_a = next(k for k in meta_a if k == "category")
+        key_b = next(k for k in meta_b if k == "category")
+        assert key_a is key_b
+
+    def test_discover_tools_many_files(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test concurrent discovery loads every tool and keeps index order stable."""
+        for i in range(20):
+            spec = minimal_tool_spec.copy()
+            spec["metadata"] = {**spec["metadata"], "name": f"tool_{i:02d}"}
+            with open(temp_tool_dir / f"tool_{i:02d}.yml", "w", encoding="utf-8") as f:
+                yaml.dump(spec, f)
+        (temp_tool_dir / "broken.yml").write_text("invalid: yaml: syntax:")
+
+        registry = ToolRegistry(tool_dirs=[temp_tool_dir], enable_validation=False)
+        count = registry.discover_tools()
+
+        assert count == 20
+        assert registry.version == 20
+        assert sorted(registry.list_tools()) == [f"tool_{i:02d}" for i in range(20)]
+
+    def test_discover_tools_validates_on_calling_thread(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test the shared schema validator is only used by the discovering thread."""
+        for i in range(5):
+            spec = minimal_tool_spec.copy()
+            spec["metadata"] = {**spec["metadata"], "name": f"tool_{i}"}
+            with open(temp_tool_dir / f"tool_{i}.yml", "w", encoding="utf-8") as f:
+                yaml.dump(spec, f)
+
+        registry = ToolRegistry(tool_dirs=[temp_tool_dir])
+        validate = registry._validator.validate_tool_spec
+        threads: set[int] = set()
+
+        def recording_validate(tool_spec: dict[str, Any]) -> dict[str, Any]:
+            threads.add(threading.get_ident())
+            return validate(tool_spec)
+
+        registry._validator = MagicMock(validate_tool_spec=recording_validate)
+
+        assert registry.discover_tools() == 5
+        assert threads == {threading.get_ident()}
+
     def test_discover_tools_skips_invalid_tools(
         self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
     ) -> None:
@@ -356,6 +470,69 @@ class TestToolRegistryGetMethods:
         assert "tool2" in tools
         assert len(tools) == 2
 
+    def test_iter_tools(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test iterating over tool names with their cached specs."""
+        with open(temp_tool_dir / "test.yml", "w", encoding="utf-8") as f:
+            yaml.dump(minimal_tool_spec, f)
+
+        registry = ToolRegistry(tool_dirs=[temp_tool_dir], enable_validation=False)
+        registry.discover_tools()
+
+        items = list(registry.iter_tools())
+        assert len(items) == 1
+        name, spec = items[0]
+        assert name == "test_tool"
+        assert spec is registry.get_tool("test_tool")
+
+    def test_iter_metadata(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test metadata sections are exposed without the full spec."""
+        with open(temp_tool_dir / "test.yml", "w", encoding="utf-8") as f:
+            yaml.dump(minimal_tool_spec, f)
+
+        registry = ToolRegistry(tool_dirs=[temp_tool_dir], enable_validation=False)
+        registry.discover_tools()
+
+        metadata = registry.get_tool("test_tool")["metadata"]
+        assert list(registry.iter_metadata()) == [("test_tool", metadata)]
+        assert registry.get_tool_metadata("test_tool") is metadata
+        assert registry.get_tool_metadata("missing") is None
+
+        registry.clear_cache()
+        assert list(registry.iter_metadata()) == []
+
+    def test_list_tool_metadata(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test metadata projection is cached and refreshed on changes."""
+        tool_file = temp_tool_dir / "test.yml"
+        with open(tool_file, "w", encoding="utf-8") as f:
+            yaml.dump(minimal_tool_spec, f)
+
+        registry = ToolRegistry(tool_dirs=[temp_tool_dir], enable_validation=False)
+        registry.discover_tools()
+        category = minimal_tool_spec["metadata"]["category"]
+
+        metadata = registry.list_tool_metadata()
+        assert [m["name"] for m in metadata] == ["test_tool"]
+        assert registry.list_tool_metadata(category) == metadata
+        assert registry.list_tool_metadata("missing") == []
+        assert registry.list_tool_metadata()[0] is metadata[0]
+
+        version = registry.version
+        updated_spec = minimal_tool_spec.copy()
+        updated_spec["metadata"] = updated_spec["metadata"].copy()
+        updated_spec["metadata"]["description"] = "Updated"
+        with open(tool_file, "w", encoding="utf-8") as f:
+            yaml.dump(updated_spec, f)
+        registry.reload_tool("test_tool")
+
+        assert registry.version > version
+        assert registry.list_tool_metadata()[0]["description"] == "Updated"
+
     def test_list_categories(
         self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
     ) -> None:
@@ -457,6 +634,59 @@ class TestToolRegistryGetMethods:
         assert registry.get_tool_path("does_not_exist") is None
 
 
+    def test_load_tool_precompiles_template(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test that a shared renderer's template cache is warmed at load time."""
+        tool_file = temp_tool_dir / "test.yml"
+        with open(tool_file, "w", encoding="utf-8") as f:
+            yaml.dump(minimal_tool_spec, f)
+
+        renderer = TemplateRenderer()
+        registry = ToolRegistry(enable_validation=False, template_renderer=renderer)
+        registry.load_tool(tool_file)
+
+        assert minimal_tool_spec["template"]["source"] in renderer._template_cache
+
+    def test_load_tool_rejects_uncompilable_template(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test that template syntax errors fail the load when precompiling."""
+        spec = minimal_tool_spec.copy()
+        spec["template"] = {"source": "{% if %}"}
+        tool_file = temp_tool_dir / "broken.yml"
+        with open(tool_file, "w", encoding="utf-8") as f:
+            yaml.dump(spec, f)
+
+        registry = ToolRegistry(enable_validation=False, template_renderer=TemplateRenderer())
+        with pytest.raises(ToolLoadError, match="Template compilation failed"):
+            registry.load_tool(tool_file)
+        assert registry.get_tool("test_tool") is None
+
+    def test_validation_compiles_template_once(
+        self,
+        temp_tool_dir: Path,
+        minimal_tool_spec: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the syntax check and precompile share the registry's renderer."""
+        tool_file = temp_tool_dir / "test.yml"
+        with open(tool_file, "w", encoding="utf-8") as f:
+            yaml.dump(minimal_tool_spec, f)
+
+        compiled = []
+        original = ImmutableSandboxedEnvironment.compile
+
+        def counting_compile(self: Any, source: Any, *args: Any, **kwargs: Any) -> Any:
+            compiled.append(source)
+            return original(self, source, *args, **kwargs)
+
+        monkeypatch.setattr(ImmutableSandboxedEnvironment, "compile", counting_compile)
+        registry = ToolRegistry(template_renderer=TemplateRenderer())
+        registry.load_tool(tool_file)
+
+        assert compiled == [minimal_tool_spec["template"]["source"]]
+
 class TestToolRegistryHotReload:
     """Test hot-reload functionality (PM-004)."""
 
@@ -485,6 +715,67 @@ class TestToolRegistryHotReload:
         assert reloaded["metadata"]["version"] == "2.0.0"
         assert registry.get_tool("test_tool")["metadata"]["version"] == "2.0.0"
 
+    def test_reload_tool_updates_category_index(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test reload moves the tool when its category changes."""
+        tool_file = temp_tool_dir / "test.yml"
+        with open(tool_file, "w", encoding="utf-8") as f:
+            yaml.dump(minimal_tool_spec, f)
+
+        registry = ToolRegistry(enable_validation=False)
+        registry.load_tool(tool_file)
+        old_category = minimal_tool_spec["metadata"].get("category", "uncategorized")
+
+        updated_spec = minimal_tool_spec.copy()
+        updated_spec["metadata"] = updated_spec["metadata"].copy()
+        updated_spec["metadata"]["category"] = "review"
+        with open(tool_file, "w", encoding="utf-8") as f:
+            yaml.dump(updated_spec, f)
+
+        registry.reload_tool("test_tool")
+
+        assert registry.get_tools_by_category("review") == ["test_tool"]
+        assert "test_tool" not in registry.get_tools_by_category(old_category)
+
+    def test_reload_tool_skips_unchanged_file(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test reload returns the cached spec when mtime and size are unchanged."""
+        tool_file = temp_tool_dir / "test.yml"
+        with open(tool_file, "w", encoding="utf-8") as f:
+            yaml.dump(minimal_tool_spec, f)
+        old_time = time.time() - 60
+        os.utime(tool_file, (old_time, old_time))
+
+        registry = ToolRegistry(enable_validation=False)
+        loaded = registry.load_tool(tool_file)
+        version = registry.version
+
+        assert registry.reload_tool("test_tool") is loaded
+        assert registry.version == version
+
+        updated_spec = minimal_tool_spec.copy()
+        updated_spec["metadata"] = {**updated_spec["metadata"], "version": "2.0.0"}
+        with open(tool_file, "w", encoding="utf-8") as f:
+            yaml.dump(updated_spec, f)
+        os.utime(tool_file, (old_time + 1, old_time + 1))
+
+        assert registry.reload_tool("test_tool")["metadata"]["version"] == "2.0.0"
+
+    def test_reload_tool_rereads_recently_modified_file(
+        self, temp_tool_dir: Path, minimal_tool_spec: dict[str, Any]
+    ) -> None:
+        """Test files modified within timestamp granularity are always re-read."""
+        tool_file = temp_tool_dir / "test.yml"
+        with open(tool_file, "w", encoding="utf-8") as f:
+            yaml.dump(minimal_tool_spec, f)
+
+        registry = ToolRegistry(enable_validation=False)
+        loaded = registry.load_tool(tool_file)
+
+        assert registry.reload_tool("test_tool") is not loaded
+
     def test_reload_tool_not_found(self) -> None:
         """Test reloading nonexistent tool raises error."""
         registry = ToolRegistry(enable_validation=False)
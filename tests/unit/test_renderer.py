@@ -5,7 +5,11 @@ Covers basic rendering, parameter substitution, conditionals, loops, error handl
 and security constraints.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import pytest
+from jinja2 import FileSystemBytecodeCache
 from jinja2.exceptions import TemplateSyntaxError
 
 from cogito.processing import TemplateRenderer, TemplateRenderError
@@ -334,6 +338,16 @@ class TestTemplateRendererErrorHandling:
         assert exc_info.value.template_name == "unknown"
 
 
+    def test_mutating_parameters_raises_render_error(self) -> None:
+        """Test templates cannot modify parameter lists in place."""
+        renderer = TemplateRenderer()
+        tool_spec = {"template": {"source": "{{ items.append('x') }}"}}
+        items = ["a"]
+
+        with pytest.raises(TemplateRenderError):
+            renderer.render(tool_spec, {"items": items})
+        assert items == ["a"]
+
 class TestTemplateRendererSyntaxValidation:
     """Test template syntax validation without rendering."""
 
@@ -372,6 +386,16 @@ class TestTemplateRendererSyntaxValidation:
 
         assert result is True
 
+    def test_validated_template_reused_for_render(self) -> None:
+        """Test that a template compiled during validation is not compiled again."""
+        renderer = TemplateRenderer()
+        renderer.validate_template_syntax("Hi {{ name }}")
+        template = renderer._template_cache["Hi {{ name }}"]
+
+        spec = {"template": {"source": "Hi {{ name }}"}}
+        assert renderer.render(spec, {"name": "A"}) == "Hi A"
+        assert renderer._template_cache["Hi {{ name }}"] is template
+
 
 class TestTemplateRendererCustomFilters:
     """Test custom filters for thinking tools."""
@@ -579,3 +603,146 @@ class TestTemplateRendererCustomFilters:
         result = renderer.render(tool_spec, params)
 
         assert result == "    first - second - third"
+
+
+class TestTemplateRendererTemplateCache:
+    """Test in-memory reuse of compiled templates."""
+
+    def test_compiled_template_reused_for_same_source(self) -> None:
+        """Test that rendering the same source twice compiles it once."""
+        renderer = TemplateRenderer()
+        spec = {"metadata": {"name": "cached"}, "template": {"source": "Hi {{ name }}"}}
+
+        assert renderer.render(spec, {"name": "A"}) == "Hi A"
+        template = renderer._template_cache["Hi {{ name }}"]
+        assert renderer.render(spec, {"name": "B"}) == "Hi B"
+        assert renderer._template_cache["Hi {{ name }}"] is template
+
+    def test_template_cache_evicts_least_recently_used(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the cache is bounded and evicts the oldest template."""
+        monkeypatch.setattr(TemplateRenderer, "TEMPLATE_CACHE_SIZE", 2)
+        # Disable output memoization so every render goes through the template cache
+        monkeypatch.setattr(TemplateRenderer, "RENDER_CACHE_SIZE", 0)
+        renderer = TemplateRenderer()
+
+        for source in ("a", "b", "a", "c"):
+            renderer.render({"template": {"source": source}})
+
+        assert list(renderer._template_cache) == ["a", "c"]
+
+    def test_template_cache_shared_between_threads(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test concurrent renders at cache capacity neither fail nor overfill it."""
+        monkeypatch.setattr(TemplateRenderer, "TEMPLATE_CACHE_SIZE", 4)
+        monkeypatch.setattr(TemplateRenderer, "RENDER_CACHE_SIZE", 0)
+        renderer = TemplateRenderer()
+        specs = [{"template": {"source": f"{i} {{{{ n }}}}"}} for i in range(16)]
+
+        def render_all(offset: int) -> list[str]:
+            return [
+                renderer.render(specs[(offset + i) % len(specs)], {"n": i}) for i in range(200)
+            ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(render_all, range(8)))
+
+        assert results[0][1] == "1 1"
+        assert len(renderer._template_cache) == 4
+
+
+class TestTemplateRendererRenderCache:
+    """Test memoization of rendered outputs."""
+
+    def test_identical_render_reuses_output(self) -> None:
+        """Test that the same source and parameters render once."""
+        renderer = TemplateRenderer()
+        spec = {"metadata": {"name": "memo"}, "template": {"source": "Hi {{ name }}"}}
+
+        first = renderer.render(spec, {"name": "A"})
+        renderer._template_cache.clear()
+
+        assert renderer.render(spec, {"name": "A"}) is first
+        assert renderer._template_cache == {}
+        assert renderer.render(spec, {"name": "B"}) == "Hi B"
+
+    def test_equal_values_of_different_types_render_separately(self) -> None:
+        """Test that True and 1 are not treated as the same parameter value."""
+        renderer = TemplateRenderer()
+        spec = {"template": {"source": "{{ flag }}"}}
+
+        assert renderer.render(spec, {"flag": 1}) == "1"
+        assert renderer.render(spec, {"flag": True}) == "True"
+
+    def test_non_scalar_parameters_not_memoized(self) -> None:
+        """Test that renders with container parameters are not cached."""
+        renderer = TemplateRenderer()
+        spec = {"template": {"source": "{{ items | join(',') }}"}}
+
+        assert renderer.render(spec, {"items": ["a", "b"]}) == "a,b"
+        assert renderer._render_cache == {}
+
+    def test_random_templates_not_memoized(self) -> None:
+        """Test that templates using the random filter are rendered every time."""
+        renderer = TemplateRenderer()
+        renderer.render({"template": {"source": "{{ 'ab' | random }}"}})
+
+        assert renderer._render_cache == {}
+
+    def test_render_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the oldest output is evicted once the cache is full."""
+        monkeypatch.setattr(TemplateRenderer, "RENDER_CACHE_SIZE", 2)
+        renderer = TemplateRenderer()
+        spec = {"template": {"source": "{{ n }}"}}
+
+        for n in (1, 2, 3):
+            renderer.render(spec, {"n": n})
+
+        assert len(renderer._render_cache) == 2
+
+    def test_render_cache_shared_between_threads(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test concurrent memoized renders at capacity return correct output."""
+        monkeypatch.setattr(TemplateRenderer, "RENDER_CACHE_SIZE", 4)
+        renderer = TemplateRenderer()
+        spec = {"template": {"source": "{{ n }}"}}
+
+        def render_all(offset: int) -> list[str]:
+            return [renderer.render(spec, {"n": (offset + i) % 16}) for i in range(200)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(render_all, range(8)))
+
+        assert results[3][:3] == ["3", "4", "5"]
+        assert len(renderer._render_cache) == 4
+
+
+class TestTemplateRendererBytecodeCache:
+    """Test rendering through a Jinja2 bytecode cache."""
+
+    def test_bytecode_cache_is_populated_and_reused(self, tmp_path: Path) -> None:
+        """Test that compiled code is stored and reused by a fresh renderer."""
+        tool_spec = {
+            "metadata": {"name": "cached"},
+            "template": {"source": "Hello {{ name }}!"},
+        }
+
+        first = TemplateRenderer(bytecode_cache=FileSystemBytecodeCache(str(tmp_path)))
+        assert first.render(tool_spec, {"name": "Alice"}) == "Hello Alice!"
+        assert len(list(tmp_path.iterdir())) == 1
+
+        second = TemplateRenderer(bytecode_cache=FileSystemBytecodeCache(str(tmp_path)))
+        assert second.render(tool_spec, {"name": "Bob"}) == "Hello Bob!"
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_bytecode_cache_recompiles_changed_source(self, tmp_path: Path) -> None:
+        """Test that a changed template source is not served stale code."""
+        renderer = TemplateRenderer(bytecode_cache=FileSystemBytecodeCache(str(tmp_path)))
+        spec = {"metadata": {"name": "cached"}, "template": {"source": "v1 {{ x }}"}}
+        assert renderer.render(spec, {"x": 1}) == "v1 1"
+
+        spec["template"]["source"] = "v2 {{ x }}"
+        assert renderer.render(spec, {"x": 1}) == "v2 1"
@@ -3,6 +3,7 @@
 from pathlib import Path
 
 import pytest
+from jinja2 import TemplateError
 
 from cogito.provisioning.skill_generator import SkillGenerator
 
@@ -227,3 +228,24 @@ class TestSkillGenerator:
 
         # Check exec
         assert 'exec "$COGITO_BIN" execute "$TOOL_NAME" "$@"' in wrapper
+
+    def test_missing_templates_use_fallback(self, tmp_path: Path) -> None:
+        """Test templates missing from the templates directory fall back to built-ins."""
+        generator = SkillGenerator(templates_dir=tmp_path)
+
+        wrapper = generator.generate_bash_wrapper("think_aloud")
+        skill_md = generator.generate_skill_md(
+            {"metadata": {"name": "think_aloud", "display_name": "Think Aloud"}},
+            Path("examples/think_aloud.yml"),
+        )
+
+        assert 'TOOL_NAME="think_aloud"' in wrapper
+        assert skill_md.startswith("---\nname: think-aloud\n")
+
+    def test_template_errors_propagate(self, tmp_path: Path) -> None:
+        """Test a broken template raises instead of silently using the fallback."""
+        (tmp_path / "execute.sh.j2").write_text("{{ tool_name | no_such_filter }}")
+        generator = SkillGenerator(templates_dir=tmp_path)
+
+        with pytest.raises(TemplateError, match="no_such_filter"):
+            generator.generate_bash_wrapper("think_aloud")
@@ -63,6 +63,13 @@ def mock_registry() -> ToolRegistry:
 
     registry.get_tool = MagicMock(side_effect=lambda name: tool_specs.get(name))
     registry.list_tools = MagicMock(return_value=list(tool_specs.keys()))
+    registry.get_tools_by_category = MagicMock(
+        side_effect=lambda category: [
+            name
+            for name, spec in tool_specs.items()
+            if spec["metadata"]["category"] == category
+        ]
+    )
 
     return registry
 
@@ -1,14 +1,21 @@
 """Unit tests for parameter and tool spec validation."""
 
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
 import pytest
 
+import cogito
 from cogito.processing.validator import (
     ParameterValidationError,
     ParameterValidator,
     SchemaValidator,
     ToolSpecValidationError,
+    get_default_parameter_validator,
 )
 
 
@@ -54,6 +61,29 @@ class TestParameterValidatorBasics:
 
         assert result == {"name": "Alice"}
 
+    def test_validate_json_parameters(self) -> None:
+        """Test parameters given as a JSON document are parsed before validation."""
+        validator = ParameterValidator()
+        tool_spec = {
+            "parameters": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}, "depth": {"type": "integer"}},
+            }
+        }
+
+        assert validator.validate_parameters(tool_spec, '{"name": "Alice"}') == {"name": "Alice"}
+        assert validator.validate_parameters(tool_spec, b'{"depth": 2}') == {"depth": 2}
+
+    def test_validate_invalid_json_parameters(self) -> None:
+        """Test malformed or non-object JSON parameters are rejected."""
+        validator = ParameterValidator()
+        tool_spec = {"parameters": {"type": "object", "properties": {}}}
+
+        with pytest.raises(ParameterValidationError, match="not valid JSON"):
+            validator.validate_parameters(tool_spec, "{name")
+        with pytest.raises(ParameterValidationError, match="JSON object"):
+            validator.validate_parameters(tool_spec, "[1, 2]")
+
     def test_validate_missing_required_parameter(self) -> None:
         """Test validation fails on missing required parameter."""
         validator = ParameterValidator()
@@ -106,6 +136,19 @@ class TestParameterValidatorDefaults:
 
         assert result == {"name": "guest"}
 
+    def test_defaults_extracted_once_per_schema(self) -> None:
+        """Test that defaults are cached per schema and inputs stay untouched."""
+        validator = ParameterValidator()
+        schema = {
+            "type": "object",
+            "properties": {"depth": {"type": "string", "default": "standard"}},
+        }
+        params = {"topic": "x"}
+
+        assert validator.apply_defaults(schema, params) == {"topic": "x", "depth": "standard"}
+        assert params == {"topic": "x"}
+        assert validator._get_defaults(schema) is validator._get_defaults(schema)
+
     def test_apply_default_integer(self) -> None:
         """Test applying default integer value."""
         validator = ParameterValidator()
@@ -201,6 +244,20 @@ class TestParameterValidatorDefaults:
 
         assert result == {}
 
+    def test_no_defaults_copy_flag(self) -> None:
+        """Test that copy=False skips the copy only when there are no defaults."""
+        validator = ParameterValidator()
+        plain = {"type": "object", "properties": {"topic": {"type": "string"}}}
+        with_default = {
+            "type": "object",
+            "properties": {"topic": {"type": "string", "default": "x"}},
+        }
+        params = {"topic": "y"}
+
+        assert validator.apply_defaults(plain, params) is not params
+        assert validator.apply_defaults(plain, params, copy=False) is params
+        assert validator.apply_defaults(with_default, params, copy=False) is not params
+
 
 class TestParameterValidatorEnums:
     """Test enum validation."""
@@ -262,6 +319,90 @@ class TestParameterValidatorEnums:
         assert result == {"depth": "standard"}
 
 
+class TestParameterValidatorCache:
+    """Test reuse of compiled parameter schemas."""
+
+    def test_schema_compiled_once(self) -> None:
+        """Test that repeated validation against one schema reuses its validator."""
+        validator = ParameterValidator()
+        tool_spec = {
+            "parameters": {"type": "object", "properties": {"name": {"type": "string"}}}
+        }
+
+        for name in ("a", "b", "c"):
+            assert validator.validate_parameters(tool_spec, {"name": name}) == {"name": name}
+
+        compiled = validator._get_validator(tool_spec["parameters"])
+        assert len(validator._validators) == 1
+        assert validator._get_validator(tool_spec["parameters"]) is compiled
+
+    def test_draft7_unless_schema_declared(self) -> None:
+        """Test schemas validate as Draft 7 unless they declare another draft."""
+        validator = ParameterValidator()
+        plain = {"type": "object"}
+        declared = {"$schema": "https://json-schema.org/draft/2020-12/schema", "type": "object"}
+
+        assert type(validator._get_validator(plain)).__name__ == "Draft7Validator"
+        assert type(validator._get_validator(declared)).__name__ == "Draft202012Validator"
+
+    def test_equal_schema_objects_not_confused(self) -> None:
+        """Test that a different schema object is compiled on its own."""
+        validator = ParameterValidator()
+        loose = {"parameters": {"type": "object", "properties": {"n": {"type": "string"}}}}
+        strict = {"parameters": {"type": "object", "properties": {"n": {"type": "integer"}}}}
+
+        validator.validate_parameters(loose, {"n": "x"})
+        with pytest.raises(ParameterValidationError):
+            validator.validate_parameters(strict, {"n": "x"})
+
+    def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the least recently used schema is evicted."""
+        monkeypatch.setattr(ParameterValidator, "VALIDATOR_CACHE_SIZE", 2)
+        validator = ParameterValidator()
+        specs = [{"parameters": {"type": "object"}} for _ in range(3)]
+
+        for spec in specs:
+            validator.validate_parameters(spec, {})
+
+        assert len(validator._validators) == 2
+
+    def test_caches_shared_between_threads(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test concurrent validation at cache capacity neither fails nor overfills it."""
+        monkeypatch.setattr(ParameterValidator, "VALIDATOR_CACHE_SIZE", 4)
+        validator = ParameterValidator()
+        specs = [
+            {
+                "parameters": {
+                    "type": "object",
+                    "properties": {"n": {"type": "integer", "default": i}},
+                }
+            }
+            for i in range(16)
+        ]
+
+        def validate_all(offset: int) -> list[dict[str, Any]]:
+            return [
+                validator.validate_parameters(specs[(offset + i) % len(specs)], {})
+                for i in range(200)
+            ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(validate_all, range(8)))
+
+        assert results[0][1] == {"n": 1}
+        assert len(validator._validators) == 4
+        assert len(validator._defaults) == 4
+
+    def test_default_validator_shared_between_threads(self) -> None:
+        """Test that every thread gets the same process-wide validator."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            validators = set(
+                map(id, executor.map(lambda _: get_default_parameter_validator(), range(32)))
+            )
+
+        assert validators == {id(get_default_parameter_validator())}
+
+
 class TestSchemaValidatorBasics:
     """Test basic schema validator functionality."""
 
@@ -296,6 +437,98 @@ class TestSchemaValidatorBasics:
         assert result["valid"] is True
 
 
+    def test_validate_schema_with_tool_schema(self) -> None:
+        """Test schema layer reuses one compiled validator across specs."""
+        tool_schema = {"type": "object", "required": ["metadata"]}
+        validator = SchemaValidator(tool_schema=tool_schema)
+
+        assert validator.validate_schema({"metadata": {}}) == []
+        compiled = validator._tool_schema_validator
+        errors = validator.validate_schema({})
+
+        assert errors == ["Schema validation failed: 'metadata' is a required property"]
+        assert validator._tool_schema_validator is compiled
+
+    def test_validate_schema_collects_errors_up_to_cap(self) -> None:
+        """Test schema layer reports several errors, most relevant first, capped."""
+        tool_schema = {
+            "type": "object",
+            "required": ["metadata", "template"],
+            "properties": {"version": {"type": "string"}},
+        }
+        validator = SchemaValidator(tool_schema=tool_schema)
+
+        errors = validator.validate_schema({"version": 1})
+
+        assert len(errors) == 3
+        assert "'metadata' is a required property" in errors[0]
+        assert any("'template' is a required property" in e for e in errors)
+        assert any("is not of type 'string'" in e for e in errors)
+
+        validator.MAX_SCHEMA_ERRORS = 1
+        assert len(validator.validate_schema({"version": 1})) == 1
+
+    def test_validate_schema_reports_invalid_tool_schema(self) -> None:
+        """Test an invalid tool schema is reported as a schema error."""
+        validator = SchemaValidator(tool_schema={"type": "not-a-type"})
+
+        errors = validator.validate_schema({})
+
+        assert len(errors) == 1
+        assert errors[0].startswith("Invalid tool schema:")
+
+class TestSchemaValidatorResultCache:
+    """Test reuse of validation results for identical specs."""
+
+    def test_identical_spec_validated_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an equal spec returns the cached result without revalidating."""
+        validator = SchemaValidator()
+        spec = {"metadata": {"name": "t"}, "template": {"source": "{{ x }}"}}
+        calls = []
+        original = validator.validate_schema
+
+        def counting_schema(tool_spec: dict[str, Any]) -> list[str]:
+            calls.append(tool_spec)
+            return original(tool_spec)
+
+        monkeypatch.setattr(validator, "validate_schema", counting_schema)
+
+        first = validator.validate_tool_spec(spec)
+        second = validator.validate_tool_spec(
+            {"template": {"source": "{{ x }}"}, "metadata": {"name": "t"}}
+        )
+
+        assert first == second
+        assert first is not second
+        assert len(calls) == 1
+
+    def test_changed_spec_revalidated(self) -> None:
+        """Test that a spec with different content is validated again."""
+        validator = SchemaValidator()
+
+        validator.validate_tool_spec({"template": {"source": "ok"}})
+        with pytest.raises(ToolSpecValidationError):
+            validator.validate_tool_spec({"template": {"source": "{% if %}"}})
+
+    def test_result_cache_shared_between_threads(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test concurrent validation at cache capacity neither fails nor overfills it."""
+        monkeypatch.setattr(SchemaValidator, "RESULT_CACHE_SIZE", 4)
+        validator = SchemaValidator()
+        specs = [{"template": {"source": f"{i} {{{{ x }}}}"}} for i in range(16)]
+
+        def validate_all(offset: int) -> list[bool]:
+            return [
+                validator.validate_tool_spec(specs[(offset + i) % len(specs)])["valid"]
+                for i in range(200)
+            ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(validate_all, range(8)))
+
+        assert all(all(valid) for valid in results)
+        assert len(validator._result_cache) == 4
+
+
 class TestSchemaValidatorSemantics:
     """Test semantic validation layer."""
 
@@ -572,3 +805,18 @@ class TestParameterValidatorIntegration:
 
         with pytest.raises(ParameterValidationError):
             validator.validate_parameters(tool_spec, params)
+
+
+def test_jsonschema_imported_on_first_use() -> None:
+    """Test importing the validator module does not import jsonschema."""
+    code = (
+        "import sys\n"
+        "import cogito.processing.validator as v\n"
+        "assert 'jsonschema' not in sys.modules\n"
+        "v.ParameterValidator().validate_parameters({'parameters': {'type': 'object'}}, {})\n"
+        "assert 'jsonschema' in sys.modules\n"
+    )
+    src_dir = str(Path(cogito.__file__).parents[1])
+    python_path = os.pathsep.join([src_dir, os.environ.get("PYTHONPATH", "")])
+    env = {**os.environ, "PYTHONPATH": python_path}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)